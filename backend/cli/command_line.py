@@ -0,0 +1,325 @@
+import argparse
+import csv
+import getpass
+import os
+import sys
+import time
+from itertools import islice
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+from cassandra import ConsistencyLevel
+from cassandra.cluster import PreparedStatement
+from constants.common import (CLI_MASTER_PASSWORD_ENV,
+                              CLI_PROGRAM_NAME,
+                              EXPORT_BATCH_SIZE,
+                              EXPORT_PARALLELISM,
+                              EXPORT_PAGE_SIZE,
+                              IMPORT_CONCURRENCY,
+                              IMPORT_PROCESSES,
+                              IMPORT_MAX_ROWS_PER_SECOND,
+                              QUERY_TIMEOUT,
+                              QUERY_CONSISTENCY_LEVEL,
+                              ErrorTitles,
+                              ExportTypes)
+from constants.cluster_factory import build_cluster
+from constants.connection_model import Connection
+from constants.connection_profile_model import ConnectionProfileModel
+from constants.file_utils import count_lines, iter_json_array_objects, iter_ndjson_objects
+from constants.import_result_model import ImportResultModel
+from constants.latency_stats import LatencyStats
+from constants.progress_model import ProgressModel
+from constants.progress_tracker import ProgressTracker
+from constants.query_utils import split_queries
+from constants.row_converter import RowConverter
+from backend.connection_profiles.connection_profiles_store import ConnectionProfilesStore
+from backend.connection_profiles.master_password_manager import MasterPasswordManager
+from backend.table_window.table_schema import TableSchema
+from backend.table_window.token_range_scanner import TokenRangeScanner
+from backend.table_window.export_engine import ExportEngine
+from backend.table_window.import_engine import ImportEngine
+from backend.table_window.parallel_import_engine import ParallelImportEngine
+from backend.table_window.partition_batch_writer import PartitionBatchWriter
+from backend.table_window.write_throttle import WriteThrottle
+from backend.table_window.import_retry_policy import ImportRetryPolicy
+from backend.table_window.dead_letter_writer import DeadLetterWriter, get_dead_letter_path, remove_error_field
+
+FILE_FORMATS = {
+    "csv": ExportTypes.CSV,
+    "json": ExportTypes.JOSN,
+    "ndjson": ExportTypes.NDJSON
+}
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog=CLI_PROGRAM_NAME, description="Cassandra Tool without the graphical interface.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    connection_parser = argparse.ArgumentParser(add_help=False)
+    connection_parser.add_argument("-p", "--profile", required=True, help="Name of a saved connection profile.")
+    connection_parser.add_argument("-q", "--quiet", action="store_true", help="Do not print progress.")
+
+    table_parser = argparse.ArgumentParser(add_help=False)
+    table_parser.add_argument("-k", "--keyspace", required=True)
+    table_parser.add_argument("-t", "--table", required=True)
+
+    export_parser = subparsers.add_parser("export", parents=[connection_parser, table_parser], help="Export a table to a file.")
+    export_parser.add_argument("-o", "--output", required=True, help="Output file.")
+    export_parser.add_argument("-f", "--format", choices=FILE_FORMATS, help="Defaults to the output file extension.")
+    export_parser.add_argument("--parallelism", type=int, default=EXPORT_PARALLELISM)
+    export_parser.add_argument("--page-size", type=int, default=EXPORT_PAGE_SIZE)
+
+    import_parser = subparsers.add_parser("import", parents=[connection_parser, table_parser], help="Import a file into a table.")
+    import_parser.add_argument("-i", "--input", required=True, help="Input file.")
+    import_parser.add_argument("-f", "--format", choices=FILE_FORMATS, help="Defaults to the input file extension.")
+    import_parser.add_argument("--processes", type=int, default=IMPORT_PROCESSES, help="Worker processes (CSV only).")
+    import_parser.add_argument("--concurrency", type=int, default=IMPORT_CONCURRENCY)
+    import_parser.add_argument("--max-rows-per-second", type=float, default=IMPORT_MAX_ROWS_PER_SECOND,
+                               help="0 means unlimited.")
+    import_parser.add_argument("--dead-letter", help="File for rejected rows. Defaults to <input>.rejected.<ext>.")
+
+    exec_parser = subparsers.add_parser("exec", parents=[connection_parser], help="Execute CQL statements.")
+    exec_parser.add_argument("query", nargs="?", help="CQL statements separated by ';'. Read from stdin when omitted.")
+    exec_parser.add_argument("-k", "--keyspace")
+    exec_parser.add_argument("--file", help="Read the CQL statements from a file.")
+    exec_parser.add_argument("--consistency", choices=sorted(ConsistencyLevel.name_to_value), default=QUERY_CONSISTENCY_LEVEL)
+    exec_parser.add_argument("--timeout", type=float, default=QUERY_TIMEOUT)
+    exec_parser.add_argument("--page-size", type=int, help="Defaults to the fetch size of the connection profile.")
+
+    count_parser = subparsers.add_parser("count", parents=[connection_parser, table_parser], help="Count the rows of a table.")
+    count_parser.add_argument("--parallelism", type=int, default=EXPORT_PARALLELISM)
+    count_parser.add_argument("--page-size", type=int, default=EXPORT_PAGE_SIZE)
+
+    return parser
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = create_parser().parse_args(argv)
+    sys.exit(CommandLine(args).run())
+
+
+class CommandLine:
+    def __init__(self: 'CommandLine', args: argparse.Namespace) -> None:
+        self.args = args
+        self.connection: Optional[Connection] = None
+        self.latency_stats = LatencyStats()
+        self.start_time = time.monotonic()
+
+
+    def run(self: 'CommandLine') -> int:
+        try:
+            connection_profile = self.load_connection_profile()
+            self.start_time = time.monotonic()
+            self.connection = Connection(build_cluster(connection_profile),
+                                         connection_profile.connection_name,
+                                         connection_profile=connection_profile)
+            match self.args.command:
+                case "export":
+                    rows_count, error_count = self.export()
+                case "import":
+                    rows_count, error_count = self.import_data(connection_profile)
+                case "exec":
+                    rows_count, error_count = self.execute()
+                case "count":
+                    rows_count, error_count = self.count()
+        except KeyboardInterrupt:
+            self.print_error("Cancelled.")
+            return 130
+        except Exception as error_message:
+            self.print_error(f"{ErrorTitles.Error.value}: {error_message}")
+            return 1
+        finally:
+            if self.connection is not None:
+                self.connection.close()
+
+        self.print_summary(rows_count, error_count)
+        return 1 if error_count else 0
+
+    def load_connection_profile(self: 'CommandLine') -> ConnectionProfileModel:
+        connection_profiles_store = ConnectionProfilesStore()
+        if message := connection_profiles_store.create_connection_profiles_table():
+            raise Exception(f"Connection profiles database: {message}")
+        connection_profile = connection_profiles_store.get_connection_profile(self.args.profile)
+        if connection_profile is None:
+            connection_names = ", ".join(connection_profiles_store.get_connection_names()) or "none"
+            raise Exception(f"Connection profile '{self.args.profile}' not found. Saved profiles: {connection_names}.")
+
+        master_password_manager = MasterPasswordManager()
+        if master_password_manager.is_master_password_created():
+            password = os.environ.get(CLI_MASTER_PASSWORD_ENV) or getpass.getpass("Master password: ")
+            if not master_password_manager.authenticate(password):
+                raise Exception("Authentication failed.")
+            connection_profile.password = master_password_manager.decrypt_aes_256(connection_profile.password)
+        else:
+            connection_profile.password = connection_profile.password.decode('utf-8')
+        return connection_profile
+
+    def load_schema(self: 'CommandLine') -> TableSchema:
+        return TableSchema.load(self.connection.cluster, self.connection.get_session(), self.args.keyspace, self.args.table)
+
+    def get_file_format(self: 'CommandLine', file_path: str) -> ExportTypes:
+        file_format = self.args.format or os.path.splitext(file_path)[1].lstrip(".").lower()
+        if file_format not in FILE_FORMATS:
+            raise Exception(f"Unknown file format of '{file_path}', use --format {{{','.join(FILE_FORMATS)}}}.")
+        return FILE_FORMATS[file_format]
+
+    def export(self: 'CommandLine') -> Tuple[int, int]:
+        export_type = self.get_file_format(self.args.output)
+        scanner = TokenRangeScanner(self.connection.cluster,
+                                    self.connection.get_session(),
+                                    self.load_schema(),
+                                    parallelism=self.args.parallelism,
+                                    page_size=self.args.page_size,
+                                    is_json=export_type != ExportTypes.CSV,
+                                    latency_stats=self.latency_stats)
+        export_engine = ExportEngine(scanner.columns)
+        match export_type:
+            case ExportTypes.JOSN:
+                export_rows = export_engine.export_to_json
+            case ExportTypes.NDJSON:
+                export_rows = export_engine.export_to_ndjson
+            case _:
+                export_rows = export_engine.export_to_csv
+        result = export_rows(self.args.output, scanner.iter_rows(), None, self.show_progress)
+        self.print_errors(scanner.error_messages)
+        return (result.exported_rows_count, len(scanner.error_messages))
+
+    def import_data(self: 'CommandLine', connection_profile: ConnectionProfileModel) -> Tuple[int, int]:
+        import_type = self.get_file_format(self.args.input)
+        is_ndjson = import_type != ExportTypes.CSV
+        dead_letter_path = self.args.dead_letter or get_dead_letter_path(self.args.input, is_ndjson)
+        schema = self.load_schema()
+        if is_ndjson:
+            result = self.import_json_file(schema, import_type, dead_letter_path)
+        elif self.args.processes > 1:
+            result = self.import_csv_file_parallel(schema, connection_profile, dead_letter_path)
+        else:
+            result = self.import_csv_file(schema, dead_letter_path)
+
+        self.print_errors(result.error_messages)
+        if result.error_count > len(result.error_messages):
+            self.print_error(f"{result.error_count - len(result.error_messages)} more errors not shown.")
+        if result.dead_letter_path:
+            self.print_error(f"{result.dead_letter_rows_count} failed rows written to: {result.dead_letter_path}")
+        return (result.added_rows_count, result.error_count)
+
+    def create_import_engine(self: 'CommandLine',
+                             query: PreparedStatement,
+                             convert_row: Callable[[Any], List[Any]],
+                             dead_letter_writer: DeadLetterWriter,
+                             batch_writer: Optional[PartitionBatchWriter] = None) -> ImportEngine:
+        return ImportEngine(self.connection.get_session(),
+                            query,
+                            convert_row,
+                            self.args.concurrency,
+                            batch_writer=batch_writer,
+                            write_throttle=WriteThrottle(self.args.max_rows_per_second,
+                                                         self.args.concurrency,
+                                                         latency_stats=self.latency_stats),
+                            retry_policy=ImportRetryPolicy(),
+                            dead_letter_writer=dead_letter_writer)
+
+    def import_csv_file(self: 'CommandLine', schema: TableSchema, dead_letter_path: str) -> ImportResultModel:
+        total_rows = max(count_lines(self.args.input) - 1, 0)
+        with open(self.args.input, newline='', encoding='utf-8') as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, [])
+            convert_row = RowConverter(schema.columns).compile_row(header)
+            query = self.connection.get_session().prepare(schema.get_insert_query(header))
+            with DeadLetterWriter(dead_letter_path, header) as dead_letter_writer:
+                import_engine = self.create_import_engine(query,
+                                                          convert_row,
+                                                          dead_letter_writer,
+                                                          PartitionBatchWriter(query))
+                return import_engine.run(reader, total_rows, self.show_progress)
+
+    def import_csv_file_parallel(self: 'CommandLine',
+                                 schema: TableSchema,
+                                 connection_profile: ConnectionProfileModel,
+                                 dead_letter_path: str) -> ImportResultModel:
+        with open(self.args.input, newline='', encoding='utf-8') as csvfile:
+            header = next(csv.reader(csvfile), [])
+        # NOTE fails on unknown columns before the worker processes are started.
+        RowConverter(schema.columns).compile_row(header)
+        import_engine = ParallelImportEngine(connection_profile,
+                                             schema.key_space,
+                                             schema.table,
+                                             self.args.processes,
+                                             self.args.max_rows_per_second)
+        return import_engine.run_csv(self.args.input,
+                                     schema.get_insert_query(header),
+                                     dead_letter_path,
+                                     max(count_lines(self.args.input) - 1, 0),
+                                     self.show_progress)
+
+    def import_json_file(self: 'CommandLine', schema: TableSchema, import_type: ExportTypes, dead_letter_path: str) -> ImportResultModel:
+        is_ndjson = import_type == ExportTypes.NDJSON
+        total_rows = count_lines(self.args.input) if is_ndjson else None
+        query = self.connection.get_session().prepare(schema.get_insert_json_query())
+        with open(self.args.input, encoding='utf-8') as jsonfile, DeadLetterWriter(dead_letter_path) as dead_letter_writer:
+            rows = iter_ndjson_objects(jsonfile) if is_ndjson else iter_json_array_objects(jsonfile)
+            import_engine = self.create_import_engine(query, lambda row: [remove_error_field(row)], dead_letter_writer)
+            return import_engine.run(rows, total_rows, self.show_progress)
+
+    def read_queries(self: 'CommandLine') -> List[str]:
+        if self.args.file:
+            with open(self.args.file, encoding='utf-8') as file:
+                return split_queries(file.read())
+        return split_queries(self.args.query if self.args.query is not None else sys.stdin.read())
+
+    def execute(self: 'CommandLine') -> Tuple[int, int]:
+        rows_count, error_count = 0, 0
+        writer = csv.writer(sys.stdout)
+        for query in self.read_queries():
+            session, statement = self.connection.create_statement(query,
+                                                                  self.args.keyspace,
+                                                                  ConsistencyLevel.name_to_value[self.args.consistency],
+                                                                  self.args.page_size)
+            try:
+                start_time = time.monotonic()
+                result = session.execute(statement, timeout=self.args.timeout)
+                self.latency_stats.add(time.monotonic() - start_time)
+                if result.column_names:
+                    writer.writerow(result.column_names)
+                for row in result:
+                    writer.writerow(row)
+                    rows_count += 1
+            except Exception as error_message:
+                error_count += 1
+                self.print_error(f"{ErrorTitles.Failed.value} {error_message}\nquery: {query}\n")
+        sys.stdout.flush()
+        return (rows_count, error_count)
+
+    def count(self: 'CommandLine') -> Tuple[int, int]:
+        schema = self.load_schema()
+        scanner = TokenRangeScanner(self.connection.cluster,
+                                    self.connection.get_session(),
+                                    schema,
+                                    schema.partition_keys,
+                                    parallelism=self.args.parallelism,
+                                    page_size=self.args.page_size,
+                                    latency_stats=self.latency_stats)
+        progress_tracker = ProgressTracker()
+        rows = scanner.iter_rows()
+        while rows_count := sum(1 for _ in islice(rows, EXPORT_BATCH_SIZE)):
+            if progress := progress_tracker.add(rows_count):
+                self.show_progress(progress)
+        print(progress_tracker.rows_done)
+        self.print_errors(scanner.error_messages)
+        return (progress_tracker.rows_done, len(scanner.error_messages))
+
+    def show_progress(self: 'CommandLine', progress: ProgressModel) -> None:
+        if not self.args.quiet:
+            sys.stderr.write(f"\r{progress.to_text()}")
+            sys.stderr.flush()
+
+    def print_error(self: 'CommandLine', message: str) -> None:
+        print(message, file=sys.stderr)
+
+    def print_errors(self: 'CommandLine', error_messages: List[str]) -> None:
+        if error_messages:
+            self.print_error("\n" + "\n".join(error_messages))
+
+    def print_summary(self: 'CommandLine', rows_count: int, error_count: int) -> None:
+        elapsed_seconds = time.monotonic() - self.start_time
+        rows_per_second = rows_count / elapsed_seconds if elapsed_seconds > 0 else 0.0
+        self.print_error(f"\n{self.args.command}: {rows_count} rows in {elapsed_seconds:.2f} s"
+                         f" | {rows_per_second:.0f} rows/s | Errors: {error_count}")
+        self.print_error(f"Latency: {self.latency_stats.to_text()}")
@@ -1,9 +1,7 @@
-from PyQt6.uic import load_ui
 from PyQt6.QtWidgets import QFrame
+from constants.ui_loader import load_ui
 from constants.common import AUTH_MASTER_PASSWORD_WINDOW_PATH
 from backend.connection_profiles.master_password_manager import MasterPasswordManager
-from backend.connection_profiles.connection_window import ConnectionProfilesWindow
-from backend.connection_profiles.change_master_password_window import ChangeMasterPasswordWindow
 
 
 class AuthMasterPasswordWindow(QFrame):
@@ -11,7 +9,7 @@ class AuthMasterPasswordWindow(QFrame):
 
     def __init__(self: 'AuthMasterPasswordWindow') -> None:
         super(AuthMasterPasswordWindow, self).__init__()
-        load_ui.loadUi(AUTH_MASTER_PASSWORD_WINDOW_PATH, self)
+        load_ui(AUTH_MASTER_PASSWORD_WINDOW_PATH, self)
         self.master_password_manager = MasterPasswordManager()
 
         self.submit_push_button.clicked.connect(self.authenticate)
@@ -19,6 +17,7 @@ class AuthMasterPasswordWindow(QFrame):
 
 
     def open_connection_profiles_window(self: 'AuthMasterPasswordWindow') -> None:
+        from backend.connection_profiles.connection_window import ConnectionProfilesWindow
         window = ConnectionProfilesWindow(self.master_password_manager)
         AuthMasterPasswordWindow.opened_windows.append(window)
         window.show()
@@ -30,6 +29,7 @@ class AuthMasterPasswordWindow(QFrame):
             self.open_connection_profiles_window()
 
     def open_change_master_password_window(self: 'AuthMasterPasswordWindow') -> None:
+        from backend.connection_profiles.change_master_password_window import ChangeMasterPasswordWindow
         window = ChangeMasterPasswordWindow(self)
         AuthMasterPasswordWindow.opened_windows.append(window)
         window.show()
\ No newline at end of file
@@ -1,6 +1,6 @@
 from typing import Union
-from PyQt6.uic import load_ui
 from PyQt6.QtWidgets import QFrame
+from constants.ui_loader import load_ui
 from constants.common import CHANGE_MASTER_PASSWORD_WINDOW_PATH
 from constants.utils import pop_up_error
 from constants.common import ErrorTitles
@@ -13,7 +13,7 @@ class ChangeMasterPasswordWindow(QFrame):
 
     def __init__(self: 'ChangeMasterPasswordWindow', parent_window: QFrame) -> None:
         super(ChangeMasterPasswordWindow, self).__init__()
-        load_ui.loadUi(CHANGE_MASTER_PASSWORD_WINDOW_PATH, self)
+        load_ui(CHANGE_MASTER_PASSWORD_WINDOW_PATH, self)
         self.master_password_manager = MasterPasswordManager()
         self.__symmetric_key: bytes = None
         self.parent_window = parent_window
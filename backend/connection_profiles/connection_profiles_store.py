@@ -0,0 +1,159 @@
+import sqlite3
+from typing import List, Tuple, Union
+from constants.common import CONNECTION_PROFILES_DATABASE_PATH, CONNECTION_PROFILES_TABLE, CONNECTION_PROFILE_SETTINGS_COLUMNS
+from constants.connection_profile_model import ConnectionProfileModel
+
+
+class ConnectionProfilesStore:
+    def create_connection_profiles_table(self: 'ConnectionProfilesStore') -> Union[str, None]:
+        connection = sqlite3.connect(CONNECTION_PROFILES_DATABASE_PATH)
+        cursor = connection.cursor()
+
+        query = f"""
+            CREATE TABLE IF NOT EXISTS {CONNECTION_PROFILES_TABLE} (
+                connection_name VARCHAR(150) PRIMARY KEY UNIQUE NOT NULL,
+                host VARCHAR(150) NOT NULL,
+                port INTEGER NOT NULL,
+                username VARCHAR(150) NOT NULL,
+                password BLOB NOT NULL
+            );
+        """
+
+        try:
+            cursor.execute(query)
+            connection.commit()
+        except Exception as message:
+            return str(message)
+        finally:
+            connection.close()
+        return self.migrate_connection_profiles_table()
+
+    def migrate_connection_profiles_table(self: 'ConnectionProfilesStore') -> Union[str, None]:
+        connection = sqlite3.connect(CONNECTION_PROFILES_DATABASE_PATH)
+        cursor = connection.cursor()
+
+        try:
+            cursor.execute(f"PRAGMA table_info({CONNECTION_PROFILES_TABLE});")
+            column_names = {row[1] for row in cursor.fetchall()}
+            if not column_names:
+                return None
+            for column_name, column_definition in CONNECTION_PROFILE_SETTINGS_COLUMNS.items():
+                if column_name not in column_names:
+                    cursor.execute(f"ALTER TABLE {CONNECTION_PROFILES_TABLE} ADD COLUMN {column_name} {column_definition};")
+            connection.commit()
+        except Exception as message:
+            return str(message)
+        finally:
+            connection.close()
+
+    def save_connection_profile(self: 'ConnectionProfilesStore', model: ConnectionProfileModel) -> Union[str, None]:
+        connection = sqlite3.connect(CONNECTION_PROFILES_DATABASE_PATH)
+        cursor = connection.cursor()
+
+        query = f"""
+             INSERT INTO {CONNECTION_PROFILES_TABLE} ({", ".join(model.keys())})
+             VALUES ({", ".join(['?' for _ in model])})
+         """
+        values = tuple(model.values())
+
+        try:
+            cursor.execute(query, values)
+            connection.commit()
+        except Exception as message:
+            return str(message)
+        finally:
+            connection.close()
+
+    def get_connection_profile(self: 'ConnectionProfilesStore', connection_name: str) -> Union[ConnectionProfileModel, None]:
+        connection = sqlite3.connect(CONNECTION_PROFILES_DATABASE_PATH)
+        cursor = connection.cursor()
+
+        query = f"""
+            SELECT *
+            FROM {CONNECTION_PROFILES_TABLE}
+            WHERE connection_name = ?;
+        """
+
+        try:
+            cursor.execute(query, (connection_name, ))
+            row = cursor.fetchone()
+            column_names = [column[0] for column in cursor.description]
+        except Exception:
+            return None
+        finally:
+            connection.close()
+
+        return ConnectionProfileModel(**dict(zip(column_names, row))) if row else None
+
+    def get_connection_names(self: 'ConnectionProfilesStore') -> List[str]:
+        connection = sqlite3.connect(CONNECTION_PROFILES_DATABASE_PATH)
+        cursor = connection.cursor()
+
+        query = f"""
+            SELECT connection_name
+            FROM {CONNECTION_PROFILES_TABLE}
+            ORDER BY connection_name;
+        """
+
+        try:
+            cursor.execute(query)
+            return [row[0] for row in cursor.fetchall()]
+        except Exception:
+            return []
+        finally:
+            connection.close()
+
+    def get_password(self: 'ConnectionProfilesStore', connection_name: str) -> Union[bytes, None]:
+        connection = sqlite3.connect(CONNECTION_PROFILES_DATABASE_PATH)
+        cursor = connection.cursor()
+
+        query = f"""
+            SELECT password
+            FROM {CONNECTION_PROFILES_TABLE}
+            WHERE connection_name = ?;
+        """
+
+        try:
+            cursor.execute(query, (connection_name, ))
+        except Exception:
+            return None
+
+        row = cursor.fetchone()
+        if row:
+            connection.close()
+            return row[0]
+
+    def get_password_to_change(self: 'ConnectionProfilesStore') -> Union[List[Tuple[str, bytes]], None]:
+        connection = sqlite3.connect(CONNECTION_PROFILES_DATABASE_PATH)
+        cursor = connection.cursor()
+
+        query = f"""
+            SELECT connection_name, password
+            FROM {CONNECTION_PROFILES_TABLE};
+        """
+
+        try:
+            cursor.execute(query)
+        except Exception:
+            return None
+
+        return cursor.fetchall()
+
+    def update_password(self: 'ConnectionProfilesStore', connection_name: str, new_password: bytes) -> None:
+        connection = sqlite3.connect(CONNECTION_PROFILES_DATABASE_PATH)
+        cursor = connection.cursor()
+
+        query = f"""
+            UPDATE {CONNECTION_PROFILES_TABLE}
+            SET password = ?
+            WHERE connection_name = ?;
+         """
+        values = (new_password, connection_name)
+
+        try:
+            cursor.execute(query, values)
+            connection.commit()
+        except Exception as message:
+            return str(message)
+        finally:
+            connection.close()
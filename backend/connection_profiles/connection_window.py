@@ -1,19 +1,18 @@
+from typing import Any, Dict
 from PyQt6.QtWidgets import QMainWindow
 from PyQt6.QtCore import Qt
-from PyQt6 import uic
+from PyQt6.QtGui import QCloseEvent
+from constants.ui_loader import load_ui
 from constants.common import (ErrorTitles,
                               ConfirmationMessages,
+                              ConnectionStatus,
                               CONNECTION_WINDOW_UI_PATH,
                               CONNECTION_PROFILES_TABLE)
 from constants.model_wrapper import ModelWrapper
-from constants.utils import pop_up_error, pop_up_confirmation_dialog
+from constants.utils import pop_up_error, pop_up_warning, pop_up_confirmation_dialog
 from backend.connection_profiles.connection_profiles_database import ConnectionProfilesDatabase, PASSWORD_COLUMN_INDEX
 from backend.connection_profiles.custom_q_sql_table_model import CustomQSqlTableModel, PasswordDelegate
 from backend.custom_filter_proxy_model import CustomFilterProxyModel
-from backend.main_window.main_window import MainWindow
-from constants.connection_model import Connection
-from cassandra.cluster import Cluster
-from cassandra.auth import PlainTextAuthProvider
 from backend.connection_profiles.master_password_manager import MasterPasswordManager
 from constants.connection_profile_model import ConnectionProfileModel
 
@@ -26,9 +25,12 @@ class ConnectionProfilesWindow(QMainWindow):
                  is_master_password_changed: bool = False,
                  symmetric_key: bytes = None) -> None:
         super(ConnectionProfilesWindow, self).__init__()
-        uic.loadUi(CONNECTION_WINDOW_UI_PATH, self)
+        load_ui(CONNECTION_WINDOW_UI_PATH, self)
         self.conn_prof_db = ConnectionProfilesDatabase()
         self.connections = []
+        self.connection_worker = None
+        self.connection_statuses: Dict[str, str] = {}
+        self.connection_errors: Dict[str, str] = {}
         self.main_window = None
         self.master_password_manager = master_password_manager
         self.is_master_password_changed = is_master_password_changed
@@ -109,24 +111,52 @@ class ConnectionProfilesWindow(QMainWindow):
         self.connection_profiles_table_view.setModel(self.model)
 
     def connect_to_cassandra(self: 'ConnectionProfilesWindow') -> None:
-        connection_profiles = self.get_selected_rows()
-        for connection_profile in connection_profiles:
-            cluster = None
-            auth_provider = PlainTextAuthProvider(username=connection_profile.username, password=connection_profile.password)
-            try:
-                cluster = Cluster(
-                    contact_points=[connection_profile.host],
-                    port=connection_profile.port,
-                    auth_provider=auth_provider
-                )
-                cluster.connect()
-            except Exception as message:
-                pop_up_error(ErrorTitles.Connection_profiles.value, message)
-            else:
-                if cluster:
-                    if not connection_profile.connection_name in [i.connection_profile_name for i in self.connections]:
-                        self.connections.append(Connection(cluster, connection_profile.connection_name))
-                    self.open_main_window()
+        # NOTE The driver is imported on first connect, it is not needed to show the connection profiles.
+        from backend.connection_profiles.connection_worker import ConnectionWorker
+        from constants.cluster_factory import get_pool_sizes_warning
+        if self.connection_worker is None:
+            self.connection_worker = ConnectionWorker()
+            self.connection_worker.connection_opened.connect(self.handle_connection_opened)
+            self.connection_worker.connection_failed.connect(self.handle_connection_failed)
+
+        connection_profiles = []
+        warnings = []
+        for connection_profile in self.get_selected_rows():
+            if connection_profile.connection_name in [i.connection_profile_name for i in self.connections]:
+                self.open_main_window()
+            elif self.connection_statuses.get(connection_profile.connection_name) != ConnectionStatus.connecting.value:
+                self.set_connection_status(connection_profile.connection_name, ConnectionStatus.connecting)
+                connection_profiles.append(connection_profile)
+                if warning := get_pool_sizes_warning(connection_profile):
+                    warnings.append(f"{connection_profile.connection_name}: {warning}")
+        self.connection_worker.connect_profiles(connection_profiles)
+        if warnings:
+            pop_up_warning(ErrorTitles.Connection_settings.value, "\n".join(warnings))
+
+    def handle_connection_opened(self: 'ConnectionProfilesWindow', connection: Any) -> None:
+        if self.connection_worker.is_shut_down:
+            connection.close()
+            return None
+        self.set_connection_status(connection.connection_profile_name, ConnectionStatus.connected)
+        self.connections.append(connection)
+        self.open_main_window()
+        self.show_connection_errors()
+
+    def handle_connection_failed(self: 'ConnectionProfilesWindow', connection_profile_name: str, error_message: str) -> None:
+        self.connection_errors[connection_profile_name] = error_message
+        self.set_connection_status(connection_profile_name, ConnectionStatus.failed)
+        self.show_connection_errors()
+
+    def set_connection_status(self: 'ConnectionProfilesWindow', connection_profile_name: str, status: ConnectionStatus) -> None:
+        self.connection_statuses[connection_profile_name] = status.value
+        self.statusbar.showMessage(" | ".join(f"{name}: {status}" for name, status in self.connection_statuses.items()))
+
+    def show_connection_errors(self: 'ConnectionProfilesWindow') -> None:
+        if not self.connection_errors or ConnectionStatus.connecting.value in self.connection_statuses.values():
+            return None
+        message = "\n".join(f"{name}: {error_message}" for name, error_message in self.connection_errors.items())
+        self.connection_errors.clear()
+        pop_up_error(ErrorTitles.Connection_profiles.value, message)
 
     def get_selected_rows(self: 'ConnectionProfilesWindow') -> list:
         selected_indexes = self.connection_profiles_table_view.selectionModel().selectedRows()
@@ -150,6 +180,7 @@ class ConnectionProfilesWindow(QMainWindow):
         return row_models
 
     def open_main_window(self: 'ConnectionProfilesWindow') -> None:
+        from backend.main_window.main_window import MainWindow
         if not self.main_window or self.main_window.is_open is False:
             self.main_window = MainWindow(self.connections)
             ConnectionProfilesWindow.opened_windows.append(self.main_window)
@@ -157,6 +188,11 @@ class ConnectionProfilesWindow(QMainWindow):
         else:
             self.main_window.refresh_connection_tree_model()
 
+    def closeEvent(self: 'ConnectionProfilesWindow', event: QCloseEvent) -> None:
+        if self.connection_worker:
+            self.connection_worker.shutdown()
+        event.accept()
+
     def process_master_password_changed(self) -> None:
         if not self.is_master_password_changed:
             return None
@@ -0,0 +1,52 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional
+from PyQt6.QtCore import QObject, pyqtSignal
+from constants.common import CONNECT_PARALLELISM
+from constants.cluster_factory import build_cluster
+from constants.connection_model import Connection
+from constants.connection_profile_model import ConnectionProfileModel
+
+
+class ConnectionWorker(QObject):
+    connection_opened = pyqtSignal(object)
+    connection_failed = pyqtSignal(str, str)
+
+    def __init__(self: 'ConnectionWorker',
+                 connect_timeout: Optional[float] = None,
+                 parallelism: int = CONNECT_PARALLELISM) -> None:
+        super().__init__()
+        self.connect_timeout = connect_timeout
+        self.executor = ThreadPoolExecutor(max_workers=parallelism)
+        self.is_shut_down = False
+
+
+    def connect_profiles(self: 'ConnectionWorker', connection_profiles: List[ConnectionProfileModel]) -> None:
+        for connection_profile in connection_profiles:
+            self.executor.submit(self.connect_profile, connection_profile)
+
+    def connect_profile(self: 'ConnectionWorker', connection_profile: ConnectionProfileModel) -> None:
+        cluster = None
+        try:
+            cluster = build_cluster(connection_profile, self.connect_timeout)
+            session = cluster.connect()
+        except Exception as error_message:
+            if cluster:
+                cluster.shutdown()
+            self.emit_signal(self.connection_failed, connection_profile.connection_name, str(error_message))
+        else:
+            connection = Connection(cluster, connection_profile.connection_name, session, connection_profile)
+            if self.is_shut_down or not self.emit_signal(self.connection_opened, connection):
+                connection.close()
+
+    def emit_signal(self: 'ConnectionWorker', signal: pyqtSignal, *args: Any) -> bool:
+        # NOTE The window may be closed while a connect is still running.
+        try:
+            signal.emit(*args)
+        except RuntimeError:
+            return False
+        return True
+
+    def shutdown(self: 'ConnectionWorker') -> None:
+        # NOTE A running cluster.connect() can not be cancelled, its connection is closed once it finishes.
+        self.is_shut_down = True
+        self.executor.shutdown(wait=False, cancel_futures=True)
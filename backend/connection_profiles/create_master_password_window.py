@@ -1,10 +1,9 @@
-from PyQt6.uic import load_ui
 from PyQt6.QtWidgets import QFrame
+from constants.ui_loader import load_ui
 from constants.common import CREATE_MASTER_PASSWORD_WINDOW_PATH
 from constants.utils import pop_up_error
 from constants.common import ErrorTitles
 from backend.connection_profiles.master_password_manager import MasterPasswordManager
-from backend.connection_profiles.connection_window import ConnectionProfilesWindow
 
 
 class CreateMasterPasswordWindow(QFrame):
@@ -12,7 +11,7 @@ class CreateMasterPasswordWindow(QFrame):
 
     def __init__(self: 'CreateMasterPasswordWindow') -> None:
         super(CreateMasterPasswordWindow, self).__init__()
-        load_ui.loadUi(CREATE_MASTER_PASSWORD_WINDOW_PATH, self)
+        load_ui(CREATE_MASTER_PASSWORD_WINDOW_PATH, self)
         self.master_password_manager = MasterPasswordManager()
 
         self.submit_push_button.clicked.connect(self.create_master_password)
@@ -20,6 +19,7 @@ class CreateMasterPasswordWindow(QFrame):
 
 
     def open_connection_profiles_window(self: 'CreateMasterPasswordWindow', is_master_password_changed: bool = False) -> None:
+        from backend.connection_profiles.connection_window import ConnectionProfilesWindow
         window = ConnectionProfilesWindow(self.master_password_manager, is_master_password_changed)
         CreateMasterPasswordWindow.opened_windows.append(window)
         window.show()
@@ -2,9 +2,6 @@ import sqlite3
 import hashlib
 import os
 from typing import Any, Tuple, Union
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import padding
 from constants.common import MASTER_PASSWORD_DB_PATH, MASTER_PASSWORD_TABLE
 
 
@@ -111,6 +108,9 @@ class MasterPasswordManager:
         return is_authenticated
 
     def encrypt_aes_256(self: 'MasterPasswordManager', password: str) -> bytes:
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+        from cryptography.hazmat.backends import default_backend
+        from cryptography.hazmat.primitives import padding
         iv = os.urandom(16)
         cipher = Cipher(algorithms.AES(self.__symmetric_key), modes.CBC(iv), backend=default_backend())
         encryptor = cipher.encryptor()
@@ -123,6 +123,9 @@ class MasterPasswordManager:
         return iv + ciphertext
 
     def decrypt_aes_256(self: 'MasterPasswordManager', encrypted_password: bytes, symmetric_key: bytes = None) -> str:
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+        from cryptography.hazmat.backends import default_backend
+        from cryptography.hazmat.primitives import padding
         iv = encrypted_password[:16]
         ciphertext = encrypted_password[16:]
 
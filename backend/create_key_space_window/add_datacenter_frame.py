@@ -1,5 +1,5 @@
-from PyQt6.uic import load_ui
 from PyQt6.QtWidgets import QFrame
+from constants.ui_loader import load_ui
 from constants.common import DATACENTER_REPLICATION_FRAME_PATH
 from constants.datacenter_model import DatacenterModel
 
@@ -7,7 +7,7 @@ from constants.datacenter_model import DatacenterModel
 class AddDatacenterFrame(QFrame):
     def __init__(self: 'AddDatacenterFrame') -> None:
         super(AddDatacenterFrame, self).__init__()
-        load_ui.loadUi(DATACENTER_REPLICATION_FRAME_PATH, self)
+        load_ui(DATACENTER_REPLICATION_FRAME_PATH, self)
 
     def get_datacenter_model(self: 'AddDatacenterFrame') -> DatacenterModel:
         return DatacenterModel(
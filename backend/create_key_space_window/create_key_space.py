@@ -1,6 +1,6 @@
 from typing import Callable, List, Union
-from PyQt6.uic import load_ui
 from PyQt6.QtWidgets import QFrame
+from constants.ui_loader import load_ui
 from constants.common import CREATE_KEY_SPACE_WINDOW_PATH, ErrorTitles
 from constants.utils import pop_up_error
 from constants.common import ErrorTitles, ReplicationClass
@@ -15,7 +15,7 @@ class CreateKeySpaceWindow(QFrame):
                  cassandra_manager: CassandraManager,
                  refresh_connection_tree_model: Callable[[], None]) -> None:
         super(CreateKeySpaceWindow, self).__init__()
-        load_ui.loadUi(CREATE_KEY_SPACE_WINDOW_PATH, self)
+        load_ui(CREATE_KEY_SPACE_WINDOW_PATH, self)
         self.cassandra_manager: CassandraManager = cassandra_manager
         self.refresh_connection_tree_model = refresh_connection_tree_model
         self.datacenter_frames: List[AddDatacenterFrame] = []
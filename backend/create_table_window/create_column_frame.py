@@ -1,5 +1,5 @@
-from PyQt6.uic import load_ui
 from PyQt6.QtWidgets import QFrame
+from constants.ui_loader import load_ui
 from constants.common import CREATE_COLUMN_FRAME_PATH
 from constants.column_model import ColumnModel
 
@@ -7,7 +7,7 @@ from constants.column_model import ColumnModel
 class CreateColumnFrame(QFrame):
     def __init__(self: 'CreateColumnFrame') -> None:
         super(CreateColumnFrame, self).__init__()
-        load_ui.loadUi(CREATE_COLUMN_FRAME_PATH, self)
+        load_ui(CREATE_COLUMN_FRAME_PATH, self)
 
     def get_column_model(self: 'CreateColumnFrame') -> ColumnModel:
         return ColumnModel(
@@ -1,6 +1,6 @@
 from typing import Callable, List, Union
-from PyQt6.uic import load_ui
 from PyQt6.QtWidgets import QFrame
+from constants.ui_loader import load_ui
 from constants.common import CREATE_TABLE_WINDOW_PATH, ErrorTitles
 from constants.utils import pop_up_error
 from constants.common import ErrorTitles
@@ -16,7 +16,7 @@ class CreateTableWindow(QFrame):
                  cassandra_manager: CassandraManager,
                  refresh_connection_tree_model: Callable[[], None]) -> None:
         super(CreateTableWindow, self).__init__()
-        load_ui.loadUi(CREATE_TABLE_WINDOW_PATH, self)
+        load_ui(CREATE_TABLE_WINDOW_PATH, self)
         self.key_space: str = key_space
         self.cassandra_manager: CassandraManager = cassandra_manager
         self.column_frames: List[CreateColumnFrame] = []
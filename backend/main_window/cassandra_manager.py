@@ -5,13 +5,13 @@ from constants.connection_model import Connection
 from constants.create_table_model import CreateTableModel
 from constants.create_key_space_model import CreateKeySpaceModel
 from constants.column_model import ColumnModel
-from constants.utils import remove_empty_strings
+from constants.query_utils import remove_empty_strings
 
 
 class CassandraManager:
     def __init__(self, connection: Connection) -> None:
         self.cluster = connection.cluster
-        self.session = self.cluster.connect()
+        self.session = connection.get_session()
 
 
     #######################################################################################################
@@ -1,67 +1,147 @@
-from PyQt6.QtGui import QStandardItemModel, QStandardItem
-from constants.common import NO_TABLE, ErrorTitles
-from constants.utils import pop_up_error
+from typing import Any, Callable, Dict, List, Optional
+from PyQt6.QtCore import Qt, QAbstractItemModel, QModelIndex, pyqtSignal
+from constants.common import NO_TABLE, DATABASE_NAVIGATION_HEADER, TreeViewDepthLevel
 from constants.connection_model import Connection
-from cassandra.cluster import Session
+from constants.schema_change_model import SchemaChangeModel
+from backend.main_window.tree_node import TreeNode
 
 
-class CustomCassandraTreeModel:
+class CustomCassandraTreeModel(QAbstractItemModel):
+    schema_changed = pyqtSignal(object, object)
+    schema_cache_error_changed = pyqtSignal(object, object)
+
     def __init__(self: 'CustomCassandraTreeModel', connections: list[Connection]) -> None:
+        super().__init__()
         self.connections = connections
-        self.cassandra_data = self.get_cassandra_structure()
-
-
-    def __try_connect(self: 'CustomCassandraTreeModel', connection: Connection) -> Session:
-        session = None
-        try:
-            session = connection.cluster.connect()
-        except Exception as message:
-            pop_up_error(ErrorTitles.Connection_profiles.value, message)
-        finally:
-            return session
-
-    def get_cassandra_structure(self: 'CustomCassandraTreeModel') -> dict:
-        structure = {}
-
+        self.root = TreeNode(None, TreeViewDepthLevel.db_name.value - 1)
+        self.root.is_loaded = True
+        self.schema_change_listeners: Dict[str, Callable[[SchemaChangeModel], None]] = {}
+        self.schema_cache_error_listeners: Dict[str, Callable[[Optional[str]], None]] = {}
+        self.schema_changed.connect(self.handle_schema_change)
+        self.sync_connection_nodes()
+
+
+    def index(self: 'CustomCassandraTreeModel', row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        node = self.get_node(parent)
+        if column != 0 or not 0 <= row < len(node.children):
+            return QModelIndex()
+        return self.createIndex(row, column, node.children[row])
+
+    def parent(self: 'CustomCassandraTreeModel', index: QModelIndex) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        return self.get_index(index.internalPointer().parent)
+
+    def rowCount(self: 'CustomCassandraTreeModel', parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        return len(self.get_node(parent).children)
+
+    def columnCount(self: 'CustomCassandraTreeModel', parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def hasChildren(self: 'CustomCassandraTreeModel', parent: QModelIndex = QModelIndex()) -> bool:
+        node = self.get_node(parent)
+        return not node.is_loaded or bool(node.children)
+
+    def canFetchMore(self: 'CustomCassandraTreeModel', parent: QModelIndex) -> bool:
+        return not self.get_node(parent).is_loaded
+
+    def fetchMore(self: 'CustomCassandraTreeModel', parent: QModelIndex) -> None:
+        node = self.get_node(parent)
+        if node.is_loaded:
+            return None
+        node.is_loaded = True
+        self.sync_children(node, self.get_child_names(node))
+
+    def data(self: 'CustomCassandraTreeModel', index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if index.isValid() and role == Qt.ItemDataRole.DisplayRole:
+            return index.internalPointer().name
+        return None
+
+    def headerData(self: 'CustomCassandraTreeModel', section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return DATABASE_NAVIGATION_HEADER
+        return None
+
+    def get_node(self: 'CustomCassandraTreeModel', index: QModelIndex) -> TreeNode:
+        return index.internalPointer() if index.isValid() else self.root
+
+    def get_index(self: 'CustomCassandraTreeModel', node: TreeNode) -> QModelIndex:
+        if node.is_root():
+            return QModelIndex()
+        return self.createIndex(node.row(), 0, node)
+
+    def get_child_names(self: 'CustomCassandraTreeModel', node: TreeNode) -> List[str]:
+        if node.depth == TreeViewDepthLevel.db_name.value:
+            return node.connection.get_key_space_names()
+        return node.connection.get_table_names(node.name) or [NO_TABLE]
+
+    def sync_children(self: 'CustomCassandraTreeModel', node: TreeNode, names: List[str]) -> None:
+        parent_index = self.get_index(node)
+        new_names = set(names)
+        for row in reversed(range(len(node.children))):
+            if node.child_names[row] not in new_names:
+                self.beginRemoveRows(parent_index, row, row)
+                self.remove_child(node, row)
+                self.endRemoveRows()
+
+        for name in names:
+            if node.get_child_row(name) >= 0:
+                continue
+            row = node.get_insert_row(name)
+            self.beginInsertRows(parent_index, row, row)
+            node.insert_child(row, self.create_child(node, name))
+            self.endInsertRows()
+
+    def create_child(self: 'CustomCassandraTreeModel', node: TreeNode, name: str) -> TreeNode:
+        if not node.is_root():
+            return TreeNode(name, node.depth + 1, node)
+        connection = self.select_connection(name)
+        listener = lambda schema_change: self.schema_changed.emit(connection, schema_change)
+        connection.schema_change_notifier.add_listener(listener)
+        self.schema_change_listeners[name] = listener
+        if connection.schema_cache_refresher:
+            error_listener = lambda error_message: self.schema_cache_error_changed.emit(connection, error_message)
+            connection.schema_cache_refresher.add_error_listener(error_listener)
+            self.schema_cache_error_listeners[name] = error_listener
+        return TreeNode(name, node.depth + 1, node, connection)
+
+    def remove_child(self: 'CustomCassandraTreeModel', node: TreeNode, row: int) -> None:
+        if node.is_root():
+            self.remove_listeners(node.children[row])
+        node.remove_child(row)
+
+    def remove_listeners(self: 'CustomCassandraTreeModel', connection_node: TreeNode) -> None:
+        listener = self.schema_change_listeners.pop(connection_node.name)
+        connection_node.connection.schema_change_notifier.remove_listener(listener)
+        error_listener = self.schema_cache_error_listeners.pop(connection_node.name, None)
+        if error_listener:
+            connection_node.connection.schema_cache_refresher.remove_error_listener(error_listener)
+
+    def select_connection(self: 'CustomCassandraTreeModel', connection_profile_name: str) -> Optional[Connection]:
         for connection in self.connections:
-            session = self.__try_connect(connection)
-            keyspace_metadata_list = connection.cluster.metadata.keyspaces.values()
-            connection_structure = {}
-
-            for keyspace_metadata in keyspace_metadata_list:
-                keyspace_name = keyspace_metadata.name
-                keyspace_structure = {}
-
-                for table_metadata in keyspace_metadata.tables.values():
-                    table_name = table_metadata.name
-                    keyspace_structure[table_name] = {}
-
-                connection_structure[keyspace_name] = keyspace_structure
-
-            structure[connection.connection_profile_name] = connection_structure
-            if session is not None:
-                session.shutdown()
-        return structure
-
-    def create_custom_model(self: 'CustomCassandraTreeModel') -> QStandardItemModel:
-        custom_model = QStandardItemModel()
-
-        for category, subcategories in self.cassandra_data.items():
-            parentItem = QStandardItem(category)
-
-            for subcategory, subcategory_values in subcategories.items():
-                subcategory_item = QStandardItem(subcategory)
-
-                if not subcategory_values:
-                    child_item = QStandardItem(NO_TABLE)
-                    subcategory_item.appendRow(child_item)
-
-                for key, value in subcategory_values.items():
-                    child_item = QStandardItem(key)
-                    subcategory_item.appendRow(child_item)
-
-                parentItem.appendRow(subcategory_item)
-
-            custom_model.appendRow(parentItem)
-
-        return custom_model
\ No newline at end of file
+            if connection.connection_profile_name == connection_profile_name:
+                return connection
+
+    def sync_connection_nodes(self: 'CustomCassandraTreeModel') -> None:
+        self.sync_children(self.root, [connection.connection_profile_name for connection in self.connections])
+        for connection_node in self.root.children:
+            self.sync_connection_node(connection_node)
+
+    def sync_connection_node(self: 'CustomCassandraTreeModel', connection_node: TreeNode, key_space: Optional[str] = None) -> None:
+        if not connection_node.is_loaded:
+            return None
+        self.sync_children(connection_node, self.get_child_names(connection_node))
+        for key_space_node in connection_node.children:
+            if key_space_node.is_loaded and key_space in (None, key_space_node.name):
+                self.sync_children(key_space_node, self.get_child_names(key_space_node))
+
+    def handle_schema_change(self: 'CustomCassandraTreeModel', connection: Connection, schema_change: SchemaChangeModel) -> None:
+        connection_node = self.root.get_child(connection.connection_profile_name)
+        if connection_node and connection_node.connection is connection:
+            self.sync_connection_node(connection_node, schema_change.keyspace)
+
+    def close(self: 'CustomCassandraTreeModel') -> None:
+        for connection_node in self.root.children:
+            self.remove_listeners(connection_node)
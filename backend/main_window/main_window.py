@@ -1,14 +1,15 @@
-from typing import Union
+from typing import Optional, Union
 from PyQt6.QtWidgets import QMainWindow, QMenu
-from PyQt6 import uic
 from PyQt6.QtCore import Qt, QModelIndex, QPoint
-from constants.common import MAIN_WINDOW_UI_PATH, DATABASE_NAVIGATION_HEADER, TreeViewActionType, TreeViewDepthLevel, NO_TABLE
+from constants.common import MAIN_WINDOW_UI_PATH, ErrorTitles, TreeViewActionType, TreeViewDepthLevel, NO_TABLE
 from backend.main_window.custom_cassandra_tree_model import CustomCassandraTreeModel
+from backend.main_window.tree_node import TreeNode
 from constants.connection_model import Connection
 from backend.table_window.database_table import DatabaseTable
-from PyQt6.QtGui import QAction, QCloseEvent, QStandardItem
+from PyQt6.QtGui import QAction, QCloseEvent
+from constants.ui_loader import load_ui
 from backend.main_window.cassandra_manager import CassandraManager
-from constants.utils import pop_up_confirmation_dialog
+from constants.utils import pop_up_confirmation_dialog, pop_up_error
 from backend.create_table_window.create_table_window import CreateTableWindow
 from backend.create_key_space_window.create_key_space import CreateKeySpaceWindow
 
@@ -18,11 +19,16 @@ class MainWindow(QMainWindow):
 
     def __init__(self: 'MainWindow', connections: list[Connection]) -> None:
         super(MainWindow, self).__init__()
-        uic.loadUi(MAIN_WINDOW_UI_PATH, self)
+        load_ui(MAIN_WINDOW_UI_PATH, self)
         self.splitter.setSizes([200, 700])
         self.connections = connections
         self.is_open = True
-        self.refresh_connection_tree_model()
+        self.custom_model = CustomCassandraTreeModel(self.connections)
+        self.database_navigation_tree_view.setModel(self.custom_model)
+        self.custom_model.schema_cache_error_changed.connect(self.show_schema_cache_error)
+        for connection in self.connections:
+            if connection.schema_cache_refresher and connection.schema_cache_refresher.error_message:
+                self.show_schema_cache_error(connection, connection.schema_cache_refresher.error_message)
         self.set_closeable_tabs()
         self.database_navigation_tree_view.doubleClicked.connect(self.open_table)
         self.database_navigation_tree_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -36,44 +42,52 @@ class MainWindow(QMainWindow):
 
     def closeTab(self: 'MainWindow', index: int) -> None:
         widget = self.tab_widget.widget(index)
+        if isinstance(widget, DatabaseTable):
+            widget.close_results_log()
         if widget is not None:
             widget.deleteLater()
         self.tab_widget.removeTab(index)
 
     def closeEvent(self: 'MainWindow', event: QCloseEvent) -> None:
         self.is_open = False
+        for index in range(self.tab_widget.count()):
+            if isinstance(self.tab_widget.widget(index), DatabaseTable):
+                self.tab_widget.widget(index).close_results_log()
+        self.custom_model.close()
+        for connection in self.connections:
+            connection.close()
         self.connections.clear()
         event.accept()
 
     def refresh_connection_tree_model(self: 'MainWindow') -> None:
-        cassandra_model = CustomCassandraTreeModel(self.connections)
-        self.custom_model = cassandra_model.create_custom_model()
-        self.custom_model.setHorizontalHeaderLabels([DATABASE_NAVIGATION_HEADER])
-        self.database_navigation_tree_view.setModel(self.custom_model)
+        for connection in self.connections:
+            connection.refresh_schema(is_forced=False)
+        self.custom_model.sync_connection_nodes()
+
+    def refresh_schema(self: 'MainWindow', connection: Connection) -> None:
+        try:
+            connection.refresh_schema()
+        except Exception as message:
+            pop_up_error(ErrorTitles.Db_Cassandra_error.value, message)
+        self.refresh_connection_tree_model()
+
+    def show_schema_cache_error(self: 'MainWindow', connection: Connection, error_message: Optional[str]) -> None:
+        if error_message:
+            self.statusbar.showMessage(f"{connection.connection_profile_name}: schema refresh failed, retrying. {error_message}")
+        else:
+            self.statusbar.clearMessage()
 
-    def add_tab(self: 'MainWindow', item: QStandardItem) -> None:
-        if not item.parent():
-            return None
-        table = item.text()
-        key_space = item.parent().text()
+    def add_tab(self: 'MainWindow', node: TreeNode) -> None:
+        table = node.name
+        key_space = node.parent.name
         table_name = f"{table} ({key_space})"
-        tab_content = DatabaseTable(self.select_connection(item), key_space, table)
+        tab_content = DatabaseTable(node.connection, key_space, table)
         self.tab_widget.addTab(tab_content, table_name)
 
-    def select_connection(self: 'MainWindow', item: QStandardItem) -> Connection:
-        for connection in self.connections:
-            if self.get_text_from_root_parent(item) == connection.connection_profile_name:
-                return connection
-
-    def get_text_from_root_parent(self: 'MainWindow', item: QStandardItem) -> Union[str, None]:
-        while item.parent() is not None:
-            item = item.parent()
-        return item.text() if item else None
-
     def open_table(self: 'MainWindow', index: QModelIndex) -> None:
-        item = self.custom_model.itemFromIndex(index)
-        if item and not item.hasChildren() and not (item.text() == NO_TABLE):
-            self.add_tab(item)
+        node = self.custom_model.get_node(index)
+        if index.isValid() and node.depth == TreeViewDepthLevel.table.value and node.name != NO_TABLE:
+            self.add_tab(node)
 
     def show_context_menu(self: 'MainWindow', position: QPoint) -> None:
         index = self.database_navigation_tree_view.indexAt(position)
@@ -96,13 +110,13 @@ class MainWindow(QMainWindow):
                 removed_number_of_widgets += 1
 
     def execute_action(self: 'MainWindow', action: TreeViewActionType, index: QModelIndex) -> None:
-        item = self.custom_model.itemFromIndex(index)
-        self.cassandra_manager = CassandraManager(self.select_connection(item))
+        connection = self.custom_model.get_node(index).connection
+        self.cassandra_manager = CassandraManager(connection)
         match action:
             case TreeViewActionType.create_key_space.value:
                 self.open_create_key_space_window()
             case TreeViewActionType.refresh.value:
-                self.refresh_connection_tree_model()
+                self.refresh_schema(connection)
             case TreeViewActionType.delete_key_space.value:
                 pop_up_confirmation_dialog(
                     parent = self,
@@ -0,0 +1,49 @@
+from bisect import bisect_left
+from typing import List, Optional
+from constants.common import TreeViewDepthLevel
+from constants.connection_model import Connection
+
+
+class TreeNode:
+    def __init__(self: 'TreeNode',
+                 name: str,
+                 depth: int,
+                 parent: Optional['TreeNode'] = None,
+                 connection: Optional[Connection] = None) -> None:
+        self.name = name
+        self.depth = depth
+        self.parent = parent
+        self.connection = connection
+        if connection is None and parent is not None:
+            self.connection = parent.connection
+        self.children: List[TreeNode] = []
+        self.child_names: List[str] = []
+        self.is_loaded = depth >= TreeViewDepthLevel.table.value
+
+
+    def is_root(self: 'TreeNode') -> bool:
+        return self.parent is None
+
+    def row(self: 'TreeNode') -> int:
+        return self.parent.get_child_row(self.name) if self.parent else 0
+
+    def get_child_row(self: 'TreeNode', name: str) -> int:
+        if self.is_root():
+            return self.child_names.index(name) if name in self.child_names else -1
+        row = bisect_left(self.child_names, name)
+        return row if row < len(self.child_names) and self.child_names[row] == name else -1
+
+    def get_insert_row(self: 'TreeNode', name: str) -> int:
+        return len(self.child_names) if self.is_root() else bisect_left(self.child_names, name)
+
+    def get_child(self: 'TreeNode', name: str) -> Optional['TreeNode']:
+        row = self.get_child_row(name)
+        return self.children[row] if row >= 0 else None
+
+    def insert_child(self: 'TreeNode', row: int, child: 'TreeNode') -> None:
+        self.children.insert(row, child)
+        self.child_names.insert(row, child.name)
+
+    def remove_child(self: 'TreeNode', row: int) -> None:
+        del self.children[row]
+        del self.child_names[row]
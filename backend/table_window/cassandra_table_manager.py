@@ -1,52 +1,83 @@
 import re
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
 from PyQt6.QtWidgets import QPlainTextEdit
 from constants.utils import pop_up_error
-from constants.common import ErrorTitles
+from constants.common import ErrorTitles, StatementKind, TABLE_PAGE_SIZE, IMPORT_CONCURRENCY, IMPORT_MAX_ROWS_PER_SECOND
+from constants.import_result_model import ImportResultModel
+from constants.progress_model import ProgressModel
+from constants.prepared_statement_cache import PreparedStatementCache
+from constants.schema_cache import SchemaCache
 from constants.show_result_utils import ShowResultUtils
-from constants.insert_row_utils import InsertRowUtils
-from cassandra.cluster import Cluster, Session, ResultSet, PreparedStatement
+from constants.row_converter import RowConverter
+from backend.table_window.table_schema import TableSchema
+from backend.table_window.import_engine import ImportEngine
+from backend.table_window.partition_batch_writer import PartitionBatchWriter
+from backend.table_window.write_throttle import WriteThrottle
+from backend.table_window.import_retry_policy import ImportRetryPolicy
+from backend.table_window.dead_letter_writer import DeadLetterWriter, remove_error_field
+from cassandra.cluster import Cluster, Session, PreparedStatement
+from cassandra.query import SimpleStatement, Statement
 
 
 class CassandraTableManager:
     def __init__(self: 'CassandraTableManager',
                  cluster: Cluster,
                  session: Session,
+                 prepared_statement_cache: PreparedStatementCache,
                  key_space: str,
                  table: str,
                  results_plain_text_edit: QPlainTextEdit,
-                 result_statistics_plain_text_edit: QPlainTextEdit) -> None:
+                 result_statistics_plain_text_edit: QPlainTextEdit,
+                 schema_cache: Optional[SchemaCache] = None) -> None:
         self.cluster = cluster
         self.session = session
+        self.prepared_statement_cache = prepared_statement_cache
         self.key_space = key_space
         self.table = table
         self.results_plain_text_edit = results_plain_text_edit
         self.result_statistics_plain_text_edit = result_statistics_plain_text_edit
-        self.header_data = self.get_column_names()
-        self.column_types = self.get_column_types()
+        self.schema_cache = schema_cache
+        self.schema = self.get_schema()
+        self.header_data = self.schema.column_names
+        self.column_types = self.schema.columns
         self.ddl = self.get_ddl()
         self.show_result_utils = ShowResultUtils(self.results_plain_text_edit, self.result_statistics_plain_text_edit)
-        self.insert_row_utils = InsertRowUtils()
+        self.row_converter = RowConverter(self.column_types)
 
 
-    def get_ddl(self: 'CassandraTableManager') -> Union[ResultSet, Exception]:
+    def get_schema(self: 'CassandraTableManager') -> TableSchema:
+        try:
+            return TableSchema.load(self.cluster, self.session, self.key_space, self.table, self.schema_cache)
+        except Exception as error_message:
+            pop_up_error(ErrorTitles.Db_Cassandra_error.value, error_message)
+            return TableSchema(self.key_space, self.table, [], [])
+
+    def get_ddl(self: 'CassandraTableManager') -> Optional[str]:
+        if self.schema.ddl:
+            return self.schema.ddl
         try:
             query = f"DESCRIBE TABLE {self.key_space}.{self.table};"
-            return self.session.execute(query).all()
+            return "\n".join(row.create_statement for row in self.session.execute(query))
         except Exception as error_message:
             pop_up_error(ErrorTitles.Db_Cassandra_error.value, error_message)
 
-    def select_all(self: 'CassandraTableManager') -> Union[ResultSet, Exception]:
+    def select_all_statement(self: 'CassandraTableManager', page_size: int = TABLE_PAGE_SIZE) -> SimpleStatement:
+        return SimpleStatement(f"SELECT * FROM {self.key_space}.{self.table};", fetch_size=page_size)
+
+    def select_page(self: 'CassandraTableManager',
+                    statement: Statement,
+                    paging_state: Optional[bytes] = None) -> Tuple[List[Any], Optional[bytes]]:
         try:
-            query = f"SELECT * FROM {self.key_space}.{self.table};"
-            return self.session.execute(query).all()
+            result = self.session.execute(statement, paging_state=paging_state)
+            return (list(result.current_rows), result.paging_state)
         except Exception as error_message:
             pop_up_error(ErrorTitles.Db_Cassandra_error.value, error_message)
+            return ([], None)
 
-    def delete_row(self: 'CassandraTableManager', data: List[dict], row_index: int) -> None:
+    def delete_row(self: 'CassandraTableManager', row: dict) -> None:
         primary_keys, query = self.prepare_delete_query()
 
-        primary_key_values = self.get_primary_keys_values(data, row_index, primary_keys)
+        primary_key_values = self.get_primary_keys_values(row, primary_keys)
 
         try:
             self.session.execute(query, primary_key_values)
@@ -54,28 +85,21 @@ class CassandraTableManager:
             error_message = f"{ErrorTitles.Failed.value} {error_message}"
             self.show_result_utils.show_result(error_message)
 
-    def get_column_types(self: 'CassandraTableManager') -> Union[ResultSet, Exception]:
-        try:
-            query = f"""SELECT column_name, type
-                            FROM system_schema.columns
-                                WHERE keyspace_name = '{self.key_space}' AND
-                                    table_name = '{self.table}'"""
-            return self.session.execute(query).all()
-        except Exception as error_message:
-            pop_up_error(ErrorTitles.Db_Cassandra_error.value, error_message)
+    def prepare_query(self: 'CassandraTableManager', kind: StatementKind, columns: List[str], query: str) -> PreparedStatement:
+        return self.prepared_statement_cache.get(self.session, self.key_space, self.table, kind, columns, query)
 
-    def get_column_names(self: 'CassandraTableManager') -> Union[List[str], Exception]:
-        try:
-            query = f"""SELECT * FROM {self.key_space}.{self.table}"""
-            return self.session.execute(query).column_names
-        except Exception as error_message:
-            pop_up_error(ErrorTitles.Db_Cassandra_error.value, error_message)
+    def prepare_insert_query(self: 'CassandraTableManager', column_names: Optional[List[str]] = None) -> PreparedStatement:
+        column_names = column_names or self.header_data
+        return self.prepare_query(
+            StatementKind.insert,
+            column_names,
+            self.schema.get_insert_query(column_names))
 
-    def prepare_insert_query(self: 'CassandraTableManager') -> PreparedStatement:
-        return self.session.prepare(
-            f"""INSERT INTO {self.key_space}.{self.table}
-                ({", ".join(self.header_data)})
-                VALUES ({", ".join(['?' for _ in range(len(self.header_data))])});""")
+    def prepare_insert_json_query(self: 'CassandraTableManager') -> PreparedStatement:
+        return self.prepare_query(
+            StatementKind.insert_json,
+            self.header_data,
+            self.schema.get_insert_json_query())
 
     def insert_row(self: 'CassandraTableManager', query: PreparedStatement, row: List[Any]) -> Optional[Exception]:
         try:
@@ -83,6 +107,44 @@ class CassandraTableManager:
         except Exception as error_message:
             return f"""{ErrorTitles.Failed.value} {error_message}\nquery: {self.select_query(query)}\ndata: {row}\n"""
 
+    def insert_rows(self: 'CassandraTableManager',
+                    query: PreparedStatement,
+                    rows: Iterable[Any],
+                    total_rows: Optional[int] = None,
+                    progress_callback: Optional[Callable[[ProgressModel], None]] = None,
+                    is_cancelled: Optional[Callable[[], bool]] = None,
+                    concurrency: int = IMPORT_CONCURRENCY,
+                    convert_row: Optional[Callable[[Any], List[Any]]] = None,
+                    max_rows_per_second: float = IMPORT_MAX_ROWS_PER_SECOND,
+                    dead_letter_writer: Optional[DeadLetterWriter] = None) -> ImportResultModel:
+        import_engine = ImportEngine(self.session,
+                                     query,
+                                     convert_row or self.row_converter.convert_row,
+                                     concurrency,
+                                     batch_writer=PartitionBatchWriter(query),
+                                     write_throttle=WriteThrottle(max_rows_per_second, concurrency),
+                                     retry_policy=ImportRetryPolicy(),
+                                     dead_letter_writer=dead_letter_writer)
+        return import_engine.run(rows, total_rows, progress_callback, is_cancelled)
+
+    def insert_json_rows(self: 'CassandraTableManager',
+                         query: PreparedStatement,
+                         rows: Iterable[str],
+                         total_rows: Optional[int] = None,
+                         progress_callback: Optional[Callable[[ProgressModel], None]] = None,
+                         is_cancelled: Optional[Callable[[], bool]] = None,
+                         concurrency: int = IMPORT_CONCURRENCY,
+                         max_rows_per_second: float = IMPORT_MAX_ROWS_PER_SECOND,
+                         dead_letter_writer: Optional[DeadLetterWriter] = None) -> ImportResultModel:
+        import_engine = ImportEngine(self.session,
+                                     query,
+                                     lambda row: [remove_error_field(row)],
+                                     concurrency,
+                                     write_throttle=WriteThrottle(max_rows_per_second, concurrency),
+                                     retry_policy=ImportRetryPolicy(),
+                                     dead_letter_writer=dead_letter_writer)
+        return import_engine.run(rows, total_rows, progress_callback, is_cancelled)
+
     def select_query(self: 'CassandraTableManager', prepared_query: PreparedStatement) -> Union[str, PreparedStatement]:
         pattern = r'<PreparedStatement query="([^"]+)"'
         match = re.search(pattern, str(prepared_query))
@@ -95,7 +157,9 @@ class CassandraTableManager:
         primary_keys = self.get_primary_keys()
         primary_key_condition = self.get_primary_key_condition(primary_keys)
 
-        query = self.session.prepare(
+        query = self.prepare_query(
+            StatementKind.update,
+            self.header_data[len(primary_keys):] + primary_keys,
             f"""UPDATE {self.key_space}.{self.table}
                 SET
                 {self.generate_set_clauses_for_update(primary_keys)}
@@ -104,10 +168,10 @@ class CassandraTableManager:
 
         return (primary_keys, query)
 
-    def update_row(self: 'CassandraTableManager', data: List[dict], row_index: int, row: dict) -> Optional[Exception]:
-        primary_keys, query = primary_keys, query = self.prepare_update_query()
+    def update_row(self: 'CassandraTableManager', row: dict) -> Optional[Exception]:
+        primary_keys, query = self.prepare_update_query()
 
-        values = self.prepare_values_for_update_query(data, row_index, row, primary_keys)
+        values = self.prepare_values_for_update_query(row, primary_keys)
 
         try:
             self.session.execute(query, values)
@@ -118,12 +182,10 @@ class CassandraTableManager:
             self.show_result_utils.show_success()
 
     def prepare_values_for_update_query(self: 'CassandraTableManager',
-                                        data: List[dict],
-                                        row_index: int,
                                         row: dict,
                                         primary_keys: List[str]) -> List[Any]:
-        primary_key_values = self.get_primary_keys_values(data, row_index, primary_keys)
-        prepared_row = self.insert_row_utils.prepare_row(self.column_types, row)
+        primary_key_values = self.get_primary_keys_values(row, primary_keys)
+        prepared_row = self.row_converter.convert_row(row)
         primary_key_values_prepared = self.prepare_primary_keys(prepared_row, primary_key_values)
 
         return prepared_row[len(primary_key_values):] + primary_key_values_prepared
@@ -137,13 +199,12 @@ class CassandraTableManager:
         return primary_key_values_prepared
 
     def generate_set_clauses_for_update(self: 'CassandraTableManager', primary_keys: List[str]) -> str:
-        column_names = self.get_column_names()
-        return ", \n".join(f"{column} = ?" for column in column_names[len(primary_keys):])
+        return ", \n".join(f"{column} = ?" for column in self.header_data[len(primary_keys):])
 
-    def get_primary_keys_values(self: 'CassandraTableManager', data: List[dict], row_index: int, primary_keys: List[str]) -> List[str]:
+    def get_primary_keys_values(self: 'CassandraTableManager', row: dict, primary_keys: List[str]) -> List[str]:
         primary_key_values = []
         for primary_key in primary_keys:
-            primary_key_values.append(getattr(data[row_index], primary_key))
+            primary_key_values.append(row[primary_key])
         return primary_key_values
 
     def get_primary_key_condition(self: 'CassandraTableManager', primary_keys: List[str]) -> Union[str, Exception]:
@@ -152,22 +213,16 @@ class CassandraTableManager:
         conditions = " AND ".join(f"{column} = ?" for column in primary_keys)
         return conditions
 
-    def get_primary_keys(self: 'CassandraTableManager') -> Union[List[str], None]:
-        try:
-            query = f"""SELECT column_name, kind
-                            FROM system_schema.columns
-                                WHERE keyspace_name = '{self.key_space}' AND
-                                    table_name = '{self.table}'"""
-            rows = self.session.execute(query).all()
-            return [row.column_name for row in rows if row.kind == "partition_key" or row.kind == "clustering"]
-        except Exception as error_message:
-            pop_up_error(ErrorTitles.Db_Cassandra_error.value, error_message)
+    def get_primary_keys(self: 'CassandraTableManager') -> List[str]:
+        return self.schema.primary_keys
 
     def prepare_delete_query(self: 'CassandraTableManager') -> Tuple[List[str], PreparedStatement]:
         primary_keys = self.get_primary_keys()
         primary_key_condition = self.get_primary_key_condition(primary_keys)
 
-        query = self.session.prepare(
+        query = self.prepare_query(
+            StatementKind.delete,
+            primary_keys,
             f"""DELETE FROM {self.key_space}.{self.table}
                     WHERE {primary_key_condition};"""
         )
@@ -1,13 +1,18 @@
-from typing import Any, List, Union
+from typing import Any, Dict, List, Optional, Union
 from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QObject
 from PyQt6.QtWidgets import QPlainTextEdit, QTableView
 from constants.model_wrapper import ModelWrapper
 from constants.cassandra_row_list import CassandraRowList
+from constants.column_row_store import ColumnRowStore
+from constants.display_cache import DisplayCache
 from constants.show_result_utils import ShowResultUtils
-from constants.insert_row_utils import InsertRowUtils
-from constants.common import CASSANDRA_TYPE_MAPPING
+from constants.common import (TABLE_PAGE_SIZE,
+                              TABLE_MAX_ROWS_IN_MEMORY,
+                              TABLE_DISPLAY_CACHE_SIZE,
+                              TABLE_DISPLAY_MAX_LENGTH)
 from backend.table_window.cassandra_table_manager import CassandraTableManager
 from cassandra.cluster import ResultSet, PreparedStatement
+from cassandra.query import Statement
 
 
 class CassandraTableModel(QAbstractTableModel):
@@ -16,16 +21,33 @@ class CassandraTableModel(QAbstractTableModel):
                  results_plain_text_edit: QPlainTextEdit,
                  result_statistics_plain_text_edit: QPlainTextEdit,
                  parent: QObject = None,
-                 new_data: ResultSet = None) -> None:
+                 new_data: ResultSet = None,
+                 page_size: int = TABLE_PAGE_SIZE,
+                 max_rows_in_memory: int = TABLE_MAX_ROWS_IN_MEMORY,
+                 statement: Optional[Statement] = None,
+                 paging_state: Optional[bytes] = None,
+                 display_max_length: int = TABLE_DISPLAY_MAX_LENGTH,
+                 column_names: Optional[List[str]] = None) -> None:
         super().__init__(parent)
         self.cassandra_manager = cassandra_manager
-        self.data = new_data or self.cassandra_manager.select_all()
-        self.header_data = list(self.data[0]._asdict().keys()) if self.data else self.cassandra_manager.header_data
+        self.max_rows_in_memory = max_rows_in_memory
+        self.display_max_length = display_max_length
+        self.display_cache = DisplayCache(TABLE_DISPLAY_CACHE_SIZE)
+        self.is_query_result = new_data is not None or statement is not None
+        self.statement = statement or self.cassandra_manager.select_all_statement(page_size)
+        self.paging_state: Optional[bytes] = paging_state
+        self.is_row_limit_reached = False
+        rows = list(new_data) if new_data or statement else self.select_first_page()
+        if column_names:
+            self.header_data = list(column_names)
+        else:
+            self.header_data = list(rows[0]._fields) if rows else self.cassandra_manager.header_data
+        self.data = ColumnRowStore(self.header_data, self.get_column_types())
+        self.data.extend(rows)
         self.cassandra_row = CassandraRowList(self)
         self.edited_cells_indexes = []
         self.results_plain_text_edit = results_plain_text_edit
         self.result_statistics_plain_text_edit = result_statistics_plain_text_edit
-        self.insert_row_utils = InsertRowUtils()
         self.show_result_utils = ShowResultUtils(self.results_plain_text_edit, self.result_statistics_plain_text_edit)
 
 
@@ -35,36 +57,92 @@ class CassandraTableModel(QAbstractTableModel):
             column = index.column()
             value = self.retype_edited_value(column, value)
 
-            if isinstance(self.data[row], ModelWrapper):
-                setattr(self.data[row], self.header_data[column], value)
+            if row >= len(self.data):
+                setattr(self.cassandra_row.new_rows[row - len(self.data)], self.header_data[column], value)
             else:
-                updated_row = self.data[row]._replace(**{self.header_data[column]: value})
-                self.data[row] = updated_row
+                self.data.set_value(row, column, value)
+            self.display_cache.invalidate((row, column))
 
-            self.layoutChanged.emit()
+            self.dataChanged.emit(index, index)
             return True
         return False
 
+    def get_column_types(self: 'CassandraTableModel') -> Dict[str, Optional[str]]:
+        return {column: self.cassandra_manager.schema.get_column_type(column) for column in self.header_data}
+
+    def get_row(self: 'CassandraTableModel', row: int) -> Union[Any, ModelWrapper]:
+        if row >= len(self.data):
+            return self.cassandra_row.new_rows[row - len(self.data)]
+        return self.data[row]
+
     def retype_edited_value(self: 'CassandraTableModel', column_index: int, value: str) -> Union[Any, None]:
-        column_name = self.headerData(column_index, Qt.Orientation.Horizontal)
-        for column_type in self.cassandra_manager.column_types:
-            if column_name == column_type.column_name:
-                _type = column_type.type.split('<')[0]
-                return self.insert_row_utils.convert_column(value, CASSANDRA_TYPE_MAPPING[_type])
+        return self.cassandra_manager.row_converter.convert_value(self.header_data[column_index], value)
+
+    def select_first_page(self: 'CassandraTableModel') -> List[Any]:
+        self.is_row_limit_reached = False
+        rows, self.paging_state = self.cassandra_manager.select_page(self.statement)
+        return rows
+
+    def canFetchMore(self: 'CassandraTableModel', parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid():
+            return False
+        return self.paging_state is not None and not self.is_row_limit_reached
+
+    def fetchMore(self: 'CassandraTableModel', parent: QModelIndex = QModelIndex()) -> None:
+        if not self.canFetchMore(parent):
+            return None
+        rows, self.paging_state = self.cassandra_manager.select_page(self.statement, self.paging_state)
+        free_rows_count = self.max_rows_in_memory - len(self.data)
+        has_more_rows = self.paging_state is not None or len(rows) > free_rows_count
+        rows = rows[:free_rows_count]
+
+        if rows:
+            self.beginInsertRows(QModelIndex(), len(self.data), len(self.data) + len(rows) - 1)
+            self.data.extend(rows)
+            self.endInsertRows()
+
+        if len(self.data) >= self.max_rows_in_memory and has_more_rows:
+            self.is_row_limit_reached = True
+            self.show_result_utils.show_result(f"Row limit reached: only the first {self.max_rows_in_memory} rows are loaded.")
 
     def rowCount(self: 'CassandraTableModel', parent: QModelIndex = QModelIndex()) -> int:
-        return len(self.data) if self.data else 0
+        return len(self.data) + len(self.cassandra_row.new_rows)
 
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
-        return len(self.data[0]) if self.data else 0
+        return len(self.header_data)
 
     def data(self: 'CassandraTableModel',
              index: QModelIndex,
              role: Qt.ItemDataRole = Qt.ItemDataRole.DisplayRole) -> Union[str, None]:
-        if role == Qt.ItemDataRole.DisplayRole:
-            return str(getattr(self.data[index.row()], self.header_data[index.column()], None))
+        match role:
+            case Qt.ItemDataRole.DisplayRole:
+                return self.get_display_text(index.row(), index.column())
+            case Qt.ItemDataRole.EditRole:
+                return str(self.get_value(index.row(), index.column()))
+            case Qt.ItemDataRole.ToolTipRole:
+                text = str(self.get_value(index.row(), index.column()))
+                return text if len(text) > self.display_max_length else None
         return None
 
+    def get_value(self: 'CassandraTableModel', row: int, column: int) -> Any:
+        if row >= len(self.data):
+            return getattr(self.cassandra_row.new_rows[row - len(self.data)], self.header_data[column], None)
+        return self.data.get_value(row, column)
+
+    def get_display_text(self: 'CassandraTableModel', row: int, column: int) -> str:
+        if row >= len(self.data):
+            return self.truncate(str(self.get_value(row, column)))
+        text = self.display_cache.get((row, column))
+        if text is None:
+            text = self.truncate(str(self.data.get_value(row, column)))
+            self.display_cache.put((row, column), text)
+        return text
+
+    def truncate(self: 'CassandraTableModel', text: str) -> str:
+        if len(text) > self.display_max_length:
+            return f"{text[:self.display_max_length]}..."
+        return text
+
     def headerData(self: 'CassandraTableModel',
                    section: int,
                    orientation: Qt.Orientation,
@@ -76,7 +154,11 @@ class CassandraTableModel(QAbstractTableModel):
 
     def removeRow(self: 'CassandraTableModel', row: int, parent: QModelIndex =QModelIndex()) -> None:
         self.beginRemoveRows(parent, row, row)
-        del self.data[row]
+        self.display_cache.clear()
+        if row >= len(self.data):
+            del self.cassandra_row.new_rows[row - len(self.data)]
+        else:
+            del self.data[row]
         self.endRemoveRows()
 
     def addRow(self: 'CassandraTableModel') -> None:
@@ -84,8 +166,11 @@ class CassandraTableModel(QAbstractTableModel):
 
     def refresh(self: 'CassandraTableModel') -> None:
         self.cassandra_row.remove_rows()
-        self.data = self.cassandra_manager.select_all()
-        self.layoutChanged.emit()
+        self.beginResetModel()
+        self.display_cache.clear()
+        self.data.clear()
+        self.data.extend(self.select_first_page())
+        self.endResetModel()
 
     def clear_edited_row_indexes(self: 'CassandraTableModel') -> None:
         self.edited_cells_indexes = []
@@ -95,17 +180,20 @@ class CassandraTableModel(QAbstractTableModel):
         unique_rows = set(index.row() for index in selected_indexes)
 
         for row in sorted(unique_rows, reverse=True):
-            self.cassandra_manager.delete_row(self.data, row)
+            self.cassandra_manager.delete_row(self.get_row_dict(row))
             self.removeRow(row)
 
     def update_rows(self: 'CassandraTableModel') -> None:
         row_indexes = self.get_row_indexes()
 
         for row_index in sorted(row_indexes, reverse=True):
-            row = self.data[row_index]
-            if not isinstance(row, ModelWrapper):
-                row = row._asdict()
-            self.cassandra_manager.update_row(self.data, row_index, row)
+            self.cassandra_manager.update_row(self.get_row_dict(row_index))
+
+    def get_row_dict(self: 'CassandraTableModel', row_index: int) -> dict:
+        row = self.get_row(row_index)
+        if not isinstance(row, ModelWrapper):
+            row = row._asdict()
+        return row
 
     def get_row_indexes(self: 'CassandraTableModel') -> List[int]:
         row_indexes = set()
@@ -115,22 +203,19 @@ class CassandraTableModel(QAbstractTableModel):
         return list(row_indexes)
 
     def commit_new_rows(self: 'CassandraTableModel') -> None:
-        column_types = self.cassandra_manager.get_column_types()
         query = self.cassandra_manager.prepare_insert_query()
 
-        self.insert_rows(query, column_types)
+        self.insert_rows(query)
 
+        self.data.extend(self.cassandra_row.new_rows)
         self.cassandra_row.remove_rows()
         self.clear_edited_row_indexes()
 
-    def insert_rows(self: 'CassandraTableModel', query: PreparedStatement, column_types: List[dict]) -> None:
-        error_count = 0
-        added_rows_count = 0
-        for new_row in self.cassandra_row.new_rows:
-            error_message = self.cassandra_manager.insert_row(query, self.insert_row_utils.prepare_row(column_types, new_row))
-            if not error_message:
-                added_rows_count += 1
-            else:
-                error_count += 1
-            self.show_result_utils.show_result(error_message)
-            self.show_result_utils.show_result_statistics(added_rows_count, error_count)
\ No newline at end of file
+    def insert_rows(self: 'CassandraTableModel', query: PreparedStatement) -> None:
+        if not self.cassandra_row.new_rows:
+            return None
+        result = self.cassandra_manager.insert_rows(query, self.cassandra_row.new_rows)
+        self.show_result_utils.show_result("\n".join(result.error_messages))
+        if result.error_count > len(result.error_messages):
+            self.show_result_utils.show_result(f"{result.error_count - len(result.error_messages)} more errors not shown.")
+        self.show_result_utils.show_result_statistics(result.added_rows_count, result.error_count)
\ No newline at end of file
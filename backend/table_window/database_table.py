@@ -1,55 +1,73 @@
 import re
-from typing import List, Optional
-from PyQt6.uic import load_ui
+from typing import List
 from PyQt6.QtWidgets import QFrame, QLineEdit
-from constants.common import TABLE_UI_PATH, ErrorTitles
+from cassandra import ConsistencyLevel
+from constants.common import (TABLE_UI_PATH,
+                              ErrorTitles,
+                              QUERY_TIMEOUT,
+                              QUERY_MAX_TIMEOUT,
+                              QUERY_CONSISTENCY_LEVEL,
+                              QUERY_RESULT_MAX_SHOWN_ROWS)
 from backend.table_window.cassandra_table_manager import CassandraTableManager
 from backend.table_window.cassandra_table_model import CassandraTableModel
 from backend.table_window.table_description_model import TableDescriptionModel
 from backend.table_window.primary_key_description import PrimaryKeyDescription
 from backend.table_window.indexes_description_model import IndexesDescription
 from constants.connection_model import Connection
-from constants.utils import pop_up_confirmation_dialog, remove_dashes, remove_empty_strings
+from constants.utils import pop_up_confirmation_dialog
+from constants.query_utils import split_queries
 from constants.common import ConfirmationMessages
 from backend.table_window.export_window import ExportWindow
 from backend.table_window.import_window import ImportWindow
 from PyQt6.QtCore import Qt, QModelIndex
+from constants.ui_loader import load_ui
 from constants.show_result_utils import ShowResultUtils
-from constants.insert_row_utils import InsertRowUtils
+from constants.results_log import ResultsLog
+from constants.query_result_model import QueryResultModel
+from backend.table_window.query_executor import QueryExecutor
 
 
 class DatabaseTable(QFrame):
     opened_windows = []
     def __init__(self: 'DatabaseTable', connection: Connection, key_space: str, table: str) -> None:
         super(DatabaseTable, self).__init__()
-        load_ui.loadUi(TABLE_UI_PATH, self)
+        load_ui(TABLE_UI_PATH, self)
         self.splitter.setSizes([50, 700, 200])
+        self.connection = connection
         self.cluster = connection.cluster
-        self.session = self.cluster.connect(keyspace=key_space)
+        self.prepared_statement_cache = connection.prepared_statement_cache
+        self.session = connection.get_session()
         self.key_space = key_space
         self.table = table
         self.cassandra_manager = CassandraTableManager(self.cluster,
                                                        self.session,
+                                                       self.prepared_statement_cache,
                                                        self.key_space,
                                                        self.table,
                                                        self.results_plain_text_edit,
-                                                       self.result_statistics_plain_text_edit)
+                                                       self.result_statistics_plain_text_edit,
+                                                       self.connection.get_schema_cache())
         self.original_cassandra_model = CassandraTableModel(self.cassandra_manager,
                                                             self.results_plain_text_edit,
-                                                            self.result_statistics_plain_text_edit)
+                                                            self.result_statistics_plain_text_edit,
+                                                            page_size=self.connection.fetch_size)
         self.cassandra_model = self.original_cassandra_model
+        self.connect_paging_signals(self.cassandra_model)
         self.table_description_model = TableDescriptionModel(self.cassandra_manager)
         self.primary_key_description_model = PrimaryKeyDescription(self.cassandra_manager)
         self.indexes_description_model = IndexesDescription(self.cassandra_manager)
 
         self.show_result_utils = ShowResultUtils(self.results_plain_text_edit, self.result_statistics_plain_text_edit)
-        self.insert_row_utils = InsertRowUtils()
+        self.query_executor = QueryExecutor(self.connection, self.key_space)
+        self.query_executor.query_finished.connect(self.show_query_result)
+        self.query_executor.execution_finished.connect(self.query_execution_finished)
 
         self.set_up_database_data_view(self.cassandra_model)
         self.set_up_table_description_data(self.table_description_model)
         self.set_up_primary_key_description_data(self.primary_key_description_model)
         self.set_up_indexes_description_data(self.indexes_description_model)
         self.set_up_ddl_description()
+        self.set_up_query_options()
 
         self.delete_push_button.clicked.connect(
             lambda: pop_up_confirmation_dialog(
@@ -59,6 +77,7 @@ class DatabaseTable(QFrame):
             )
         )
         self.refresh_push_button.clicked.connect(self.refresh)
+        self.load_next_page_push_button.clicked.connect(self.load_next_page)
         self.cancel_edit_push_button.clicked.connect(self.refresh)
         self.commit_push_button.clicked.connect(self.commit)
         self.add_row_push_button.clicked.connect(self.add_row)
@@ -67,6 +86,7 @@ class DatabaseTable(QFrame):
         self.clear_results_push_button.clicked.connect(self.show_result_utils.clear_results)
         self.table_view.doubleClicked.connect(self.handle_double_clicked)
         self.execute_push_button.clicked.connect(self.execute)
+        self.cancel_query_push_button.clicked.connect(self.query_executor.cancel)
         self.clear_editor_push_button.clicked.connect(self.clear_cql_editor)
 
 
@@ -76,37 +96,63 @@ class DatabaseTable(QFrame):
         window.show()
 
     def import_popup_window(self: 'DatabaseTable') -> None:
-        window = ImportWindow(self.cassandra_manager, self.cassandra_model, self.results_plain_text_edit, self.result_statistics_plain_text_edit)
+        window = ImportWindow(self.cassandra_manager,
+                              self.cassandra_model,
+                              self.results_plain_text_edit,
+                              self.result_statistics_plain_text_edit,
+                              self.connection.connection_profile)
         DatabaseTable.opened_windows.append(window)
         window.show()
 
+    def close_results_log(self: 'DatabaseTable') -> None:
+        ResultsLog.close_for_widget(self.results_plain_text_edit)
+
     def clear_cql_editor(self: 'DatabaseTable') -> None:
         self.query_plain_text_edit.setPlainText("")
 
-    def set_key_space_to_session(self: 'DatabaseTable') -> None:
-        if self.key_space is not None:
-            self.session.set_keyspace(self.key_space)
+    def set_up_query_options(self: 'DatabaseTable') -> None:
+        self.timeout_spin_box.setMaximum(QUERY_MAX_TIMEOUT)
+        self.timeout_spin_box.setValue(QUERY_TIMEOUT)
+        self.consistency_combo_box.addItems([ConsistencyLevel.value_to_name[value] for value in sorted(ConsistencyLevel.value_to_name)])
+        self.consistency_combo_box.setCurrentText(QUERY_CONSISTENCY_LEVEL)
 
     def set_up_database_data_view(self: 'DatabaseTable', model: CassandraTableModel) -> None:
         self.table_view.setModel(model)
         self.table_view.resizeColumnsToContents()
+        self.update_load_next_page_button()
+
+    def connect_paging_signals(self: 'DatabaseTable', model: CassandraTableModel) -> None:
+        model.rowsInserted.connect(self.update_load_next_page_button)
+        model.modelReset.connect(self.update_load_next_page_button)
+
+    def update_load_next_page_button(self: 'DatabaseTable') -> None:
+        self.load_next_page_push_button.setEnabled(self.cassandra_model.canFetchMore())
+
+    def load_next_page(self: 'DatabaseTable') -> None:
+        self.cassandra_model.fetchMore()
+        self.update_load_next_page_button()
 
     def prepare_queries(self: 'DatabaseTable') -> List[str]:
-        queries_from_cql_editor = self.query_plain_text_edit.toPlainText()
-        queries = remove_dashes(queries_from_cql_editor.split('\n'))
-        return remove_empty_strings(' '.join(queries).split(';'))
+        return split_queries(self.query_plain_text_edit.toPlainText())
 
-    def set_table(self: 'DatabaseTable', key_space: str, table: str, data: List[dict] = None) -> None:
+    def set_table(self: 'DatabaseTable', key_space: str, table: str, result: QueryResultModel) -> None:
         self.cassandra_manager = CassandraTableManager(self.cluster,
-                                                       self.session,
+                                                       result.session or self.session,
+                                                       self.prepared_statement_cache,
                                                        key_space,
                                                        table,
                                                        self.results_plain_text_edit,
-                                                       self.result_statistics_plain_text_edit)
+                                                       self.result_statistics_plain_text_edit,
+                                                       self.connection.get_schema_cache())
         self.cassandra_model = CassandraTableModel(self.cassandra_manager,
                                                    self.results_plain_text_edit,
                                                    self.result_statistics_plain_text_edit,
-                                                   new_data=data)
+                                                   new_data=result.rows,
+                                                   page_size=self.connection.fetch_size,
+                                                   statement=result.statement,
+                                                   paging_state=result.paging_state,
+                                                   column_names=result.column_names)
+        self.connect_paging_signals(self.cassandra_model)
 
     def extract_key_space_from_query(self: 'DatabaseTable', query: str) -> str:
         pattern = r'from ([^.]+)\.(\w+)'
@@ -128,28 +174,50 @@ class DatabaseTable(QFrame):
             table = match.group(2)
         return table
 
-    def check_for_select(self: 'DatabaseTable', query: str, data: List[dict] = None) -> None:
-        if "select" in query.lower():
-            key_space = self.extract_key_space_from_query(query) or self.key_space
-            table = self.extract_table_from_query(query)
+    def check_for_select(self: 'DatabaseTable', result: QueryResultModel) -> bool:
+        if "select" in result.query.lower():
+            key_space = self.extract_key_space_from_query(result.query) or self.key_space
+            table = self.extract_table_from_query(result.query)
             if key_space and table:
-                self.set_table(key_space, table, data)
+                self.set_table(key_space, table, result)
                 self.set_up_database_data_view(self.cassandra_model)
+                return True
+        return False
+
+    def execute(self: 'DatabaseTable') -> None:
+        queries = self.prepare_queries()
+        if not queries:
+            return None
+        self.set_query_running(True)
+        self.query_executor.execute(queries,
+                                    self.timeout_spin_box.value(),
+                                    ConsistencyLevel.name_to_value[self.consistency_combo_box.currentText()])
+
+    def show_query_result(self: 'DatabaseTable', result: QueryResultModel) -> None:
+        elapsed_time = f"elapsed: {result.elapsed_seconds:.3f} s"
+        if result.error_message is not None:
+            error_message = f"{ErrorTitles.Failed.value} {result.error_message}\nquery: {result.query}\n{elapsed_time}\n"
+            self.show_result_utils.show_result(error_message)
+            return None
+
+        self.show_result_utils.show_success()
+        more_rows = ", more rows available" if result.paging_state else ""
+        self.show_result_utils.show_result(f"query: {result.query}\nrows: {len(result.rows)}{more_rows}\n{elapsed_time}\n")
 
-    def execute(self: 'DatabaseTable') -> Optional[Exception]:
-        for query in self.prepare_queries():
-            try:
-                result = self.session.execute(query).all()
-            except Exception as error_message:
-                error_message = f"{ErrorTitles.Failed.value} {error_message}\nquery: {query}\n"
-                self.show_result_utils.show_result(error_message)
-            else:
-                self.show_result_utils.show_success()
+        if not self.check_for_select(result):
+            for item in result.rows[:QUERY_RESULT_MAX_SHOWN_ROWS]:
+                self.show_result_utils.show_result(str(item))
+            if len(result.rows) > QUERY_RESULT_MAX_SHOWN_ROWS:
+                self.show_result_utils.show_result(f"{len(result.rows) - QUERY_RESULT_MAX_SHOWN_ROWS} more rows not shown.")
 
-                self.check_for_select(query, result)
+    def query_execution_finished(self: 'DatabaseTable', is_cancelled: bool) -> None:
+        self.set_query_running(False)
+        if is_cancelled:
+            self.show_result_utils.show_result("Execution cancelled.")
 
-                for item in result:
-                    self.show_result_utils.show_result(str(item))
+    def set_query_running(self: 'DatabaseTable', is_running: bool) -> None:
+        self.execute_push_button.setEnabled(not is_running)
+        self.cancel_query_push_button.setEnabled(is_running)
 
     def refresh(self: 'DatabaseTable') -> None:
         self.cassandra_model = self.original_cassandra_model
@@ -167,7 +235,7 @@ class DatabaseTable(QFrame):
             self.register_edited_cell(original_value, index)
 
     def register_edited_cell(self: 'DatabaseTable', original_value: str, index: QModelIndex) -> None:
-        edited_value = index.data(Qt.ItemDataRole.DisplayRole)
+        edited_value = index.data(Qt.ItemDataRole.EditRole)
         if original_value != edited_value:
             self.cassandra_model.edited_cells_indexes.append(index)
 
@@ -175,7 +243,7 @@ class DatabaseTable(QFrame):
         return len(self.cassandra_model.header_data) == len(self.cassandra_manager.header_data)
 
     def handle_double_clicked(self: 'DatabaseTable', index: QModelIndex) -> None:
-        original_value = index.data(Qt.ItemDataRole.DisplayRole)
+        original_value = index.data(Qt.ItemDataRole.EditRole)
         if original_value is not None and self.is_edit_allowed():
             self.table_view.openPersistentEditor(index)
             edit_widget = self.table_view.indexWidget(index)
@@ -211,8 +279,4 @@ class DatabaseTable(QFrame):
     def set_up_ddl_description(self: 'DatabaseTable') -> None:
         if not self.cassandra_manager.ddl:
             return None
-        create_statements: list[str] = []
-        for row in self.cassandra_manager.ddl:
-            create_statements.append(row.create_statement)
-        ddl_description = "\n".join(create_statements)
-        self.ddl_description_plain_text_edit.setPlainText(ddl_description)
\ No newline at end of file
+        self.ddl_description_plain_text_edit.setPlainText(self.cassandra_manager.ddl)
\ No newline at end of file
@@ -0,0 +1,76 @@
+import csv
+import json
+import os
+import threading
+from collections.abc import Mapping
+from typing import IO, Any, List, Optional
+from constants.common import DEAD_LETTER_SUFFIX, DEAD_LETTER_ERROR_FIELD, DEAD_LETTER_ROW_FIELD
+
+
+def get_dead_letter_path(file_path: str, is_ndjson: bool = False) -> str:
+    root, _ = os.path.splitext(file_path)
+    return f"{root}{DEAD_LETTER_SUFFIX}{'.ndjson' if is_ndjson else '.csv'}"
+
+def remove_error_field(json_row: str) -> str:
+    if DEAD_LETTER_ERROR_FIELD not in json_row:
+        return json_row
+    row = json.loads(json_row)
+    row.pop(DEAD_LETTER_ERROR_FIELD, None)
+    return json.dumps(row)
+
+
+class DeadLetterWriter:
+    def __init__(self: 'DeadLetterWriter', file_path: str, header_data: Optional[List[str]] = None) -> None:
+        self.file_path = file_path
+        self.header_data = header_data
+        self.rows_count = 0
+        self.file: Optional[IO[str]] = None
+        self.csv_writer = None
+        self.lock = threading.Lock()
+
+
+    def __enter__(self: 'DeadLetterWriter') -> 'DeadLetterWriter':
+        return self
+
+    def __exit__(self: 'DeadLetterWriter', *args: Any) -> None:
+        self.close()
+
+    def is_ndjson(self: 'DeadLetterWriter') -> bool:
+        return self.header_data is None
+
+    def open(self: 'DeadLetterWriter') -> None:
+        if self.is_ndjson():
+            self.file = open(self.file_path, "w", encoding="utf-8")
+            return None
+        self.file = open(self.file_path, "w", newline="", encoding="utf-8")
+        self.csv_writer = csv.writer(self.file)
+        self.csv_writer.writerow(self.header_data + [DEAD_LETTER_ERROR_FIELD])
+
+    def write(self: 'DeadLetterWriter', row: Any, error_message: Any) -> None:
+        error_message = str(error_message)
+        with self.lock:
+            if self.file is None:
+                self.open()
+            if self.is_ndjson():
+                json_row = self.load_json_row(row)
+                json_row[DEAD_LETTER_ERROR_FIELD] = error_message
+                self.file.write(json.dumps(json_row, default=str) + "\n")
+            else:
+                values = [row.get(column) for column in self.header_data] if isinstance(row, Mapping) else list(row)
+                self.csv_writer.writerow(values + [error_message])
+            self.rows_count += 1
+
+    def load_json_row(self: 'DeadLetterWriter', row: Any) -> dict:
+        if isinstance(row, Mapping):
+            return dict(row)
+        try:
+            json_row = json.loads(row)
+        except (TypeError, ValueError):
+            json_row = None
+        return json_row if isinstance(json_row, dict) else {DEAD_LETTER_ROW_FIELD: row}
+
+    def close(self: 'DeadLetterWriter') -> None:
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
@@ -0,0 +1,90 @@
+import csv
+from itertools import islice
+from typing import Any, Callable, Iterable, List, Optional
+from constants.common import EXPORT_BATCH_SIZE
+from constants.export_result_model import ExportResultModel
+from constants.progress_model import ProgressModel
+from constants.progress_tracker import ProgressTracker
+
+
+class ExportEngine:
+    def __init__(self: 'ExportEngine', header_data: List[str], batch_size: int = EXPORT_BATCH_SIZE) -> None:
+        self.header_data = header_data
+        self.batch_size = batch_size
+
+
+    def export_to_csv(self: 'ExportEngine',
+                      file_path: str,
+                      rows: Iterable[Any],
+                      total_rows: Optional[int] = None,
+                      progress_callback: Optional[Callable[[ProgressModel], None]] = None,
+                      is_cancelled: Optional[Callable[[], bool]] = None) -> ExportResultModel:
+        with open(file_path, "w", newline="", encoding="utf-8") as csvfile:
+            csv_writer = csv.writer(csvfile)
+            csv_writer.writerow(self.header_data)
+            return self.write_rows(
+                rows,
+                lambda batch: csv_writer.writerows([getattr(row, column, None) for column in self.header_data] for row in batch),
+                total_rows,
+                progress_callback,
+                is_cancelled)
+
+    def export_to_ndjson(self: 'ExportEngine',
+                         file_path: str,
+                         json_rows: Iterable[Any],
+                         total_rows: Optional[int] = None,
+                         progress_callback: Optional[Callable[[ProgressModel], None]] = None,
+                         is_cancelled: Optional[Callable[[], bool]] = None) -> ExportResultModel:
+        with open(file_path, "w", encoding="utf-8") as jsonfile:
+            return self.write_rows(
+                json_rows,
+                lambda batch: jsonfile.writelines(f"{row[0]}\n" for row in batch),
+                total_rows,
+                progress_callback,
+                is_cancelled)
+
+    def export_to_json(self: 'ExportEngine',
+                       file_path: str,
+                       json_rows: Iterable[Any],
+                       total_rows: Optional[int] = None,
+                       progress_callback: Optional[Callable[[ProgressModel], None]] = None,
+                       is_cancelled: Optional[Callable[[], bool]] = None) -> ExportResultModel:
+        separators = iter(["\n"])
+
+        with open(file_path, "w", encoding="utf-8") as jsonfile:
+            jsonfile.write("[")
+            result = self.write_rows(
+                json_rows,
+                lambda batch: jsonfile.write(next(separators, ",\n") + ",\n".join(row[0] for row in batch)),
+                total_rows,
+                progress_callback,
+                is_cancelled)
+            jsonfile.write("\n]\n")
+        return result
+
+    def write_rows(self: 'ExportEngine',
+                   rows: Iterable[Any],
+                   write_batch: Callable[[List[Any]], Any],
+                   total_rows: Optional[int] = None,
+                   progress_callback: Optional[Callable[[ProgressModel], None]] = None,
+                   is_cancelled: Optional[Callable[[], bool]] = None) -> ExportResultModel:
+        result = ExportResultModel()
+        progress_tracker = ProgressTracker(total_rows)
+        rows = iter(rows)
+
+        while batch := list(islice(rows, self.batch_size)):
+            if is_cancelled and is_cancelled():
+                result.is_cancelled = True
+                break
+            write_batch(batch)
+            result.exported_rows_count += len(batch)
+            progress = progress_tracker.add(len(batch))
+            if progress and progress_callback:
+                progress_callback(progress)
+
+        if close_rows := getattr(rows, "close", None):
+            close_rows()
+
+        if progress_callback:
+            progress_callback(progress_tracker.get_progress())
+        return result
@@ -1,11 +1,19 @@
-import csv
+import json
 import os
-from PyQt6.uic import load_ui
+from typing import Any, Callable, Iterator
+from PyQt6.QtGui import QCloseEvent
 from PyQt6.QtWidgets import QFrame, QFileDialog, QPlainTextEdit
+from constants.ui_loader import load_ui
 from constants.common import EXPORT_WINDOW_PATH
 from constants.utils import pop_up_error
 from constants.common import ExportTypes, ErrorTitles, RESULT_STATISTICS
+from constants.export_result_model import ExportResultModel
+from constants.model_wrapper import ModelWrapper
+from constants.progress_model import ProgressModel
 from backend.table_window.cassandra_table_model import CassandraTableModel
+from backend.table_window.export_engine import ExportEngine
+from backend.table_window.token_range_scanner import TokenRangeScanner
+from backend.table_window.transfer_worker import TransferWorker
 
 
 class ExportWindow(QFrame):
@@ -13,39 +21,132 @@ class ExportWindow(QFrame):
                  cassandra_model: CassandraTableModel,
                  result_statistics_plain_text_edit: QPlainTextEdit) -> None:
         super(ExportWindow, self).__init__()
-        load_ui.loadUi(EXPORT_WINDOW_PATH, self)
+        load_ui(EXPORT_WINDOW_PATH, self)
         self.cassandra_model = cassandra_model
         self.result_statistics_plain_text_edit = result_statistics_plain_text_edit
+        self.worker: TransferWorker = None
         self.export_push_button.clicked.connect(self.export)
         self.select_directory_push_button.clicked.connect(self.show_folder_dialog)
+        self.cancel_push_button.clicked.connect(self.cancel_export)
 
 
     def export(self: 'ExportWindow') -> None:
         match self.export_type_combo_box.currentText():
             case ExportTypes.CSV.value:
-                self.export_to_csv()
+                self.export_to_file(ExportTypes.CSV)
             case ExportTypes.JOSN.value:
-                pop_up_error("Info", "Not implemented yet.")
+                self.export_to_file(ExportTypes.JOSN)
+            case ExportTypes.NDJSON.value:
+                self.export_to_file(ExportTypes.NDJSON)
             case ExportTypes.XML.value:
                 pop_up_error("Info", "Not implemented yet.")
 
     def validate_input(self: 'ExportWindow') -> bool:
         return all([self.name_line_edit.text() != "", self.path_line_edit.text() != ""])
 
-    def export_to_csv(self: 'ExportWindow') -> None:
+    def export_to_file(self: 'ExportWindow', export_type: ExportTypes) -> None:
         if self.validate_input():
-            file_path = f"{os.path.join(self.path_line_edit.text(), self.name_line_edit.text())}.csv"
-            with open(file_path, "w", newline="", encoding="utf-8") as csvfile:
-                csv_writer = csv.DictWriter(csvfile, fieldnames=self.cassandra_model.header_data)
-                csv_writer.writeheader()
-                for count, row in enumerate(self.cassandra_model.data, 1):
-                    csv_writer.writerow(row._asdict())
-            self.result_statistics_plain_text_edit.setPlainText(f"{RESULT_STATISTICS} Successfully exported {count} rows.")
-            self.close()
+            file_path = f"{os.path.join(self.path_line_edit.text(), self.name_line_edit.text())}.{export_type.value.lower()}"
+            self.start_worker(lambda progress_callback, is_cancelled:
+                              self.export_table(file_path, export_type, progress_callback, is_cancelled))
         else:
             pop_up_error(ErrorTitles.Error.value, "'Name' and 'Path' must not be empty")
 
+    def export_table(self: 'ExportWindow',
+                     file_path: str,
+                     export_type: ExportTypes,
+                     progress_callback: Callable[[ProgressModel], None],
+                     is_cancelled: Callable[[], bool]) -> ExportResultModel:
+        if self.cassandra_model.is_query_result:
+            return self.export_query_result(file_path, export_type, progress_callback, is_cancelled)
+        cassandra_manager = self.cassandra_model.cassandra_manager
+        scanner = TokenRangeScanner(cassandra_manager.cluster,
+                                    cassandra_manager.session,
+                                    cassandra_manager.schema,
+                                    is_json=export_type != ExportTypes.CSV)
+        export_rows = self.get_export_rows(ExportEngine(scanner.columns), export_type)
+        result = export_rows(file_path, scanner.iter_rows(is_cancelled), None, progress_callback, is_cancelled)
+        result.error_messages = scanner.error_messages
+        return result
+
+    def export_query_result(self: 'ExportWindow',
+                            file_path: str,
+                            export_type: ExportTypes,
+                            progress_callback: Callable[[ProgressModel], None],
+                            is_cancelled: Callable[[], bool]) -> ExportResultModel:
+        export_rows = self.get_export_rows(ExportEngine(self.cassandra_model.header_data), export_type)
+        rows = self.iter_query_rows(export_type != ExportTypes.CSV)
+        return export_rows(file_path, rows, None, progress_callback, is_cancelled)
+
+    def get_export_rows(self: 'ExportWindow', export_engine: ExportEngine, export_type: ExportTypes) -> Callable[..., ExportResultModel]:
+        match export_type:
+            case ExportTypes.JOSN:
+                return export_engine.export_to_json
+            case ExportTypes.NDJSON:
+                return export_engine.export_to_ndjson
+            case _:
+                return export_engine.export_to_csv
+
+    def iter_query_rows(self: 'ExportWindow', is_json: bool) -> Iterator[Any]:
+        # NOTE Only the loaded pages are in the model, so a partially loaded result is queried again from the start.
+        model = self.cassandra_model
+        rows = (model.data[row] for row in range(len(model.data)))
+        if model.paging_state is not None:
+            rows = self.iter_statement_rows()
+        for row in rows:
+            values = dict(zip(model.header_data, row))
+            yield (json.dumps(values, default=str), ) if is_json else ModelWrapper(**values)
+
+    def iter_statement_rows(self: 'ExportWindow') -> Iterator[Any]:
+        session = self.cassandra_model.cassandra_manager.session
+        result = session.execute(self.cassandra_model.statement)
+        while True:
+            yield from result.current_rows
+            if not result.has_more_pages:
+                return None
+            result = session.execute(self.cassandra_model.statement, paging_state=result.paging_state)
+
+    def start_worker(self: 'ExportWindow', job: Callable[..., Any]) -> None:
+        self.worker = TransferWorker(job)
+        self.worker.progress_changed.connect(self.show_progress)
+        self.worker.job_finished.connect(self.export_finished)
+        self.worker.job_failed.connect(self.export_failed)
+        self.set_running(True)
+        self.worker.start()
+
+    def set_running(self: 'ExportWindow', is_running: bool) -> None:
+        self.export_push_button.setEnabled(not is_running)
+        self.cancel_push_button.setEnabled(is_running)
+
+    def show_progress(self: 'ExportWindow', progress: ProgressModel) -> None:
+        self.progress_label.setText(progress.to_text())
+
+    def cancel_export(self: 'ExportWindow') -> None:
+        if self.worker:
+            self.worker.cancel()
+            self.progress_label.setText("Cancelling after the current batch...")
+
+    def export_finished(self: 'ExportWindow', result: ExportResultModel) -> None:
+        self.set_running(False)
+        message = f"{RESULT_STATISTICS} Successfully exported {result.exported_rows_count} rows."
+        if result.is_cancelled:
+            message = f"{RESULT_STATISTICS} Export cancelled after {result.exported_rows_count} rows."
+        if result.error_messages:
+            message = f"{message} {ErrorTitles.Failed.value} {len(result.error_messages)} token ranges."
+            pop_up_error(ErrorTitles.Error.value, "\n".join(result.error_messages))
+        self.result_statistics_plain_text_edit.setPlainText(message)
+        self.close()
+
+    def export_failed(self: 'ExportWindow', message: str) -> None:
+        self.set_running(False)
+        pop_up_error(ErrorTitles.Error.value, message)
+
     def show_folder_dialog(self: 'ExportWindow') -> None:
         folder_path = QFileDialog.getExistingDirectory(self, "Select File Path")
         if folder_path:
-            self.path_line_edit.setText(folder_path)
\ No newline at end of file
+            self.path_line_edit.setText(folder_path)
+
+    def closeEvent(self: 'ExportWindow', event: QCloseEvent) -> None:
+        if self.worker and self.worker.isRunning():
+            self.worker.cancel()
+        event.accept()
@@ -0,0 +1,155 @@
+import time
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+from cassandra.cluster import Session, PreparedStatement
+from cassandra.concurrent import execute_concurrent
+from cassandra.query import Statement
+from constants.common import ErrorTitles, IMPORT_CONCURRENCY, IMPORT_BATCH_SIZE, IMPORT_MAX_ERROR_MESSAGES
+from constants.import_result_model import ImportResultModel
+from constants.progress_model import ProgressModel
+from constants.progress_tracker import ProgressTracker
+from backend.table_window.partition_batch_writer import PartitionBatchWriter
+from backend.table_window.write_throttle import WriteThrottle
+from backend.table_window.import_retry_policy import ImportRetryPolicy
+from backend.table_window.dead_letter_writer import DeadLetterWriter
+
+
+class ImportEngine:
+    def __init__(self: 'ImportEngine',
+                 session: Session,
+                 query: PreparedStatement,
+                 convert_row: Callable[[Any], List[Any]],
+                 concurrency: int = IMPORT_CONCURRENCY,
+                 batch_size: int = IMPORT_BATCH_SIZE,
+                 batch_writer: Optional[PartitionBatchWriter] = None,
+                 write_throttle: Optional[WriteThrottle] = None,
+                 retry_policy: Optional[ImportRetryPolicy] = None,
+                 dead_letter_writer: Optional[DeadLetterWriter] = None) -> None:
+        self.session = session
+        self.query = query
+        self.convert_row = convert_row
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.batch_writer = batch_writer
+        self.write_throttle = write_throttle
+        self.retry_policy = retry_policy
+        self.dead_letter_writer = dead_letter_writer
+
+
+    def run(self: 'ImportEngine',
+            rows: Iterable[Any],
+            total_rows: Optional[int] = None,
+            progress_callback: Optional[Callable[[ProgressModel], None]] = None,
+            is_cancelled: Optional[Callable[[], bool]] = None) -> ImportResultModel:
+        result = ImportResultModel()
+        progress_tracker = ProgressTracker(total_rows)
+
+        for batch in self.split_into_batches(rows):
+            if is_cancelled and is_cancelled():
+                result.is_cancelled = True
+                break
+            error_count = result.error_count
+            self.execute_batch(batch, result, is_cancelled)
+            progress = progress_tracker.add(len(batch), result.error_count - error_count)
+            if progress and progress_callback:
+                progress_callback(progress)
+
+        if self.dead_letter_writer and self.dead_letter_writer.rows_count:
+            result.dead_letter_path = self.dead_letter_writer.file_path
+            result.dead_letter_rows_count = self.dead_letter_writer.rows_count
+        if progress_callback:
+            progress_callback(progress_tracker.get_progress())
+        return result
+
+    def split_into_batches(self: 'ImportEngine', rows: Iterable[Any]) -> Iterator[List[Any]]:
+        rows = iter(rows)
+        while batch := list(islice(rows, self.batch_size)):
+            yield batch
+
+    def execute_batch(self: 'ImportEngine',
+                      batch: List[Any],
+                      result: ImportResultModel,
+                      is_cancelled: Optional[Callable[[], bool]] = None) -> None:
+        rows = []
+        for row in batch:
+            try:
+                rows.append((row, self.convert_row(row)))
+            except Exception as error_message:
+                self.add_error(result, error_message, row)
+
+        statements = self.create_statements(rows, result)
+        attempt = 1
+        while statements:
+            outcomes = self.execute_statements(statements, is_cancelled)
+            self.add_not_sent(result, statements[len(outcomes):])
+            is_retry_allowed = self.retry_policy is not None and not (is_cancelled and is_cancelled())
+            retry_statements = []
+            for (statement, parameters, statement_rows), (success, outcome) in zip(statements, outcomes):
+                if success:
+                    result.added_rows_count += len(statement_rows)
+                elif is_retry_allowed and self.retry_policy.should_retry(outcome, attempt):
+                    retry_statements.append((statement, parameters, statement_rows))
+                elif is_retry_allowed and len(statement_rows) > 1:
+                    retry_statements.extend((self.query, row_parameters, [(row, row_parameters)])
+                                            for row, row_parameters in statement_rows)
+                else:
+                    for row, _ in statement_rows:
+                        self.add_error(result, outcome, row)
+
+            if retry_statements:
+                time.sleep(self.retry_policy.get_delay(attempt))
+            statements = retry_statements
+            attempt += 1
+
+    def create_statements(self: 'ImportEngine',
+                          rows: List[Tuple[Any, List[Any]]],
+                          result: ImportResultModel) -> List[Tuple[Statement, Optional[List[Any]], List[Tuple[Any, List[Any]]]]]:
+        if not self.batch_writer:
+            return [(self.query, parameters, [(row, parameters)]) for row, parameters in rows]
+        statements = self.batch_writer.create_statements(
+            rows, lambda error_message, row: self.add_error(result, error_message, row))
+        return [(statement, None, statement_rows) for statement, statement_rows in statements]
+
+    def execute_statements(self: 'ImportEngine',
+                           statements: List[Tuple[Statement, Optional[List[Any]], List[Tuple[Any, List[Any]]]]],
+                           is_cancelled: Optional[Callable[[], bool]] = None) -> List[Tuple[bool, Any]]:
+        if not self.write_throttle:
+            return execute_concurrent(self.session,
+                                      [(statement, parameters) for statement, parameters, _ in statements],
+                                      concurrency=self.concurrency,
+                                      raise_on_first_error=False)
+
+        outcomes = []
+        for window in self.write_throttle.split_into_windows(
+                [((statement, parameters), len(rows)) for statement, parameters, rows in statements]):
+            if is_cancelled and is_cancelled():
+                break
+            self.write_throttle.acquire(sum(rows_count for _, rows_count in window))
+            concurrency = self.write_throttle.concurrency
+            started = time.monotonic()
+            window_outcomes = execute_concurrent(self.session,
+                                                 [statement_and_parameters for statement_and_parameters, _ in window],
+                                                 concurrency=concurrency,
+                                                 raise_on_first_error=False)
+            self.write_throttle.record(window_outcomes, time.monotonic() - started, concurrency)
+            outcomes.extend(window_outcomes)
+        return outcomes
+
+    def add_not_sent(self: 'ImportEngine',
+                     result: ImportResultModel,
+                     statements: List[Tuple[Statement, Optional[List[Any]], List[Tuple[Any, List[Any]]]]]) -> None:
+        for _, _, statement_rows in statements:
+            result.is_cancelled = True
+            result.not_sent_rows_count += len(statement_rows)
+            if self.dead_letter_writer:
+                for row, _ in statement_rows:
+                    self.dead_letter_writer.write(row, ErrorTitles.Not_sent.value)
+
+    def add_error(self: 'ImportEngine', result: ImportResultModel, error_message: Any, row: Any) -> None:
+        result.error_count += 1
+        if self.dead_letter_writer:
+            self.dead_letter_writer.write(row, error_message)
+        if len(result.error_messages) >= IMPORT_MAX_ERROR_MESSAGES:
+            return None
+        result.error_messages.append(
+            f"""{ErrorTitles.Failed.value} {error_message}\nquery: {self.query.query_string}\ndata: {row}\n""")
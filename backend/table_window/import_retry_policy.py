@@ -0,0 +1,32 @@
+from typing import Any
+from cassandra import OperationTimedOut, ReadTimeout, Unavailable, WriteTimeout
+from cassandra.cluster import NoHostAvailable
+from cassandra.connection import ConnectionException
+from cassandra.protocol import OverloadedErrorMessage, IsBootstrappingErrorMessage
+from constants.common import IMPORT_MAX_ATTEMPTS, IMPORT_RETRY_BASE_DELAY, IMPORT_RETRY_MAX_DELAY
+
+TRANSIENT_ERRORS = (WriteTimeout,
+                    ReadTimeout,
+                    OperationTimedOut,
+                    OverloadedErrorMessage,
+                    Unavailable,
+                    IsBootstrappingErrorMessage,
+                    ConnectionException,
+                    NoHostAvailable)
+
+
+class ImportRetryPolicy:
+    def __init__(self: 'ImportRetryPolicy',
+                 max_attempts: int = IMPORT_MAX_ATTEMPTS,
+                 base_delay: float = IMPORT_RETRY_BASE_DELAY,
+                 max_delay: float = IMPORT_RETRY_MAX_DELAY) -> None:
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+
+    def should_retry(self: 'ImportRetryPolicy', error: Any, attempt: int) -> bool:
+        return attempt < self.max_attempts and isinstance(error, TRANSIENT_ERRORS)
+
+    def get_delay(self: 'ImportRetryPolicy', attempt: int) -> float:
+        return min(self.base_delay * 2 ** (attempt - 1), self.max_delay)
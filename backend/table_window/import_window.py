@@ -1,12 +1,22 @@
+import os
 import csv
-from PyQt6.uic import load_ui
+from typing import Any, Callable, Optional
+from PyQt6.QtGui import QCloseEvent
 from PyQt6.QtWidgets import QFrame, QFileDialog, QPlainTextEdit
-from constants.common import IMPORT_WINDOW_PATH, ExportTypes
+from constants.ui_loader import load_ui
+from cassandra.cluster import PreparedStatement
+from constants.common import IMPORT_WINDOW_PATH, IMPORT_PROCESSES, IMPORT_MAX_ROWS_PER_SECOND, ExportTypes, ErrorTitles
+from constants.connection_profile_model import ConnectionProfileModel
 from constants.utils import pop_up_error
+from constants.file_utils import count_lines, iter_json_array_objects, iter_ndjson_objects
 from constants.show_result_utils import ShowResultUtils
-from constants.insert_row_utils import InsertRowUtils
+from constants.import_result_model import ImportResultModel
+from constants.progress_model import ProgressModel
 from backend.table_window.cassandra_table_model import CassandraTableModel
 from backend.table_window.cassandra_table_manager import CassandraTableManager
+from backend.table_window.transfer_worker import TransferWorker
+from backend.table_window.parallel_import_engine import ParallelImportEngine
+from backend.table_window.dead_letter_writer import DeadLetterWriter, get_dead_letter_path
 
 
 class ImportWindow(QFrame):
@@ -14,25 +24,37 @@ class ImportWindow(QFrame):
                  cassandra_manager: CassandraTableManager,
                  cassandra_model: CassandraTableModel,
                  results_plain_text_edit: QPlainTextEdit,
-                 result_statistics_plain_text_edit: QPlainTextEdit) -> None:
+                 result_statistics_plain_text_edit: QPlainTextEdit,
+                 connection_profile: Optional[ConnectionProfileModel] = None) -> None:
         super(ImportWindow, self).__init__()
-        load_ui.loadUi(IMPORT_WINDOW_PATH, self)
+        load_ui(IMPORT_WINDOW_PATH, self)
         self.cassandra_manager = cassandra_manager
         self.cassandra_model = cassandra_model
+        self.connection_profile = connection_profile
         self.results_plain_text_edit = results_plain_text_edit
         self.result_statistics_plain_text_edit = result_statistics_plain_text_edit
+        self.worker: TransferWorker = None
         self.import_push_button.clicked.connect(self.import_data)
         self.select_file_push_button.clicked.connect(self.show_file_dialog)
+        self.cancel_push_button.clicked.connect(self.cancel_import)
         self.show_result_utils = ShowResultUtils(self.results_plain_text_edit, self.result_statistics_plain_text_edit)
-        self.insert_row_utils = InsertRowUtils()
+        self.set_up_processes()
 
 
+    def set_up_processes(self: 'ImportWindow') -> None:
+        self.processes_spin_box.setMaximum(os.cpu_count() or 1)
+        self.processes_spin_box.setValue(IMPORT_PROCESSES)
+        self.processes_spin_box.setEnabled(self.connection_profile is not None)
+        self.max_rows_per_second_spin_box.setValue(IMPORT_MAX_ROWS_PER_SECOND)
+
     def import_data(self: 'ImportWindow') -> None:
         match self.import_type_combo_box.currentText():
             case ExportTypes.CSV.value:
                 self.import_from_csv()
             case ExportTypes.JOSN.value:
-                pop_up_error("Info", "Not implemented yet.")
+                self.import_from_json(is_ndjson=False)
+            case ExportTypes.NDJSON.value:
+                self.import_from_json(is_ndjson=True)
             case ExportTypes.XML.value:
                 pop_up_error("Info", "Not implemented yet.")
 
@@ -42,20 +64,130 @@ class ImportWindow(QFrame):
             self.file_path_line_edit.setText(file_path)
 
     def import_from_csv(self: 'ImportWindow') -> None:
-        column_types = self.cassandra_manager.get_column_types()
-        query = self.cassandra_manager.prepare_insert_query()
-        error_count = 0
-        added_rows_count = 0
-
-        with open(self.file_path_line_edit.text(), newline='', encoding='utf-8') as csvfile:
-            csv_reader = csv.DictReader(csvfile)
-            for row in csv_reader:
-                error_message = self.cassandra_manager.insert_row(query, self.insert_row_utils.prepare_row(column_types, row))
-                if not error_message:
-                    added_rows_count += 1
-                else:
-                    error_count += 1
-                self.show_result_utils.show_result(error_message)
-                self.show_result_utils.show_result_statistics(added_rows_count, error_count)
+        file_path = self.file_path_line_edit.text()
+        processes = self.processes_spin_box.value()
+        max_rows_per_second = self.max_rows_per_second_spin_box.value()
+        if processes > 1 and self.connection_profile is not None:
+            self.start_worker(lambda progress_callback, is_cancelled:
+                              self.import_csv_file_parallel(file_path,
+                                                            processes,
+                                                            max_rows_per_second,
+                                                            progress_callback,
+                                                            is_cancelled))
+            return None
+        self.start_worker(lambda progress_callback, is_cancelled:
+                          self.import_csv_file(file_path, max_rows_per_second, progress_callback, is_cancelled))
+
+    def import_csv_file(self: 'ImportWindow',
+                        file_path: str,
+                        max_rows_per_second: float,
+                        progress_callback: Callable[[ProgressModel], None],
+                        is_cancelled: Callable[[], bool]) -> ImportResultModel:
+        total_rows = max(count_lines(file_path) - 1, 0)
+        with open(file_path, newline='', encoding='utf-8') as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, [])
+            convert_row = self.cassandra_manager.row_converter.compile_row(header)
+            query = self.cassandra_manager.prepare_insert_query(header)
+            with DeadLetterWriter(get_dead_letter_path(file_path), header) as dead_letter_writer:
+                return self.cassandra_manager.insert_rows(query,
+                                                          reader,
+                                                          total_rows,
+                                                          progress_callback,
+                                                          is_cancelled,
+                                                          convert_row=convert_row,
+                                                          max_rows_per_second=max_rows_per_second,
+                                                          dead_letter_writer=dead_letter_writer)
+
+    def import_csv_file_parallel(self: 'ImportWindow',
+                                 file_path: str,
+                                 processes: int,
+                                 max_rows_per_second: float,
+                                 progress_callback: Callable[[ProgressModel], None],
+                                 is_cancelled: Callable[[], bool]) -> ImportResultModel:
+        total_rows = max(count_lines(file_path) - 1, 0)
+        with open(file_path, newline='', encoding='utf-8') as csvfile:
+            header = next(csv.reader(csvfile), [])
+        # NOTE fails on unknown columns before the worker processes are started.
+        self.cassandra_manager.row_converter.compile_row(header)
+        import_engine = ParallelImportEngine(self.connection_profile,
+                                             self.cassandra_manager.key_space,
+                                             self.cassandra_manager.table,
+                                             processes,
+                                             max_rows_per_second)
+        return import_engine.run_csv(file_path,
+                                     self.cassandra_manager.schema.get_insert_query(header),
+                                     get_dead_letter_path(file_path),
+                                     total_rows,
+                                     progress_callback,
+                                     is_cancelled)
+
+    def import_from_json(self: 'ImportWindow', is_ndjson: bool) -> None:
+        query = self.cassandra_manager.prepare_insert_json_query()
+        file_path = self.file_path_line_edit.text()
+        max_rows_per_second = self.max_rows_per_second_spin_box.value()
+        self.start_worker(lambda progress_callback, is_cancelled:
+                          self.import_json_file(file_path, is_ndjson, query, max_rows_per_second, progress_callback, is_cancelled))
+
+    def import_json_file(self: 'ImportWindow',
+                         file_path: str,
+                         is_ndjson: bool,
+                         query: PreparedStatement,
+                         max_rows_per_second: float,
+                         progress_callback: Callable[[ProgressModel], None],
+                         is_cancelled: Callable[[], bool]) -> ImportResultModel:
+        total_rows = count_lines(file_path) if is_ndjson else None
+        with open(file_path, encoding='utf-8') as jsonfile, \
+                DeadLetterWriter(get_dead_letter_path(file_path, is_ndjson=True)) as dead_letter_writer:
+            rows = iter_ndjson_objects(jsonfile) if is_ndjson else iter_json_array_objects(jsonfile)
+            return self.cassandra_manager.insert_json_rows(query,
+                                                           rows,
+                                                           total_rows,
+                                                           progress_callback,
+                                                           is_cancelled,
+                                                           max_rows_per_second=max_rows_per_second,
+                                                           dead_letter_writer=dead_letter_writer)
+
+    def start_worker(self: 'ImportWindow', job: Callable[..., Any]) -> None:
+        self.worker = TransferWorker(job)
+        self.worker.progress_changed.connect(self.show_progress)
+        self.worker.job_finished.connect(self.import_finished)
+        self.worker.job_failed.connect(self.import_failed)
+        self.set_running(True)
+        self.worker.start()
+
+    def set_running(self: 'ImportWindow', is_running: bool) -> None:
+        self.import_push_button.setEnabled(not is_running)
+        self.cancel_push_button.setEnabled(is_running)
+
+    def show_progress(self: 'ImportWindow', progress: ProgressModel) -> None:
+        self.progress_label.setText(progress.to_text())
+
+    def cancel_import(self: 'ImportWindow') -> None:
+        if self.worker:
+            self.worker.cancel()
+            self.progress_label.setText("Cancelling after the current batch...")
+
+    def import_finished(self: 'ImportWindow', result: ImportResultModel) -> None:
+        self.set_running(False)
+        self.show_result_utils.show_result("\n".join(result.error_messages))
+        if result.error_count > len(result.error_messages):
+            self.show_result_utils.show_result(f"{result.error_count - len(result.error_messages)} more errors not shown.")
+        if result.dead_letter_path:
+            self.show_result_utils.show_result(
+                f"{result.dead_letter_rows_count} failed or not sent rows written to: {result.dead_letter_path}")
+        if result.is_cancelled:
+            self.show_result_utils.show_result(
+                f"Import cancelled, {result.not_sent_rows_count} rows of the current batch were not sent.")
+        self.show_result_utils.show_result_statistics(result.added_rows_count, result.error_count)
         self.cassandra_model.refresh()
         self.close()
+
+    def import_failed(self: 'ImportWindow', message: str) -> None:
+        self.set_running(False)
+        pop_up_error(ErrorTitles.Error.value, message)
+
+    def closeEvent(self: 'ImportWindow', event: QCloseEvent) -> None:
+        if self.worker and self.worker.isRunning():
+            self.worker.cancel()
+        event.accept()
@@ -10,17 +10,14 @@ class IndexesDescription(QAbstractTableModel):
         super().__init__(parent)
         self.cassandra_manager = cassandra_manager
         self.header_data = ["Name", "Create statement"]
-        self.ddl = self.cassandra_manager.ddl
+        self.indexes = self.cassandra_manager.schema.indexes
         self._data = []
         self.generate_data()
 
 
     def generate_data(self: 'IndexesDescription') -> None:
-        if not self.ddl:
-            return None
-        for row in self.ddl:
-            if row.type == "index":
-                self._data.append([row.name, row.create_statement])
+        for index in self.indexes:
+            self._data.append([index.name, index.create_statement])
 
     def rowCount(self: 'IndexesDescription', parent=QModelIndex()) -> int:
         return len(self._data)
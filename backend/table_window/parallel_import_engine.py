@@ -0,0 +1,179 @@
+import csv
+import logging
+import multiprocessing
+import os
+import queue
+import shutil
+from concurrent.futures import ProcessPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+from constants.common import ErrorTitles, PROGRESS_UPDATE_INTERVAL, IMPORT_MIN_BYTES_PER_PROCESS, IMPORT_MAX_ROWS_PER_SECOND
+from constants.cluster_factory import build_cluster
+from constants.connection_profile_model import ConnectionProfileModel
+from constants.file_utils import has_multiline_records, iter_lines_in_range, split_line_ranges
+from constants.import_result_model import ImportResultModel
+from constants.progress_model import ProgressModel
+from constants.progress_tracker import ProgressTracker
+from constants.row_converter import RowConverter
+from backend.table_window.import_engine import ImportEngine
+from backend.table_window.partition_batch_writer import PartitionBatchWriter
+from backend.table_window.table_schema import TableSchema
+from backend.table_window.write_throttle import WriteThrottle
+from backend.table_window.import_retry_policy import ImportRetryPolicy
+from backend.table_window.dead_letter_writer import DeadLetterWriter
+
+logger = logging.getLogger(__name__)
+
+worker_progress_queue = None
+worker_cancel_event = None
+
+
+def init_worker(progress_queue: multiprocessing.Queue, cancel_event: multiprocessing.Event) -> None:
+    global worker_progress_queue, worker_cancel_event
+    worker_progress_queue = progress_queue
+    worker_cancel_event = cancel_event
+
+def import_csv_range(connection_profile: ConnectionProfileModel,
+                     key_space: str,
+                     table: str,
+                     query_string: str,
+                     file_path: str,
+                     header: List[str],
+                     byte_range: Tuple[int, int],
+                     worker_index: int,
+                     max_rows_per_second: float,
+                     dead_letter_path: str) -> ImportResultModel:
+    cluster = build_cluster(connection_profile)
+    try:
+        session = cluster.connect()
+        schema = TableSchema.load(cluster, session, key_space, table)
+        query = session.prepare(query_string)
+        with open(file_path, "rb") as file, DeadLetterWriter(dead_letter_path, header) as dead_letter_writer:
+            import_engine = ImportEngine(session,
+                                         query,
+                                         RowConverter(schema.columns).compile_row(header),
+                                         batch_writer=PartitionBatchWriter(query),
+                                         write_throttle=WriteThrottle(max_rows_per_second),
+                                         retry_policy=ImportRetryPolicy(),
+                                         dead_letter_writer=dead_letter_writer)
+            rows = csv.reader(iter_lines_in_range(file, *byte_range))
+            return import_engine.run(rows,
+                                     progress_callback=lambda progress: worker_progress_queue.put(
+                                         (worker_index, progress.rows_done, progress.error_count)),
+                                     is_cancelled=worker_cancel_event.is_set)
+    finally:
+        cluster.shutdown()
+
+
+class ParallelImportEngine:
+    def __init__(self: 'ParallelImportEngine',
+                 connection_profile: ConnectionProfileModel,
+                 key_space: str,
+                 table: str,
+                 processes: int,
+                 max_rows_per_second: float = IMPORT_MAX_ROWS_PER_SECOND,
+                 min_bytes_per_process: int = IMPORT_MIN_BYTES_PER_PROCESS) -> None:
+        self.connection_profile = connection_profile
+        self.key_space = key_space
+        self.table = table
+        self.processes = processes
+        self.max_rows_per_second = max_rows_per_second
+        self.min_bytes_per_process = min_bytes_per_process
+
+
+    def run_csv(self: 'ParallelImportEngine',
+                file_path: str,
+                query_string: str,
+                dead_letter_path: str,
+                total_rows: Optional[int] = None,
+                progress_callback: Optional[Callable[[ProgressModel], None]] = None,
+                is_cancelled: Optional[Callable[[], bool]] = None) -> ImportResultModel:
+        with open(file_path, "rb") as file:
+            header = next(csv.reader([file.readline().decode("utf-8")]), [])
+            data_start, file_size = file.tell(), file.seek(0, 2)
+        processes = max(min(self.processes, (file_size - data_start) // self.min_bytes_per_process), 1)
+        if processes > 1 and has_multiline_records(file_path):
+            logger.warning("%s has quoted fields spanning lines and can not be split, importing with a single process.",
+                           file_path)
+            processes = 1
+        byte_ranges = split_line_ranges(file_path, processes, data_start)
+
+        context = multiprocessing.get_context("spawn")
+        progress_queue, cancel_event = context.Queue(), context.Event()
+        progress_tracker = ProgressTracker(total_rows)
+        workers_progress: Dict[int, Tuple[int, int]] = {}
+
+        with ProcessPoolExecutor(max_workers=max(len(byte_ranges), 1),
+                                 mp_context=context,
+                                 initializer=init_worker,
+                                 initargs=(progress_queue, cancel_event)) as executor:
+            futures = [executor.submit(import_csv_range,
+                                       self.connection_profile,
+                                       self.key_space,
+                                       self.table,
+                                       query_string,
+                                       file_path,
+                                       header,
+                                       byte_range,
+                                       worker_index,
+                                       self.max_rows_per_second / len(byte_ranges),
+                                       f"{dead_letter_path}.{worker_index}")
+                       for worker_index, byte_range in enumerate(byte_ranges)]
+
+            while wait(futures, timeout=PROGRESS_UPDATE_INTERVAL).not_done:
+                if is_cancelled and is_cancelled():
+                    cancel_event.set()
+                progress = self.collect_progress(progress_queue, progress_tracker, workers_progress)
+                if progress and progress_callback:
+                    progress_callback(progress)
+
+        self.collect_progress(progress_queue, progress_tracker, workers_progress)
+        if progress_callback:
+            progress_callback(progress_tracker.get_progress())
+        result = self.merge_results(futures)
+        self.merge_dead_letters(result, dead_letter_path, futures)
+        return result
+
+    def collect_progress(self: 'ParallelImportEngine',
+                         progress_queue: multiprocessing.Queue,
+                         progress_tracker: ProgressTracker,
+                         workers_progress: Dict[int, Tuple[int, int]]) -> Optional[ProgressModel]:
+        progress = None
+        while True:
+            try:
+                worker_index, rows_done, error_count = progress_queue.get_nowait()
+            except queue.Empty:
+                return progress
+            previous_rows_done, previous_error_count = workers_progress.get(worker_index, (0, 0))
+            workers_progress[worker_index] = (rows_done, error_count)
+            progress = progress_tracker.add(rows_done - previous_rows_done, error_count - previous_error_count) or progress
+
+    def merge_results(self: 'ParallelImportEngine', futures: list) -> ImportResultModel:
+        result = ImportResultModel()
+        for future in futures:
+            try:
+                worker_result = future.result()
+            except Exception as error_message:
+                result.error_count += 1
+                result.error_messages.append(f"{ErrorTitles.Failed.value} {error_message}\n")
+                continue
+            result.added_rows_count += worker_result.added_rows_count
+            result.error_count += worker_result.error_count
+            result.error_messages.extend(worker_result.error_messages)
+            result.dead_letter_rows_count += worker_result.dead_letter_rows_count
+            result.not_sent_rows_count += worker_result.not_sent_rows_count
+            result.is_cancelled = result.is_cancelled or worker_result.is_cancelled
+        return result
+
+    def merge_dead_letters(self: 'ParallelImportEngine', result: ImportResultModel, dead_letter_path: str, futures: list) -> None:
+        part_paths = [future.result().dead_letter_path for future in futures
+                      if future.exception() is None and future.result().dead_letter_path]
+        if not part_paths:
+            return None
+        with open(dead_letter_path, "wb") as dead_letter_file:
+            for index, part_path in enumerate(part_paths):
+                with open(part_path, "rb") as part_file:
+                    if index > 0:
+                        part_file.readline()
+                    shutil.copyfileobj(part_file, dead_letter_file)
+                os.remove(part_path)
+        result.dead_letter_path = dead_letter_path
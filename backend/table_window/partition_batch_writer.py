@@ -0,0 +1,61 @@
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+from cassandra.query import BatchStatement, BatchType, BoundStatement, PreparedStatement, Statement
+from constants.common import IMPORT_MAX_BATCH_BYTES, IMPORT_MAX_BATCH_STATEMENTS
+
+
+class PartitionBatchWriter:
+    def __init__(self: 'PartitionBatchWriter',
+                 query: PreparedStatement,
+                 max_batch_bytes: int = IMPORT_MAX_BATCH_BYTES,
+                 max_batch_statements: int = IMPORT_MAX_BATCH_STATEMENTS) -> None:
+        self.query = query
+        self.max_batch_bytes = max_batch_bytes
+        self.max_batch_statements = max_batch_statements
+
+
+    def create_statements(self: 'PartitionBatchWriter',
+                          rows: List[Tuple[Any, List[Any]]],
+                          on_error: Callable[[Exception, Any], None]) -> List[Tuple[Statement, List[Tuple[Any, List[Any]]]]]:
+        statements = []
+        partitions: Dict[bytes, List[Tuple[BoundStatement, Tuple[Any, List[Any]]]]] = {}
+        for row, parameters in rows:
+            try:
+                bound_statement = self.query.bind(parameters)
+            except Exception as error_message:
+                on_error(error_message, row)
+                continue
+            routing_key = bound_statement.routing_key
+            if routing_key is None:
+                statements.append((bound_statement, [(row, parameters)]))
+            else:
+                partitions.setdefault(routing_key, []).append((bound_statement, (row, parameters)))
+
+        for partition in partitions.values():
+            statements.extend(self.split_partition(partition))
+        return statements
+
+    def split_partition(self: 'PartitionBatchWriter',
+                        partition: List[Tuple[BoundStatement, Tuple[Any, List[Any]]]]) -> Iterator[Tuple[Statement, List[Tuple[Any, List[Any]]]]]:
+        chunk, chunk_bytes = [], 0
+        for bound_statement, row in partition:
+            statement_bytes = self.get_statement_bytes(bound_statement)
+            if chunk and (chunk_bytes + statement_bytes > self.max_batch_bytes or len(chunk) >= self.max_batch_statements):
+                yield self.create_batch(chunk)
+                chunk, chunk_bytes = [], 0
+            chunk.append((bound_statement, row))
+            chunk_bytes += statement_bytes
+        if chunk:
+            yield self.create_batch(chunk)
+
+    def create_batch(self: 'PartitionBatchWriter',
+                     chunk: List[Tuple[BoundStatement, Tuple[Any, List[Any]]]]) -> Tuple[Statement, List[Tuple[Any, List[Any]]]]:
+        if len(chunk) == 1:
+            bound_statement, row = chunk[0]
+            return (bound_statement, [row])
+        batch = BatchStatement(batch_type=BatchType.UNLOGGED)
+        for bound_statement, _ in chunk:
+            batch.add(bound_statement)
+        return (batch, [row for _, row in chunk])
+
+    def get_statement_bytes(self: 'PartitionBatchWriter', bound_statement: BoundStatement) -> int:
+        return sum(len(value) for value in bound_statement.values if isinstance(value, bytes))
@@ -0,0 +1,96 @@
+import time
+from collections import deque
+from typing import Any, List, Optional
+from PyQt6.QtCore import QObject, pyqtSignal
+from cassandra.cluster import ResponseFuture
+from constants.common import QUERY_TIMEOUT
+from constants.connection_model import Connection
+from constants.query_result_model import QueryResultModel
+
+
+class QueryExecutor(QObject):
+    query_finished = pyqtSignal(object)
+    execution_finished = pyqtSignal(bool)
+    statement_done = pyqtSignal(int, object)
+
+    def __init__(self: 'QueryExecutor', connection: Connection, key_space: Optional[str]) -> None:
+        super().__init__()
+        self.connection = connection
+        self.key_space = key_space
+        self.queries = deque()
+        self.generation = 0
+        self.is_running = False
+        self.timeout = QUERY_TIMEOUT
+        self.consistency_level = None
+        self.statement_done.connect(self.handle_statement_done)
+
+
+    def execute(self: 'QueryExecutor', queries: List[str], timeout: float = QUERY_TIMEOUT, consistency_level: Optional[int] = None) -> None:
+        self.generation += 1
+        self.queries = deque(queries)
+        self.timeout = timeout
+        self.consistency_level = consistency_level
+        self.is_running = True
+        self.start_next_query()
+
+    def cancel(self: 'QueryExecutor') -> None:
+        if not self.is_running:
+            return None
+        # NOTE The driver cannot abort a request in flight, its result is ignored instead.
+        self.generation += 1
+        self.queries.clear()
+        self.is_running = False
+        self.execution_finished.emit(True)
+
+    def start_next_query(self: 'QueryExecutor') -> None:
+        if not self.queries:
+            self.is_running = False
+            self.execution_finished.emit(False)
+            return None
+
+        query = self.queries.popleft()
+        generation = self.generation
+        started = time.perf_counter()
+        try:
+            future = self.connection.execute_async(query, self.key_space, self.timeout, self.consistency_level)
+        except Exception as error_message:
+            self.handle_statement_done(generation, QueryResultModel(query, error_message=error_message))
+            return None
+
+        future.add_callbacks(self.on_page,
+                             self.on_error,
+                             callback_args=(generation, future, query, started),
+                             errback_args=(generation, query, started))
+
+    def on_page(self: 'QueryExecutor',
+                rows: Optional[List[Any]],
+                generation: int,
+                future: ResponseFuture,
+                query: str,
+                started: float) -> None:
+        if generation != self.generation:
+            return None
+        result = future.result()
+        self.emit_statement_done(generation, QueryResultModel(query,
+                                                              list(result.current_rows),
+                                                              None,
+                                                              time.perf_counter() - started,
+                                                              future.session,
+                                                              future.query,
+                                                              result.paging_state,
+                                                              result.column_names))
+
+    def on_error(self: 'QueryExecutor', error_message: Exception, generation: int, query: str, started: float) -> None:
+        self.emit_statement_done(generation, QueryResultModel(query, None, error_message, time.perf_counter() - started))
+
+    def emit_statement_done(self: 'QueryExecutor', generation: int, result: QueryResultModel) -> None:
+        try:
+            self.statement_done.emit(generation, result)
+        except RuntimeError:
+            pass
+
+    def handle_statement_done(self: 'QueryExecutor', generation: int, result: QueryResultModel) -> None:
+        if generation != self.generation:
+            return None
+        self.query_finished.emit(result)
+        self.start_next_query()
@@ -0,0 +1,112 @@
+from typing import List, Optional
+from cassandra.cluster import Cluster, Session
+from cassandra.metadata import TableMetadata
+from constants.common import ColumnKind, OrderBy
+from constants.column_schema_model import ColumnSchemaModel
+from constants.index_schema_model import IndexSchemaModel
+from constants.schema_cache import SchemaCache, create_index_schema
+
+
+class TableSchema:
+    def __init__(self: 'TableSchema',
+                 key_space: str,
+                 table: str,
+                 columns: List[ColumnSchemaModel],
+                 indexes: List[IndexSchemaModel],
+                 ddl: Optional[str] = None) -> None:
+        self.key_space = key_space
+        self.table = table
+        self.columns = self.sort_columns(columns)
+        self.indexes = indexes
+        self.ddl = ddl
+        self.column_names = [column.column_name for column in self.columns]
+        self.partition_keys = self.get_column_names_by_kind(ColumnKind.partition_key)
+        self.clustering_keys = self.get_column_names_by_kind(ColumnKind.clustering)
+        self.primary_keys = self.partition_keys + self.clustering_keys
+
+
+    @classmethod
+    def load(cls: 'TableSchema',
+             cluster: Cluster,
+             session: Session,
+             key_space: str,
+             table: str,
+             schema_cache: Optional[SchemaCache] = None) -> 'TableSchema':
+        key_space_metadata = cluster.metadata.keyspaces.get(key_space)
+        table_metadata = key_space_metadata.tables.get(table) if key_space_metadata else None
+        if table_metadata is not None:
+            return cls.from_metadata(table_metadata)
+        table_entry = schema_cache.get_table(key_space, table) if schema_cache else None
+        if table_entry is not None:
+            columns, indexes = table_entry
+            return cls(key_space, table, columns, list(indexes))
+        return cls.from_system_schema(session, key_space, table)
+
+    @classmethod
+    def from_metadata(cls: 'TableSchema', table_metadata: TableMetadata) -> 'TableSchema':
+        partition_keys = [column.name for column in table_metadata.partition_key]
+        clustering_keys = [column.name for column in table_metadata.clustering_key]
+        columns = []
+        for column in table_metadata.columns.values():
+            kind, position = ColumnKind.regular.value, -1
+            if column.name in partition_keys:
+                kind, position = ColumnKind.partition_key.value, partition_keys.index(column.name)
+            elif column.name in clustering_keys:
+                kind, position = ColumnKind.clustering.value, clustering_keys.index(column.name)
+            elif column.is_static:
+                kind = ColumnKind.static.value
+            clustering_order = "none"
+            if kind == ColumnKind.clustering.value:
+                clustering_order = "desc" if column.is_reversed else "asc"
+            columns.append(ColumnSchemaModel(column.name, column.cql_type, kind, position, clustering_order))
+
+        indexes = [IndexSchemaModel(index.name, f"{index.as_cql_query()};")
+                   for index in table_metadata.indexes.values()]
+
+        return cls(table_metadata.keyspace_name, table_metadata.name, columns, indexes, table_metadata.export_as_string())
+
+    @classmethod
+    def from_system_schema(cls: 'TableSchema', session: Session, key_space: str, table: str) -> 'TableSchema':
+        column_rows = session.execute(
+            """SELECT column_name, clustering_order, kind, position, type
+                    FROM system_schema.columns
+                        WHERE keyspace_name = %s AND table_name = %s""",
+            (key_space, table))
+        columns = [ColumnSchemaModel(row.column_name, row.type, row.kind, row.position, row.clustering_order)
+                   for row in column_rows]
+
+        index_rows = session.execute(
+            """SELECT index_name, options
+                    FROM system_schema.indexes
+                        WHERE keyspace_name = %s AND table_name = %s""",
+            (key_space, table))
+        indexes = [create_index_schema(key_space, table, row.index_name, row.options) for row in index_rows]
+
+        return cls(key_space, table, columns, indexes)
+
+    def sort_columns(self: 'TableSchema', columns: List[ColumnSchemaModel]) -> List[ColumnSchemaModel]:
+        kinds_order = [kind.value for kind in ColumnKind]
+        return sorted(columns, key=lambda column: (kinds_order.index(column.kind), column.position, column.column_name))
+
+    def get_column_names_by_kind(self: 'TableSchema', kind: ColumnKind) -> List[str]:
+        return [column.column_name for column in self.columns if column.kind == kind.value]
+
+    def get_column_type(self: 'TableSchema', column_name: str) -> Optional[str]:
+        for column in self.columns:
+            if column.column_name == column_name:
+                return column.type
+        return None
+
+    def get_clustering_order(self: 'TableSchema') -> List[str]:
+        order_by = {"asc": OrderBy.ASC.value, "desc": OrderBy.DESC.value}
+        return [f"{column.column_name} {order_by.get(column.clustering_order, OrderBy.ASC.value)}"
+                for column in self.columns if column.kind == ColumnKind.clustering.value]
+
+    def get_insert_query(self: 'TableSchema', column_names: Optional[List[str]] = None) -> str:
+        column_names = column_names or self.column_names
+        return f"""INSERT INTO {self.key_space}.{self.table}
+                ({", ".join(column_names)})
+                VALUES ({", ".join(['?' for _ in range(len(column_names))])});"""
+
+    def get_insert_json_query(self: 'TableSchema') -> str:
+        return f"INSERT INTO {self.key_space}.{self.table} JSON ? DEFAULT UNSET;"
@@ -0,0 +1,159 @@
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+from cassandra.cluster import Cluster, Session, PreparedStatement
+from cassandra.query import SimpleStatement, Statement
+from constants.common import (TOKEN_RANGE_BOUNDS,
+                              EXPORT_PARALLELISM,
+                              EXPORT_PAGE_SIZE,
+                              EXPORT_RANGES_PER_WORKER,
+                              EXPORT_MAX_RETRIES,
+                              EXPORT_RETRY_BACKOFF,
+                              ErrorTitles)
+from constants.latency_stats import LatencyStats
+from backend.table_window.table_schema import TableSchema
+from backend.table_window.import_retry_policy import TRANSIENT_ERRORS
+
+
+class TokenRangeScanner:
+    def __init__(self: 'TokenRangeScanner',
+                 cluster: Cluster,
+                 session: Session,
+                 schema: TableSchema,
+                 columns: Optional[List[str]] = None,
+                 parallelism: int = EXPORT_PARALLELISM,
+                 page_size: int = EXPORT_PAGE_SIZE,
+                 max_retries: int = EXPORT_MAX_RETRIES,
+                 is_json: bool = False,
+                 latency_stats: Optional[LatencyStats] = None) -> None:
+        self.cluster = cluster
+        self.session = session
+        self.schema = schema
+        self.columns = columns or schema.column_names
+        self.parallelism = parallelism
+        self.page_size = page_size
+        self.max_retries = max_retries
+        self.is_json = is_json
+        self.latency_stats = latency_stats
+        self.error_messages: List[str] = []
+
+
+    def get_token_ranges(self: 'TokenRangeScanner') -> List[Optional[Tuple[int, int]]]:
+        bounds = TOKEN_RANGE_BOUNDS.get(self.cluster.metadata.partitioner)
+        if bounds is None or not self.schema.partition_keys:
+            return [None]
+        min_token, max_token = bounds
+
+        token_map = self.cluster.metadata.token_map
+        ring = sorted({token.value for token in token_map.ring}) if token_map else []
+        boundaries = [min_token] + [token for token in ring if min_token < token < max_token] + [max_token]
+        ranges = list(zip(boundaries[:-1], boundaries[1:]))
+
+        return self.split_token_ranges(ranges, self.parallelism * EXPORT_RANGES_PER_WORKER)
+
+    def split_token_ranges(self: 'TokenRangeScanner',
+                           ranges: List[Tuple[int, int]],
+                           min_ranges_count: int) -> List[Tuple[int, int]]:
+        if len(ranges) >= min_ranges_count:
+            return ranges
+        splits = -(-min_ranges_count // len(ranges))
+        split_ranges = []
+        for start, end in ranges:
+            step = max((end - start) // splits, 1)
+            boundaries = list(range(start, end, step))[:splits] + [end]
+            split_ranges.extend(zip(boundaries[:-1], boundaries[1:]))
+        return split_ranges
+
+    def prepare_query(self: 'TokenRangeScanner', token_ranges: List[Optional[Tuple[int, int]]]) -> Optional[PreparedStatement]:
+        if token_ranges == [None]:
+            return None
+        partition_keys = ", ".join(self.schema.partition_keys)
+        return self.session.prepare(
+            f"""{self.get_select_clause()}
+                FROM {self.schema.key_space}.{self.schema.table}
+                WHERE token({partition_keys}) > ? AND token({partition_keys}) <= ?""")
+
+    def get_select_clause(self: 'TokenRangeScanner') -> str:
+        return f"SELECT {'JSON ' if self.is_json else ''}{', '.join(self.columns)}"
+
+    def create_statement(self: 'TokenRangeScanner',
+                         query: Optional[PreparedStatement],
+                         token_range: Optional[Tuple[int, int]]) -> Statement:
+        if query is None:
+            return SimpleStatement(f"{self.get_select_clause()} FROM {self.schema.key_space}.{self.schema.table}",
+                                   fetch_size=self.page_size)
+        statement = query.bind(token_range)
+        statement.fetch_size = self.page_size
+        return statement
+
+    def iter_rows(self: 'TokenRangeScanner', is_cancelled: Optional[Callable[[], bool]] = None) -> Iterator[Any]:
+        token_ranges = self.get_token_ranges()
+        query = self.prepare_query(token_ranges)
+        pages = queue.Queue(maxsize=self.parallelism * 2)
+        stop_event = threading.Event()
+        finished_ranges_count = 0
+
+        executor = ThreadPoolExecutor(max_workers=self.parallelism)
+        try:
+            for token_range in token_ranges:
+                executor.submit(self.scan_token_range, query, token_range, pages, stop_event)
+            while finished_ranges_count < len(token_ranges):
+                if is_cancelled and is_cancelled():
+                    break
+                try:
+                    rows = pages.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if rows is None:
+                    finished_ranges_count += 1
+                    continue
+                yield from rows
+        finally:
+            stop_event.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def scan_token_range(self: 'TokenRangeScanner',
+                         query: Optional[PreparedStatement],
+                         token_range: Optional[Tuple[int, int]],
+                         pages: queue.Queue,
+                         stop_event: threading.Event) -> None:
+        paging_state = None
+        try:
+            statement = self.create_statement(query, token_range)
+            while not stop_event.is_set():
+                rows, paging_state = self.fetch_page(statement, paging_state)
+                self.put_page(rows, pages, stop_event)
+                if paging_state is None:
+                    break
+        except Exception as error_message:
+            self.error_messages.append(f"{ErrorTitles.Failed.value} {error_message}\ntoken range: {token_range}\n")
+        finally:
+            self.put_page(None, pages, stop_event)
+
+    def fetch_page(self: 'TokenRangeScanner',
+                   statement: Statement,
+                   paging_state: Optional[bytes]) -> Tuple[List[Any], Optional[bytes]]:
+        for attempt in range(self.max_retries + 1):
+            try:
+                started = time.monotonic()
+                result = self.session.execute(statement, paging_state=paging_state)
+                if self.latency_stats:
+                    self.latency_stats.add(time.monotonic() - started)
+                return (list(result.current_rows), result.paging_state)
+            except TRANSIENT_ERRORS:
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(EXPORT_RETRY_BACKOFF * 2 ** attempt)
+
+    def put_page(self: 'TokenRangeScanner',
+                 rows: Optional[List[Any]],
+                 pages: queue.Queue,
+                 stop_event: threading.Event) -> None:
+        while not stop_event.is_set():
+            try:
+                pages.put(rows, timeout=0.1)
+                return None
+            except queue.Full:
+                continue
@@ -0,0 +1,31 @@
+import threading
+from typing import Any, Callable
+from PyQt6.QtCore import QThread, pyqtSignal
+from constants.progress_model import ProgressModel
+
+
+class TransferWorker(QThread):
+    progress_changed = pyqtSignal(object)
+    job_finished = pyqtSignal(object)
+    job_failed = pyqtSignal(str)
+
+    def __init__(self: 'TransferWorker',
+                 job: Callable[[Callable[[ProgressModel], None], Callable[[], bool]], Any]) -> None:
+        super(TransferWorker, self).__init__()
+        self.job = job
+        self.cancel_event = threading.Event()
+
+
+    def run(self: 'TransferWorker') -> None:
+        try:
+            result = self.job(self.progress_changed.emit, self.cancel_event.is_set)
+        except Exception as error_message:
+            self.job_failed.emit(str(error_message))
+        else:
+            self.job_finished.emit(result)
+
+    def cancel(self: 'TransferWorker') -> None:
+        self.cancel_event.set()
+
+    def is_cancelled(self: 'TransferWorker') -> bool:
+        return self.cancel_event.is_set()
@@ -0,0 +1,72 @@
+import time
+from typing import Any, Iterator, List, Optional, Tuple
+from cassandra import OperationTimedOut, Unavailable, WriteTimeout
+from cassandra.cluster import NoHostAvailable
+from cassandra.protocol import OverloadedErrorMessage
+from constants.common import (IMPORT_CONCURRENCY,
+                              IMPORT_MIN_CONCURRENCY,
+                              IMPORT_INITIAL_CONCURRENCY,
+                              IMPORT_CONCURRENCY_STEP,
+                              IMPORT_BACKOFF_FACTOR,
+                              IMPORT_TARGET_LATENCY,
+                              IMPORT_THROTTLE_WINDOW)
+from constants.latency_stats import LatencyStats
+
+BACKPRESSURE_ERRORS = (WriteTimeout, OperationTimedOut, OverloadedErrorMessage, Unavailable)
+
+
+class WriteThrottle:
+    def __init__(self: 'WriteThrottle',
+                 max_rows_per_second: Optional[float] = None,
+                 max_concurrency: int = IMPORT_CONCURRENCY,
+                 min_concurrency: int = IMPORT_MIN_CONCURRENCY,
+                 initial_concurrency: int = IMPORT_INITIAL_CONCURRENCY,
+                 target_latency: float = IMPORT_TARGET_LATENCY,
+                 latency_stats: Optional[LatencyStats] = None) -> None:
+        self.max_rows_per_second = max_rows_per_second
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min(min_concurrency, max_concurrency)
+        self.concurrency = max(min(initial_concurrency, max_concurrency), self.min_concurrency)
+        self.target_latency = target_latency
+        self.latency_stats = latency_stats
+        self.next_send_time = time.monotonic()
+
+
+    def split_into_windows(self: 'WriteThrottle', statements: List[Tuple[Any, int]]) -> Iterator[List[Tuple[Any, int]]]:
+        window, window_rows = [], 0
+        for statement, rows_count in statements:
+            window.append((statement, rows_count))
+            window_rows += rows_count
+            if len(window) >= self.concurrency * IMPORT_THROTTLE_WINDOW or \
+                    (self.max_rows_per_second and window_rows >= self.max_rows_per_second):
+                yield window
+                window, window_rows = [], 0
+        if window:
+            yield window
+
+    def acquire(self: 'WriteThrottle', rows_count: int) -> None:
+        if not self.max_rows_per_second:
+            return None
+        now = time.monotonic()
+        self.next_send_time = max(self.next_send_time, now)
+        delay = self.next_send_time - now
+        self.next_send_time += rows_count / self.max_rows_per_second
+        if delay > 0:
+            time.sleep(delay)
+
+    def record(self: 'WriteThrottle', outcomes: List[Tuple[bool, Any]], elapsed_seconds: float, concurrency: int) -> None:
+        if not outcomes:
+            return None
+        average_latency = elapsed_seconds * min(concurrency, len(outcomes)) / len(outcomes)
+        if self.latency_stats:
+            self.latency_stats.add(average_latency)
+        is_overloaded = any(not success and self.is_backpressure_error(outcome) for success, outcome in outcomes)
+        if is_overloaded or average_latency > self.target_latency:
+            self.concurrency = max(int(self.concurrency * IMPORT_BACKOFF_FACTOR), self.min_concurrency)
+        else:
+            self.concurrency = min(self.concurrency + IMPORT_CONCURRENCY_STEP, self.max_concurrency)
+
+    def is_backpressure_error(self: 'WriteThrottle', error: Any) -> bool:
+        if isinstance(error, NoHostAvailable):
+            return any(isinstance(host_error, BACKPRESSURE_ERRORS) for host_error in error.errors.values())
+        return isinstance(error, BACKPRESSURE_ERRORS)
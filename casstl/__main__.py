@@ -0,0 +1,6 @@
+import multiprocessing
+from backend.cli.command_line import main
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    main()
@@ -1,3 +1,4 @@
+from PyQt6.QtCore import QModelIndex
 from constants.model_wrapper import ModelWrapper
 
 
@@ -9,9 +10,10 @@ class CassandraRowList:
 
     def add_row(self: 'CassandraRowList') -> None:
         new_row = ModelWrapper(**{column: None for column in self.table.header_data})
+        row = self.table.rowCount()
+        self.table.beginInsertRows(QModelIndex(), row, row)
         self.new_rows.append(new_row)
-        self.table.data.append(new_row)
-        self.table.layoutChanged.emit()
+        self.table.endInsertRows()
 
     def remove_rows(self: 'CassandraRowList') -> None:
         self.new_rows = []
\ No newline at end of file
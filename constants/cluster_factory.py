@@ -0,0 +1,76 @@
+from typing import Any, Optional, Tuple
+from cassandra.auth import PlainTextAuthProvider
+from cassandra.cluster import Cluster, ExecutionProfile, EXEC_PROFILE_DEFAULT
+from cassandra.policies import DCAwareRoundRobinPolicy, HostDistance, TokenAwarePolicy
+from constants.common import (COMPRESSION_OPTIONS,
+                              CONNECT_TIMEOUT,
+                              EXECUTOR_THREADS,
+                              PROTOCOL_VERSIONS_WITH_POOL_SIZES,
+                              QUERY_TIMEOUT,
+                              SCHEMA_METADATA_OPTIONS,
+                              Compression,
+                              SchemaMetadata)
+from constants.connection_profile_model import ConnectionProfileModel
+
+
+def get_setting(connection_profile: ConnectionProfileModel, name: str, default: Any) -> Any:
+    value = connection_profile.get(name)
+    return default if value in (None, "") else value
+
+def build_execution_profile(connection_profile: ConnectionProfileModel) -> ExecutionProfile:
+    execution_profile = ExecutionProfile(
+        request_timeout=float(get_setting(connection_profile, 'request_timeout', QUERY_TIMEOUT))
+    )
+    if local_dc := get_setting(connection_profile, 'local_dc', ""):
+        execution_profile.load_balancing_policy = TokenAwarePolicy(DCAwareRoundRobinPolicy(local_dc=local_dc))
+    return execution_profile
+
+def get_pool_sizes(connection_profile: ConnectionProfileModel) -> Tuple[int, int]:
+    core_connections = int(get_setting(connection_profile, 'core_connections_per_host', 0))
+    max_connections = int(get_setting(connection_profile, 'max_connections_per_host', 0))
+    if core_connections < 0 or max_connections < 0:
+        raise ValueError("Connections per host can not be negative.")
+    if core_connections and max_connections and core_connections > max_connections:
+        raise ValueError("Core connections per host can not exceed max connections per host.")
+    return (core_connections, max_connections)
+
+def get_pool_sizes_warning(connection_profile: ConnectionProfileModel) -> Optional[str]:
+    core_connections = int(get_setting(connection_profile, 'core_connections_per_host', 0))
+    max_connections = int(get_setting(connection_profile, 'max_connections_per_host', 0))
+    if not (core_connections or max_connections) or \
+            int(get_setting(connection_profile, 'protocol_version', 0)) in PROTOCOL_VERSIONS_WITH_POOL_SIZES:
+        return None
+    return "Connections per host only take effect with protocol version 1 or 2, they are ignored."
+
+def build_cluster(connection_profile: ConnectionProfileModel, connect_timeout: Optional[float] = None) -> Cluster:
+    auth_provider = PlainTextAuthProvider(username=connection_profile.username, password=connection_profile.password)
+    connect_timeout = connect_timeout or float(get_setting(connection_profile, 'connect_timeout', CONNECT_TIMEOUT))
+    compression = get_setting(connection_profile, 'compression', Compression.auto.value)
+    schema_metadata = get_setting(connection_profile, 'schema_metadata', SchemaMetadata.full.value)
+    schema_metadata_enabled, token_metadata_enabled = SCHEMA_METADATA_OPTIONS.get(str(schema_metadata).lower(), (True, True))
+    core_connections, max_connections = get_pool_sizes(connection_profile)
+    cluster_options = {}
+    if protocol_version := int(get_setting(connection_profile, 'protocol_version', 0)):
+        cluster_options['protocol_version'] = protocol_version
+
+    cluster = Cluster(
+        contact_points=[connection_profile.host],
+        port=connection_profile.port,
+        auth_provider=auth_provider,
+        connect_timeout=connect_timeout,
+        control_connection_timeout=connect_timeout,
+        compression=COMPRESSION_OPTIONS.get(str(compression).lower(), True),
+        schema_metadata_enabled=schema_metadata_enabled,
+        token_metadata_enabled=token_metadata_enabled,
+        executor_threads=int(get_setting(connection_profile, 'executor_threads', EXECUTOR_THREADS)),
+        execution_profiles={EXEC_PROFILE_DEFAULT: build_execution_profile(connection_profile)},
+        **cluster_options
+    )
+
+    # NOTE The driver only pools several connections per host for protocol v1 and v2.
+    if protocol_version in PROTOCOL_VERSIONS_WITH_POOL_SIZES:
+        if max_connections:
+            cluster.set_max_connections_per_host(HostDistance.LOCAL, max_connections)
+        if core_connections:
+            cluster.set_core_connections_per_host(HostDistance.LOCAL, core_connections)
+    return cluster
@@ -0,0 +1,178 @@
+import sys
+from array import array
+from collections import namedtuple
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, List, Optional, Union
+from constants.common import COLUMN_STORE_TYPE_CODES
+
+
+class NullBitmap:
+    def __init__(self: 'NullBitmap') -> None:
+        self.bits = bytearray()
+        self.size = 0
+
+
+    def append(self: 'NullBitmap', is_null: bool) -> None:
+        if self.size % 8 == 0:
+            self.bits.append(0)
+        self.size += 1
+        if is_null:
+            self.set(self.size - 1, True)
+
+    def extend(self: 'NullBitmap', count: int, null_indexes: Iterable[int] = ()) -> None:
+        start = self.size
+        self.size += count
+        self.bits.extend(bytes((self.size + 7) // 8 - len(self.bits)))
+        for index in null_indexes:
+            self.set(start + index, True)
+
+    def get(self: 'NullBitmap', index: int) -> bool:
+        return bool(self.bits[index >> 3] & (1 << (index & 7)))
+
+    def set(self: 'NullBitmap', index: int, is_null: bool) -> None:
+        if is_null:
+            self.bits[index >> 3] |= 1 << (index & 7)
+        else:
+            self.bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def delete(self: 'NullBitmap', index: int) -> None:
+        value = int.from_bytes(self.bits, "little")
+        value = (value & ((1 << index) - 1)) | ((value >> (index + 1)) << index)
+        self.size -= 1
+        self.bits = bytearray(value.to_bytes((self.size + 7) // 8, "little"))
+
+    def clear(self: 'NullBitmap') -> None:
+        self.bits = bytearray()
+        self.size = 0
+
+
+class TypedColumn:
+    def __init__(self: 'TypedColumn', type_code: str, is_boolean: bool = False) -> None:
+        self.type_code = type_code
+        self.is_boolean = is_boolean
+        self.values = array(type_code)
+        self.nulls = NullBitmap()
+
+
+    def append(self: 'TypedColumn', value: Any) -> None:
+        self.values.append(0 if value is None else value)
+        self.nulls.append(value is None)
+
+    def extend(self: 'TypedColumn', values: List[Any]) -> None:
+        if None in values:
+            self.values.extend(array(self.type_code, [0 if value is None else value for value in values]))
+            self.nulls.extend(len(values), [index for index, value in enumerate(values) if value is None])
+        else:
+            self.values.extend(array(self.type_code, values))
+            self.nulls.extend(len(values))
+
+    def get(self: 'TypedColumn', index: int) -> Any:
+        if self.nulls.get(index):
+            return None
+        value = self.values[index]
+        return bool(value) if self.is_boolean else value
+
+    def set(self: 'TypedColumn', index: int, value: Any) -> None:
+        self.values[index] = 0 if value is None else value
+        self.nulls.set(index, value is None)
+
+    def delete(self: 'TypedColumn', index: int) -> None:
+        del self.values[index]
+        self.nulls.delete(index)
+
+    def clear(self: 'TypedColumn') -> None:
+        self.values = array(self.type_code)
+        self.nulls.clear()
+
+    def to_list(self: 'TypedColumn') -> List[Any]:
+        return [self.get(index) for index in range(len(self.values))]
+
+
+class ObjectColumn:
+    def __init__(self: 'ObjectColumn', values: Optional[List[Any]] = None) -> None:
+        self.values = values if values is not None else []
+
+
+    def append(self: 'ObjectColumn', value: Any) -> None:
+        self.values.append(sys.intern(value) if type(value) is str else value)
+
+    def extend(self: 'ObjectColumn', values: List[Any]) -> None:
+        self.values.extend([sys.intern(value) if type(value) is str else value for value in values])
+
+    def get(self: 'ObjectColumn', index: int) -> Any:
+        return self.values[index]
+
+    def set(self: 'ObjectColumn', index: int, value: Any) -> None:
+        self.values[index] = sys.intern(value) if type(value) is str else value
+
+    def delete(self: 'ObjectColumn', index: int) -> None:
+        del self.values[index]
+
+    def clear(self: 'ObjectColumn') -> None:
+        self.values = []
+
+
+class ColumnRowStore:
+    def __init__(self: 'ColumnRowStore', header_data: List[str], column_types: Optional[Dict[str, str]] = None) -> None:
+        self.header_data = header_data
+        self.row_type = namedtuple("Row", header_data, rename=True)
+        self.columns: List[Union[TypedColumn, ObjectColumn]] = [
+            self.create_column((column_types or {}).get(column)) for column in header_data]
+        self.rows_count = 0
+
+
+    def __len__(self: 'ColumnRowStore') -> int:
+        return self.rows_count
+
+    def __getitem__(self: 'ColumnRowStore', row: int) -> Any:
+        return self.row_type(*(column.get(row) for column in self.columns))
+
+    def __delitem__(self: 'ColumnRowStore', row: int) -> None:
+        for column in self.columns:
+            column.delete(row)
+        self.rows_count -= 1
+
+    def create_column(self: 'ColumnRowStore', column_type: Optional[str]) -> Union[TypedColumn, ObjectColumn]:
+        type_code = COLUMN_STORE_TYPE_CODES.get(column_type)
+        return TypedColumn(type_code, column_type == "boolean") if type_code else ObjectColumn()
+
+    def degrade_column(self: 'ColumnRowStore', column_index: int) -> ObjectColumn:
+        column = self.columns[column_index]
+        if isinstance(column, TypedColumn):
+            column = ObjectColumn(column.to_list())
+            self.columns[column_index] = column
+        return column
+
+    def extend(self: 'ColumnRowStore', rows: Iterable[Any]) -> None:
+        rows = [[row.get(column) for column in self.header_data] if isinstance(row, Mapping) else row for row in rows]
+        for column_index, values in enumerate(zip(*rows)):
+            values = list(values)
+            try:
+                self.columns[column_index].extend(values)
+            except (TypeError, OverflowError):
+                self.degrade_column(column_index).extend(values)
+        self.rows_count += len(rows)
+
+    def append(self: 'ColumnRowStore', row: Any) -> None:
+        if isinstance(row, Mapping):
+            row = [row.get(column) for column in self.header_data]
+        for column_index, value in enumerate(row):
+            try:
+                self.columns[column_index].append(value)
+            except (TypeError, OverflowError):
+                self.degrade_column(column_index).append(value)
+        self.rows_count += 1
+
+    def get_value(self: 'ColumnRowStore', row: int, column_index: int) -> Any:
+        return self.columns[column_index].get(row)
+
+    def set_value(self: 'ColumnRowStore', row: int, column_index: int, value: Any) -> None:
+        try:
+            self.columns[column_index].set(row, value)
+        except (TypeError, OverflowError):
+            self.degrade_column(column_index).set(row, value)
+
+    def clear(self: 'ColumnRowStore') -> None:
+        for column in self.columns:
+            column.clear()
+        self.rows_count = 0
@@ -0,0 +1,13 @@
+from constants.model_wrapper import ModelWrapper
+
+
+class ColumnSchemaModel(ModelWrapper):
+    def __init__(self, column_name: str = "", type: str = "", kind: str = "regular",
+                 position: int = -1, clustering_order: str = "none") -> None:
+        super().__init__(
+            column_name         = column_name,
+            type                = type,
+            kind                = kind,
+            position            = position,
+            clustering_order    = clustering_order
+        )
@@ -1,9 +1,5 @@
-import decimal
 import os
-import uuid
 from enum import Enum
-from datetime import date, time
-from dateutil import parser
 
 
 ############################################################################################
@@ -28,6 +24,9 @@ DATACENTER_REPLICATION_FRAME_PATH   = os.path.join(basedir, "frontend", "datacen
 CREATE_MASTER_PASSWORD_WINDOW_PATH  = os.path.join(basedir, "frontend", "create_master_password.ui")
 CHANGE_MASTER_PASSWORD_WINDOW_PATH  = os.path.join(basedir, "frontend", "change_master_password.ui")
 AUTH_MASTER_PASSWORD_WINDOW_PATH    = os.path.join(basedir, "frontend", "authenticate_master_password.ui")
+FRONTEND_PATH                       = os.path.join(basedir, "frontend")
+UI_CACHE_PATH                       = os.path.join(basedir, "frontend", "__uicache__")
+SCHEMA_CACHE_PATH                   = os.path.join(basedir, "database", "schema_cache")
 
 # Lables
 DATABASE_NAVIGATION_HEADER          = "Database navigation"
@@ -35,6 +34,85 @@ RESULT_STATISTICS                   = "Result statistics:"
 SUCCESS                             = "Success"
 NO_TABLE                            = "No Table created."
 
+# Connection
+CONNECT_TIMEOUT                     = 5.0
+CONNECT_PARALLELISM                 = 8
+EXECUTOR_THREADS                    = 2
+PROTOCOL_VERSIONS_WITH_POOL_SIZES   = (1, 2)
+
+# Schema cache
+SCHEMA_CACHE_FORMAT_VERSION         = 1
+SCHEMA_VERSION_POLL_INTERVAL        = 30.0
+SCHEMA_CACHE_RETRY_BASE_DELAY       = 1.0
+SCHEMA_CACHE_RETRY_MAX_DELAY        = 300.0
+
+# Table browsing
+TABLE_PAGE_SIZE                     = 500
+TABLE_MAX_ROWS_IN_MEMORY            = 100000
+TABLE_DISPLAY_CACHE_SIZE            = 20000
+TABLE_DISPLAY_MAX_LENGTH            = 200
+
+# Column row store (array type codes of fixed width CQL types)
+COLUMN_STORE_TYPE_CODES = {
+    'boolean': 'B',
+    'tinyint': 'b',
+    'smallint': 'h',
+    'int': 'i',
+    'bigint': 'q',
+    'counter': 'q',
+    'float': 'd',
+    'double': 'd'
+}
+
+# CQL editor
+QUERY_TIMEOUT                       = 10.0
+QUERY_MAX_TIMEOUT                   = 3600.0
+QUERY_CONSISTENCY_LEVEL             = "LOCAL_ONE"
+QUERY_RESULT_MAX_SHOWN_ROWS         = 10
+
+# Import
+IMPORT_CONCURRENCY                  = 64
+IMPORT_MIN_CONCURRENCY              = 1
+IMPORT_INITIAL_CONCURRENCY          = 16
+IMPORT_CONCURRENCY_STEP             = 2
+IMPORT_BACKOFF_FACTOR               = 0.5
+IMPORT_TARGET_LATENCY               = 0.25
+IMPORT_THROTTLE_WINDOW              = 4
+IMPORT_MAX_ROWS_PER_SECOND          = 0
+IMPORT_BATCH_SIZE                   = 5000
+IMPORT_MAX_BATCH_BYTES              = 5 * 1024
+IMPORT_MAX_BATCH_STATEMENTS         = 100
+IMPORT_PROCESSES                    = 1
+IMPORT_MIN_BYTES_PER_PROCESS        = 1024 * 1024
+IMPORT_MAX_ATTEMPTS                 = 5
+IMPORT_RETRY_BASE_DELAY             = 0.1
+IMPORT_RETRY_MAX_DELAY              = 5.0
+IMPORT_MAX_ERROR_MESSAGES           = 100
+DEAD_LETTER_SUFFIX                  = ".rejected"
+DEAD_LETTER_ERROR_FIELD             = "_import_error"
+DEAD_LETTER_ROW_FIELD               = "_import_row"
+
+# Export
+EXPORT_BATCH_SIZE                   = 1000
+EXPORT_PARALLELISM                  = 8
+EXPORT_PAGE_SIZE                    = 5000
+EXPORT_RANGES_PER_WORKER            = 4
+EXPORT_MAX_RETRIES                  = 3
+EXPORT_RETRY_BACKOFF                = 0.5
+
+# Command line
+CLI_MASTER_PASSWORD_ENV             = "CASSTL_MASTER_PASSWORD"
+CLI_PROGRAM_NAME                    = "casstl"
+
+# Background jobs
+PROGRESS_UPDATE_INTERVAL            = 0.5
+
+# Results log
+RESULTS_LOG_MAX_LINES               = 10000
+RESULTS_LOG_FLUSH_INTERVAL_MS       = 100
+RESULTS_LOG_FILE_PATH               = None
+RESULTS_LOG_FILE_ENV                = "CASSTL_RESULTS_LOG"
+
 ##############################################
 # Database tables
 CONNECTION_PROFILES_TABLE   = "connection_profiles"
@@ -48,13 +126,32 @@ class ConfirmationMessages(Enum):
 class ErrorTitles(Enum):
     Error                   = "Error"
     Connection_profiles     = "Cassandra Tool - Connection profiles - Error!"
+    Connection_settings     = "Cassandra Tool - Connection profiles - Warning!"
     Db_Connection_profiles  = "Database - Connection profiles - Error!"
     Db_Cassandra_error      = "Cassandra Database Error!"
     Failed                  = "Failed:"
+    Not_sent                = "Not sent, import cancelled."
+
+class ConnectionStatus(Enum):
+    connecting  = "Connecting..."
+    connected   = "Connected"
+    failed      = "Failed"
+
+class Compression(Enum):
+    auto    = "auto"
+    none    = "none"
+    lz4     = "lz4"
+    snappy  = "snappy"
+
+class SchemaMetadata(Enum):
+    full        = "full"
+    limited     = "limited"
+    disabled    = "disabled"
 
 class ExportTypes(Enum):
     CSV     = "CSV"
     JOSN    = "JSON"
+    NDJSON  = "NDJSON"
     XML     = "XML"
 
 class TreeViewDepthLevel(Enum):
@@ -73,37 +170,57 @@ class OrderBy(Enum):
     ASC  = "ASC"
     DESC = "DESC"
 
+class ColumnKind(Enum):
+    partition_key   = "partition_key"
+    clustering      = "clustering"
+    static          = "static"
+    regular         = "regular"
+
+class StatementKind(Enum):
+    insert = "insert"
+    update = "update"
+    delete = "delete"
+    insert_json = "insert_json"
+
 class ReplicationClass(Enum):
     SimpleStrategy          = "SimpleStrategy"
     NetworkTopologyStrategy = "NetworkTopologyStrategy"
 
+class Partitioner(Enum):
+    Murmur3Partitioner  = "org.apache.cassandra.dht.Murmur3Partitioner"
+    RandomPartitioner   = "org.apache.cassandra.dht.RandomPartitioner"
+
 ############################################################################################
 # Mapping
-CASSANDRA_TYPE_MAPPING = {
-    'NULL': type(None),
-    'boolean': bool,
-    'double': float,
-    'float': float,
-    'int': int,
-    'bigint': int,
-    'varint': int,
-    'smallint': int,
-    'tinyint': int,
-    'counter': int,
-    'decimal': decimal.Decimal,
-    'ascii': str,
-    'varchar': str,
-    'text': str,
-    'blob': bytearray,
-    'date': date,
-    'timestamp': parser.parse,
-    'time': time,
-    'list': list,
-    'set': set,
-    'map': dict,
-    'timeuuid': uuid.UUID,
-    'uuid': uuid.UUID,
-    'inet': str,
-    'vector': float,
-    'duration': str
+COMPRESSION_OPTIONS = {
+    Compression.auto.value: True,
+    Compression.none.value: False,
+    Compression.lz4.value: 'lz4',
+    Compression.snappy.value: 'snappy'
+}
+
+# (schema_metadata_enabled, token_metadata_enabled)
+SCHEMA_METADATA_OPTIONS = {
+    SchemaMetadata.full.value: (True, True),
+    SchemaMetadata.limited.value: (False, True),
+    SchemaMetadata.disabled.value: (False, False)
+}
+
+# Driver settings columns added to the connection profiles table (0 or '' keeps the driver default)
+CONNECTION_PROFILE_SETTINGS_COLUMNS = {
+    'local_dc': "VARCHAR(150) NOT NULL DEFAULT ''",
+    'protocol_version': "INTEGER NOT NULL DEFAULT 0",
+    'compression': f"VARCHAR(10) NOT NULL DEFAULT '{Compression.auto.value}'",
+    'core_connections_per_host': "INTEGER NOT NULL DEFAULT 0",
+    'max_connections_per_host': "INTEGER NOT NULL DEFAULT 0",
+    'executor_threads': f"INTEGER NOT NULL DEFAULT {EXECUTOR_THREADS}",
+    'fetch_size': f"INTEGER NOT NULL DEFAULT {TABLE_PAGE_SIZE}",
+    'request_timeout': f"REAL NOT NULL DEFAULT {QUERY_TIMEOUT}",
+    'connect_timeout': f"REAL NOT NULL DEFAULT {CONNECT_TIMEOUT}",
+    'schema_metadata': f"VARCHAR(10) NOT NULL DEFAULT '{SchemaMetadata.full.value}'"
+}
+
+TOKEN_RANGE_BOUNDS = {
+    Partitioner.Murmur3Partitioner.value: (-2**63, 2**63 - 1),
+    Partitioner.RandomPartitioner.value: (-1, 2**127)
 }
\ No newline at end of file
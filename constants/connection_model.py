@@ -1,7 +1,96 @@
-from cassandra.cluster import Cluster
+import threading
+from typing import Dict, List, Optional, Tuple
+from cassandra import ProtocolVersion
+from cassandra.cluster import Cluster, Session, ResponseFuture
+from cassandra.query import SimpleStatement, Statement
+from constants.common import QUERY_TIMEOUT, TABLE_PAGE_SIZE
+from constants.connection_profile_model import ConnectionProfileModel
+from constants.schema_change_notifier import SchemaChangeNotifier
+from constants.prepared_statement_cache import PreparedStatementCache
+from constants.schema_cache import SchemaCache
+from constants.schema_cache_refresher import SchemaCacheRefresher
 
 
 class Connection(dict):
-    def __init__(self: 'Connection', cluster: Cluster, connection_profile_name: str) -> None:
+    def __init__(self: 'Connection',
+                 cluster: Cluster,
+                 connection_profile_name: str,
+                 session: Optional[Session] = None,
+                 connection_profile: Optional[ConnectionProfileModel] = None) -> None:
         self.cluster = cluster
-        self.connection_profile_name = connection_profile_name
\ No newline at end of file
+        self.connection_profile_name = connection_profile_name
+        self.connection_profile = connection_profile
+        self.schema_change_notifier = SchemaChangeNotifier(cluster)
+        self.prepared_statement_cache = PreparedStatementCache(self.schema_change_notifier)
+        self.fetch_size = int(connection_profile.get('fetch_size') or TABLE_PAGE_SIZE) if connection_profile else TABLE_PAGE_SIZE
+        self.sessions: Dict[Optional[str], Session] = {}
+        if session:
+            self.add_session(None, session)
+        self.sessions_lock = threading.Lock()
+        self.schema_cache_refresher: Optional[SchemaCacheRefresher] = None
+        if session and not cluster.schema_metadata_enabled:
+            self.schema_cache_refresher = SchemaCacheRefresher(cluster, session, self.schema_change_notifier)
+
+
+    def get_session(self: 'Connection', key_space: Optional[str] = None) -> Session:
+        with self.sessions_lock:
+            if key_space not in self.sessions:
+                self.add_session(key_space, self.cluster.connect(keyspace=key_space))
+            return self.sessions[key_space]
+
+    def add_session(self: 'Connection', key_space: Optional[str], session: Session) -> None:
+        session.default_fetch_size = self.fetch_size
+        self.sessions[key_space] = session
+
+    def get_schema_cache(self: 'Connection') -> Optional[SchemaCache]:
+        return self.schema_cache_refresher.schema_cache if self.schema_cache_refresher else None
+
+    def get_key_space_names(self: 'Connection') -> List[str]:
+        if self.schema_cache_refresher:
+            schema_cache = self.get_schema_cache()
+            return schema_cache.get_key_space_names() if schema_cache else []
+        return sorted(list(self.cluster.metadata.keyspaces))
+
+    def get_table_names(self: 'Connection', key_space: str) -> List[str]:
+        if self.schema_cache_refresher:
+            schema_cache = self.get_schema_cache()
+            return schema_cache.get_table_names(key_space) if schema_cache else []
+        key_space_metadata = self.cluster.metadata.keyspaces.get(key_space)
+        return sorted(list(key_space_metadata.tables)) if key_space_metadata else []
+
+    def refresh_schema(self: 'Connection', is_forced: bool = True) -> None:
+        if self.schema_cache_refresher:
+            self.schema_cache_refresher.refresh(is_forced)
+        elif is_forced:
+            self.cluster.refresh_schema_metadata()
+
+    def create_statement(self: 'Connection',
+                         query: str,
+                         key_space: Optional[str] = None,
+                         consistency_level: Optional[int] = None,
+                         fetch_size: Optional[int] = None) -> Tuple[Session, Statement]:
+        fetch_size = fetch_size or self.fetch_size
+        if key_space is None:
+            return (self.get_session(), SimpleStatement(query, consistency_level=consistency_level, fetch_size=fetch_size))
+        if ProtocolVersion.uses_keyspace_flag(self.cluster.protocol_version):
+            return (self.get_session(),
+                    SimpleStatement(query, consistency_level=consistency_level, fetch_size=fetch_size, keyspace=key_space))
+        return (self.get_session(key_space), SimpleStatement(query, consistency_level=consistency_level, fetch_size=fetch_size))
+
+    def execute_async(self: 'Connection',
+                      query: str,
+                      key_space: Optional[str] = None,
+                      timeout: float = QUERY_TIMEOUT,
+                      consistency_level: Optional[int] = None) -> ResponseFuture:
+        session, statement = self.create_statement(query, key_space, consistency_level)
+        return session.execute_async(statement, timeout=timeout)
+
+    def close(self: 'Connection') -> None:
+        if self.schema_cache_refresher:
+            self.schema_cache_refresher.stop()
+        with self.sessions_lock:
+            for session in self.sessions.values():
+                session.shutdown()
+            self.sessions.clear()
+        self.prepared_statement_cache.clear()
+        self.cluster.shutdown()
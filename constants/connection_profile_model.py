@@ -1,3 +1,4 @@
+from constants.common import Compression, SchemaMetadata, CONNECT_TIMEOUT, EXECUTOR_THREADS, QUERY_TIMEOUT, TABLE_PAGE_SIZE
 from constants.model_wrapper import ModelWrapper
 
 
@@ -6,11 +7,31 @@ class ConnectionProfileModel(ModelWrapper):
                  host: str = "",
                  port: int = 0,
                  username: str = "",
-                 password: bytes = None) -> None:
+                 password: bytes = None,
+                 local_dc: str = "",
+                 protocol_version: int = 0,
+                 compression: str = Compression.auto.value,
+                 core_connections_per_host: int = 0,
+                 max_connections_per_host: int = 0,
+                 executor_threads: int = EXECUTOR_THREADS,
+                 fetch_size: int = TABLE_PAGE_SIZE,
+                 request_timeout: float = QUERY_TIMEOUT,
+                 connect_timeout: float = CONNECT_TIMEOUT,
+                 schema_metadata: str = SchemaMetadata.full.value) -> None:
         super().__init__(
-            connection_name = connection_name,
-            host            = host,
-            port            = port,
-            username        = username,
-            password        = password
-        )
\ No newline at end of file
+            connection_name             = connection_name,
+            host                        = host,
+            port                        = port,
+            username                    = username,
+            password                    = password,
+            local_dc                    = local_dc,
+            protocol_version            = protocol_version,
+            compression                 = compression,
+            core_connections_per_host   = core_connections_per_host,
+            max_connections_per_host    = max_connections_per_host,
+            executor_threads            = executor_threads,
+            fetch_size                  = fetch_size,
+            request_timeout             = request_timeout,
+            connect_timeout             = connect_timeout,
+            schema_metadata             = schema_metadata
+        )
@@ -0,0 +1,27 @@
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+
+class DisplayCache:
+    def __init__(self: 'DisplayCache', max_size: int) -> None:
+        self.max_size = max_size
+        self.entries: OrderedDict[Hashable, str] = OrderedDict()
+
+
+    def get(self: 'DisplayCache', key: Hashable) -> Optional[str]:
+        text = self.entries.get(key)
+        if text is not None:
+            self.entries.move_to_end(key)
+        return text
+
+    def put(self: 'DisplayCache', key: Hashable, text: str) -> None:
+        self.entries[key] = text
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def invalidate(self: 'DisplayCache', key: Hashable) -> None:
+        self.entries.pop(key, None)
+
+    def clear(self: 'DisplayCache') -> None:
+        self.entries.clear()
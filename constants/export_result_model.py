@@ -0,0 +1,11 @@
+from typing import List
+from constants.model_wrapper import ModelWrapper
+
+
+class ExportResultModel(ModelWrapper):
+    def __init__(self, exported_rows_count: int = 0, is_cancelled: bool = False, error_messages: List[str] = None) -> None:
+        super().__init__(
+            exported_rows_count = exported_rows_count,
+            is_cancelled        = is_cancelled,
+            error_messages      = error_messages if error_messages is not None else []
+        )
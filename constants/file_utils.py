@@ -0,0 +1,90 @@
+import csv
+import json
+import re
+from typing import IO, BinaryIO, Iterator, List, Tuple
+
+WHITESPACE_PATTERN = re.compile(r"\s*")
+
+
+def count_lines(file_path: str, chunk_size: int = 1024 * 1024) -> int:
+    lines_count = 0
+    with open(file_path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            lines_count += chunk.count(b"\n")
+    return lines_count
+
+def has_multiline_records(file_path: str, chunk_size: int = 1024 * 1024) -> bool:
+    with open(file_path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            if b'"' in chunk:
+                break
+        else:
+            return False
+    with open(file_path, newline='', encoding='utf-8') as file:
+        reader = csv.reader(file)
+        return any(reader.line_num != records_count for records_count, _ in enumerate(reader, 1))
+
+# NOTE ranges are cut at raw newlines, a quoted CSV field spanning lines must not be split, see has_multiline_records.
+def split_line_ranges(file_path: str, parts: int, start: int = 0) -> List[Tuple[int, int]]:
+    with open(file_path, "rb") as file:
+        end = file.seek(0, 2)
+        boundaries = [start]
+        for part in range(1, parts):
+            file.seek(max(start + (end - start) * part // parts - 1, boundaries[-1]))
+            file.readline()
+            if file.tell() >= end:
+                break
+            if file.tell() > boundaries[-1]:
+                boundaries.append(file.tell())
+        boundaries.append(end)
+    return [(range_start, range_end) for range_start, range_end in zip(boundaries, boundaries[1:]) if range_start < range_end]
+
+def iter_lines_in_range(file: BinaryIO, start: int, end: int, encoding: str = "utf-8") -> Iterator[str]:
+    file.seek(start)
+    position = start
+    while position < end and (line := file.readline()):
+        position += len(line)
+        yield line.decode(encoding)
+
+def iter_ndjson_objects(file: IO[str]) -> Iterator[str]:
+    for line in file:
+        if line := line.strip():
+            yield line
+
+def iter_json_array_objects(file: IO[str], chunk_size: int = 1024 * 1024) -> Iterator[str]:
+    decoder = json.JSONDecoder()
+    buffer, position = "", 0
+    is_array_open = is_eof = False
+
+    while True:
+        position = WHITESPACE_PATTERN.match(buffer, position).end()
+        if position == len(buffer):
+            if is_eof:
+                raise ValueError("Unexpected end of JSON array")
+            chunk = file.read(chunk_size)
+            buffer, position, is_eof = buffer[position:] + chunk, 0, not chunk
+            continue
+
+        char = buffer[position]
+        if not is_array_open:
+            if char != "[":
+                raise ValueError("Expected a JSON array of objects")
+            is_array_open = True
+            position += 1
+        elif char == "]":
+            return
+        elif char == ",":
+            position += 1
+        elif char != "{":
+            raise ValueError(f"Expected a JSON object at: {buffer[position:position + 50]}")
+        else:
+            try:
+                _, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if is_eof:
+                    raise
+                chunk = file.read(chunk_size)
+                buffer, position, is_eof = buffer[position:] + chunk, 0, not chunk
+                continue
+            yield buffer[position:end]
+            position = end
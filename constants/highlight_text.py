@@ -1,18 +1,29 @@
-from PyQt6.QtGui import QTextCharFormat, QColor, QTextCursor
+from typing import Dict
+from PyQt6.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QTextDocument
 from PyQt6.QtWidgets import QPlainTextEdit
 
 
-def highlight_text(q_plain_text_edit: QPlainTextEdit, text_to_highlight: str, color: str = "red") -> None:
-    highlight_format = QTextCharFormat()
-    highlight_format.setForeground(QColor(color))
+class TextHighlighter(QSyntaxHighlighter):
+    def __init__(self: 'TextHighlighter', document: QTextDocument, rules: Dict[str, str]) -> None:
+        super(TextHighlighter, self).__init__(document)
+        self.rules = {}
+        for text_to_highlight, color in rules.items():
+            highlight_format = QTextCharFormat()
+            highlight_format.setForeground(QColor(color))
+            self.rules[text_to_highlight] = highlight_format
 
-    cursor = q_plain_text_edit.textCursor()
-    cursor.beginEditBlock()
 
-    while not cursor.isNull() and not cursor.atEnd():
-        cursor = q_plain_text_edit.document().find(text_to_highlight, cursor)
-        if not cursor.isNull():
-            cursor.mergeCharFormat(highlight_format)
-            cursor.movePosition(QTextCursor.MoveOperation.WordRight)
+    def highlightBlock(self: 'TextHighlighter', text: str) -> None:
+        for text_to_highlight, highlight_format in self.rules.items():
+            start = text.find(text_to_highlight)
+            while start != -1:
+                self.setFormat(start, len(text_to_highlight), highlight_format)
+                start = text.find(text_to_highlight, start + len(text_to_highlight))
 
-    cursor.endEditBlock()
\ No newline at end of file
+
+def install_highlighter(q_plain_text_edit: QPlainTextEdit, rules: Dict[str, str]) -> TextHighlighter:
+    highlighter = getattr(q_plain_text_edit, "text_highlighter", None)
+    if highlighter is None:
+        highlighter = TextHighlighter(q_plain_text_edit.document(), rules)
+        q_plain_text_edit.text_highlighter = highlighter
+    return highlighter
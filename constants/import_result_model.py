@@ -0,0 +1,17 @@
+from typing import List, Optional
+from constants.model_wrapper import ModelWrapper
+
+
+class ImportResultModel(ModelWrapper):
+    def __init__(self, added_rows_count: int = 0, error_count: int = 0, error_messages: List[str] = None,
+                 is_cancelled: bool = False, dead_letter_path: Optional[str] = None, dead_letter_rows_count: int = 0,
+                 not_sent_rows_count: int = 0) -> None:
+        super().__init__(
+            added_rows_count        = added_rows_count,
+            error_count             = error_count,
+            error_messages          = error_messages if error_messages is not None else [],
+            is_cancelled            = is_cancelled,
+            dead_letter_path        = dead_letter_path,
+            dead_letter_rows_count  = dead_letter_rows_count,
+            not_sent_rows_count     = not_sent_rows_count
+        )
\ No newline at end of file
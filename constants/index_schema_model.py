@@ -0,0 +1,9 @@
+from constants.model_wrapper import ModelWrapper
+
+
+class IndexSchemaModel(ModelWrapper):
+    def __init__(self, name: str = "", create_statement: str = "") -> None:
+        super().__init__(
+            name                = name,
+            create_statement    = create_statement
+        )
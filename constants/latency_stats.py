@@ -0,0 +1,27 @@
+import threading
+from typing import List
+
+
+class LatencyStats:
+    def __init__(self: 'LatencyStats') -> None:
+        self.latencies: List[float] = []
+        self.lock = threading.Lock()
+
+
+    def add(self: 'LatencyStats', seconds: float) -> None:
+        with self.lock:
+            self.latencies.append(seconds)
+
+    def get_percentile(self: 'LatencyStats', sorted_latencies: List[float], percentile: float) -> float:
+        index = min(int(len(sorted_latencies) * percentile / 100), len(sorted_latencies) - 1)
+        return sorted_latencies[index]
+
+    def to_text(self: 'LatencyStats') -> str:
+        with self.lock:
+            latencies = sorted(self.latencies)
+        if not latencies:
+            return "no samples"
+        mean = sum(latencies) / len(latencies)
+        percentiles = " | ".join(f"p{percentile}: {self.get_percentile(latencies, percentile) * 1000:.1f} ms"
+                                 for percentile in (50, 95, 99))
+        return f"{len(latencies)} samples | mean: {mean * 1000:.1f} ms | {percentiles} | max: {latencies[-1] * 1000:.1f} ms"
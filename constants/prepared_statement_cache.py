@@ -0,0 +1,44 @@
+import threading
+from typing import Dict, Sequence, Tuple
+from cassandra.cluster import Session, PreparedStatement
+from constants.common import StatementKind
+from constants.schema_change_model import SchemaChangeModel
+from constants.schema_change_notifier import SchemaChangeNotifier
+
+
+class PreparedStatementCache:
+    def __init__(self: 'PreparedStatementCache', schema_change_notifier: SchemaChangeNotifier) -> None:
+        self.__statements: Dict[Tuple[str, str, str, Tuple[str, ...]], PreparedStatement] = {}
+        self.__lock = threading.Lock()
+        schema_change_notifier.add_listener(self.invalidate)
+
+
+    def get(self: 'PreparedStatementCache',
+            session: Session,
+            key_space: str,
+            table: str,
+            kind: StatementKind,
+            columns: Sequence[str],
+            query: str) -> PreparedStatement:
+        key = (key_space, table, kind.value, tuple(columns))
+        with self.__lock:
+            statement = self.__statements.get(key)
+        if statement is None:
+            statement = session.prepare(query)
+            with self.__lock:
+                self.__statements[key] = statement
+        return statement
+
+    def invalidate(self: 'PreparedStatementCache', schema_change: SchemaChangeModel) -> None:
+        with self.__lock:
+            if schema_change.keyspace is None:
+                self.__statements.clear()
+                return None
+            for key in list(self.__statements):
+                key_space, table, _, _ = key
+                if key_space == schema_change.keyspace and (schema_change.table is None or table == schema_change.table):
+                    del self.__statements[key]
+
+    def clear(self: 'PreparedStatementCache') -> None:
+        with self.__lock:
+            self.__statements.clear()
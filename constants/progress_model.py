@@ -0,0 +1,22 @@
+from typing import Optional
+from constants.model_wrapper import ModelWrapper
+
+
+class ProgressModel(ModelWrapper):
+    def __init__(self, rows_done: int = 0, total_rows: Optional[int] = None, rows_per_second: float = 0.0,
+                 error_count: int = 0, eta_seconds: Optional[float] = None, elapsed_seconds: float = 0.0) -> None:
+        super().__init__(
+            rows_done       = rows_done,
+            total_rows      = total_rows,
+            rows_per_second = rows_per_second,
+            error_count     = error_count,
+            eta_seconds     = eta_seconds,
+            elapsed_seconds = elapsed_seconds
+        )
+
+    def to_text(self) -> str:
+        rows_done = f"{self.rows_done}/{self.total_rows}" if self.total_rows else f"{self.rows_done}"
+        text = f"Rows: {rows_done} | {self.rows_per_second:.0f} rows/s | Errors: {self.error_count}"
+        if self.eta_seconds is not None:
+            text = f"{text} | ETA: {self.eta_seconds:.0f} s"
+        return text
@@ -0,0 +1,34 @@
+import time
+from typing import Optional
+from constants.common import PROGRESS_UPDATE_INTERVAL
+from constants.progress_model import ProgressModel
+
+
+class ProgressTracker:
+    def __init__(self: 'ProgressTracker',
+                 total_rows: Optional[int] = None,
+                 update_interval: float = PROGRESS_UPDATE_INTERVAL) -> None:
+        self.total_rows = total_rows
+        self.update_interval = update_interval
+        self.rows_done = 0
+        self.error_count = 0
+        self.start_time = time.monotonic()
+        self.last_update_time = self.start_time
+
+
+    def add(self: 'ProgressTracker', rows_done: int, error_count: int = 0) -> Optional[ProgressModel]:
+        self.rows_done += rows_done
+        self.error_count += error_count
+        now = time.monotonic()
+        if now - self.last_update_time < self.update_interval:
+            return None
+        self.last_update_time = now
+        return self.get_progress()
+
+    def get_progress(self: 'ProgressTracker') -> ProgressModel:
+        elapsed_seconds = time.monotonic() - self.start_time
+        rows_per_second = self.rows_done / elapsed_seconds if elapsed_seconds > 0 else 0.0
+        eta_seconds = None
+        if self.total_rows and rows_per_second > 0:
+            eta_seconds = max(self.total_rows - self.rows_done, 0) / rows_per_second
+        return ProgressModel(self.rows_done, self.total_rows, rows_per_second, self.error_count, eta_seconds, elapsed_seconds)
@@ -0,0 +1,20 @@
+from typing import Any, List, Optional
+from cassandra.cluster import Session
+from cassandra.query import Statement
+from constants.model_wrapper import ModelWrapper
+
+
+class QueryResultModel(ModelWrapper):
+    def __init__(self, query: str, rows: List[Any] = None, error_message: Optional[Exception] = None, elapsed_seconds: float = 0.0,
+                 session: Optional[Session] = None, statement: Optional[Statement] = None, paging_state: Optional[bytes] = None,
+                 column_names: Optional[List[str]] = None) -> None:
+        super().__init__(
+            query           = query,
+            rows            = rows if rows is not None else [],
+            error_message   = error_message,
+            elapsed_seconds = elapsed_seconds,
+            session         = session,
+            statement       = statement,
+            paging_state    = paging_state,
+            column_names    = column_names
+        )
@@ -0,0 +1,12 @@
+from typing import Any, List
+
+
+def remove_dashes(my_list: List[Any]) -> List[Any]:
+    return [item for item in my_list if not item.startswith('--')]
+
+def remove_empty_strings(my_list: List[Any]) -> List[Any]:
+    return [item.strip() for item in my_list if item.strip()]
+
+def split_queries(text: str) -> List[str]:
+    queries = remove_dashes(text.split('\n'))
+    return remove_empty_strings(' '.join(queries).split(';'))
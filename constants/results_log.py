@@ -0,0 +1,64 @@
+import os
+from collections import deque
+from typing import Optional, TextIO
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QPlainTextEdit
+from constants.common import RESULTS_LOG_MAX_LINES, RESULTS_LOG_FLUSH_INTERVAL_MS, RESULTS_LOG_FILE_PATH, RESULTS_LOG_FILE_ENV
+
+
+class ResultsLog:
+    def __init__(self: 'ResultsLog',
+                 plain_text_edit: QPlainTextEdit,
+                 max_lines: int = RESULTS_LOG_MAX_LINES,
+                 log_file_path: Optional[str] = None) -> None:
+        log_file_path = log_file_path or RESULTS_LOG_FILE_PATH or os.environ.get(RESULTS_LOG_FILE_ENV)
+        self.plain_text_edit = plain_text_edit
+        self.plain_text_edit.setMaximumBlockCount(max_lines)
+        self.pending_messages = deque(maxlen=max_lines)
+        self.log_file: Optional[TextIO] = open(log_file_path, "a", encoding="utf-8") if log_file_path else None
+        self.flush_timer = QTimer(self.plain_text_edit)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(RESULTS_LOG_FLUSH_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self.flush)
+
+
+    @classmethod
+    def for_widget(cls: 'ResultsLog', plain_text_edit: QPlainTextEdit) -> 'ResultsLog':
+        results_log = getattr(plain_text_edit, "results_log", None)
+        if results_log is None:
+            results_log = cls(plain_text_edit)
+            plain_text_edit.results_log = results_log
+        return results_log
+
+    @classmethod
+    def close_for_widget(cls: 'ResultsLog', plain_text_edit: QPlainTextEdit) -> None:
+        results_log = getattr(plain_text_edit, "results_log", None)
+        if results_log is not None:
+            results_log.close()
+
+    def append(self: 'ResultsLog', message: str) -> None:
+        self.pending_messages.append(message)
+        if self.log_file:
+            self.log_file.write(f"{message}\n")
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def flush(self: 'ResultsLog') -> None:
+        if self.log_file:
+            self.log_file.flush()
+        if not self.pending_messages:
+            return None
+        text = "\n".join(self.pending_messages)
+        self.pending_messages.clear()
+        self.plain_text_edit.appendPlainText(text)
+
+    def clear(self: 'ResultsLog') -> None:
+        self.pending_messages.clear()
+        self.plain_text_edit.clear()
+
+    def close(self: 'ResultsLog') -> None:
+        self.flush_timer.stop()
+        self.flush()
+        if self.log_file:
+            self.log_file.close()
+            self.log_file = None
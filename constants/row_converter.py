@@ -0,0 +1,106 @@
+import ast
+import decimal
+import uuid
+from collections.abc import Mapping
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Sequence, Union
+from cassandra.util import Time
+from constants.column_schema_model import ColumnSchemaModel
+
+
+def parse_bool(value: str) -> Union[bool, str]:
+    value_lower = value.lower()
+
+    if value_lower == 'false':
+        return False
+    elif value_lower == 'true':
+        return True
+    elif value.isdigit() and int(value) < 2:
+        return int(value) == 1
+    else:
+        return value
+
+def parse_timestamp(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        from dateutil import parser
+        return parser.parse(value)
+
+def parse_collection(value: str) -> Any:
+    if value.startswith('SortedSet(') and value.endswith(')'):
+        return set(ast.literal_eval(value[len('SortedSet('):-1]))
+    return ast.literal_eval(value)
+
+def parse_blob(value: str) -> bytes:
+    if value[:2].lower() == '0x':
+        return bytes.fromhex(value[2:])
+    return ast.literal_eval(value)
+
+
+VALUE_PARSERS: Dict[str, Callable[[str], Any]] = {
+    'boolean': parse_bool,
+    'double': float,
+    'float': float,
+    'int': int,
+    'bigint': int,
+    'varint': int,
+    'smallint': int,
+    'tinyint': int,
+    'counter': int,
+    'decimal': decimal.Decimal,
+    'blob': parse_blob,
+    'date': date.fromisoformat,
+    'timestamp': parse_timestamp,
+    'time': Time,
+    'list': parse_collection,
+    'set': parse_collection,
+    'map': parse_collection,
+    'tuple': parse_collection,
+    'vector': parse_collection,
+    'timeuuid': uuid.UUID,
+    'uuid': uuid.UUID
+}
+
+
+class RowConverter:
+    def __init__(self: 'RowConverter', columns: List[ColumnSchemaModel]) -> None:
+        self.converters: Dict[str, Callable[[Any], Any]] = {
+            column.column_name: self.compile_converter(column.type) for column in columns}
+
+
+    def get_base_type(self: 'RowConverter', column_type: str) -> str:
+        column_type = column_type.strip()
+        while column_type.startswith('frozen<'):
+            column_type = column_type[len('frozen<'):-1].strip()
+        return column_type.split('<')[0].strip()
+
+    def compile_converter(self: 'RowConverter', column_type: str) -> Callable[[Any], Any]:
+        parse = VALUE_PARSERS.get(self.get_base_type(column_type))
+        if parse is None:
+            return lambda value: value
+
+        def convert(value: Any) -> Any:
+            if not value or not isinstance(value, str):
+                return value
+            try:
+                return parse(value)
+            except (ValueError, SyntaxError, TypeError, ArithmeticError):
+                return value
+
+        return convert
+
+    def compile_row(self: 'RowConverter', column_names: Sequence[str]) -> Callable[[Sequence[Any]], List[Any]]:
+        unknown_columns = [column_name for column_name in column_names if column_name not in self.converters]
+        if unknown_columns:
+            raise ValueError(f"Unknown columns: {', '.join(unknown_columns)}")
+        converters = [(index, self.converters[column_name]) for index, column_name in enumerate(column_names)]
+        return lambda row: [convert(row[index]) for index, convert in converters]
+
+    def convert_value(self: 'RowConverter', column_name: str, value: Any) -> Any:
+        convert = self.converters.get(column_name)
+        return convert(value) if convert else value
+
+    def convert_row(self: 'RowConverter', row: Mapping) -> List[Any]:
+        converters = self.converters
+        return [converters[column](value) for column, value in row.items() if column in converters]
@@ -0,0 +1,88 @@
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple
+from cassandra.cluster import Session
+from constants.common import SCHEMA_CACHE_FORMAT_VERSION, SCHEMA_CACHE_PATH
+from constants.column_schema_model import ColumnSchemaModel
+from constants.index_schema_model import IndexSchemaModel
+
+TableEntry = Tuple[List[ColumnSchemaModel], List[IndexSchemaModel]]
+
+
+def get_schema_cache_path(cluster_name: str) -> str:
+    file_name = re.sub(r"[^\w.-]", "_", cluster_name)
+    return os.path.join(SCHEMA_CACHE_PATH, f"{file_name}.json")
+
+def create_index_schema(key_space: str, table: str, index_name: str, options: Dict[str, str]) -> IndexSchemaModel:
+    return IndexSchemaModel(index_name, f"CREATE INDEX {index_name} ON {key_space}.{table} ({options.get('target')});")
+
+
+class SchemaCache:
+    def __init__(self: 'SchemaCache',
+                 cluster_name: str,
+                 schema_version: Optional[str],
+                 key_spaces: Dict[str, Dict[str, TableEntry]]) -> None:
+        self.cluster_name = cluster_name
+        self.schema_version = schema_version
+        self.key_spaces = key_spaces
+
+
+    @classmethod
+    def load(cls: 'SchemaCache', cluster_name: str) -> Optional['SchemaCache']:
+        try:
+            with open(get_schema_cache_path(cluster_name), encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if data.get("format_version") != SCHEMA_CACHE_FORMAT_VERSION or data.get("cluster_name") != cluster_name:
+            return None
+        key_spaces = {key_space: {table: ([ColumnSchemaModel(**column) for column in entry["columns"]],
+                                          [IndexSchemaModel(**index) for index in entry["indexes"]])
+                                  for table, entry in tables.items()}
+                      for key_space, tables in data["key_spaces"].items()}
+        return cls(cluster_name, data.get("schema_version"), key_spaces)
+
+    @classmethod
+    def fetch(cls: 'SchemaCache', session: Session, cluster_name: str, schema_version: Optional[str]) -> 'SchemaCache':
+        key_spaces: Dict[str, Dict[str, TableEntry]] = {
+            row.keyspace_name: {} for row in session.execute("SELECT keyspace_name FROM system_schema.keyspaces")}
+        for row in session.execute("SELECT keyspace_name, table_name FROM system_schema.tables"):
+            key_spaces.setdefault(row.keyspace_name, {})[row.table_name] = ([], [])
+
+        # NOTE system_schema.columns also holds materialized view columns, those are skipped.
+        for row in session.execute(
+                "SELECT keyspace_name, table_name, column_name, clustering_order, kind, position, type FROM system_schema.columns"):
+            entry = key_spaces.get(row.keyspace_name, {}).get(row.table_name)
+            if entry is not None:
+                entry[0].append(ColumnSchemaModel(row.column_name, row.type, row.kind, row.position, row.clustering_order))
+        for row in session.execute("SELECT keyspace_name, table_name, index_name, options FROM system_schema.indexes"):
+            entry = key_spaces.get(row.keyspace_name, {}).get(row.table_name)
+            if entry is not None:
+                entry[1].append(create_index_schema(row.keyspace_name, row.table_name, row.index_name, row.options))
+        return cls(cluster_name, schema_version, key_spaces)
+
+    def save(self: 'SchemaCache') -> None:
+        data: Dict[str, Any] = {
+            "format_version": SCHEMA_CACHE_FORMAT_VERSION,
+            "cluster_name": self.cluster_name,
+            "schema_version": self.schema_version,
+            "key_spaces": {key_space: {table: {"columns": columns, "indexes": indexes}
+                                       for table, (columns, indexes) in tables.items()}
+                           for key_space, tables in self.key_spaces.items()}
+        }
+        cache_path = get_schema_cache_path(self.cluster_name)
+        os.makedirs(SCHEMA_CACHE_PATH, exist_ok=True)
+        temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(temporary_path, cache_path)
+
+    def get_key_space_names(self: 'SchemaCache') -> List[str]:
+        return sorted(self.key_spaces)
+
+    def get_table_names(self: 'SchemaCache', key_space: str) -> List[str]:
+        return sorted(self.key_spaces.get(key_space, {}))
+
+    def get_table(self: 'SchemaCache', key_space: str, table: str) -> Optional[TableEntry]:
+        return self.key_spaces.get(key_space, {}).get(table)
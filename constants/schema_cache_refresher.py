@@ -0,0 +1,107 @@
+import logging
+import threading
+from typing import Callable, List, Optional
+from cassandra.cluster import Cluster, Session
+from constants.common import SCHEMA_VERSION_POLL_INTERVAL, SCHEMA_CACHE_RETRY_BASE_DELAY, SCHEMA_CACHE_RETRY_MAX_DELAY
+from constants.schema_cache import SchemaCache
+from constants.schema_change_model import SchemaChangeModel
+from constants.schema_change_notifier import SchemaChangeNotifier
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaCacheRefresher:
+    def __init__(self: 'SchemaCacheRefresher',
+                 cluster: Cluster,
+                 session: Session,
+                 schema_change_notifier: SchemaChangeNotifier,
+                 poll_interval: float = SCHEMA_VERSION_POLL_INTERVAL) -> None:
+        self.session = session
+        self.schema_change_notifier = schema_change_notifier
+        self.poll_interval = poll_interval
+        self.cluster_name = cluster.metadata.cluster_name or ""
+        self.schema_cache: Optional[SchemaCache] = SchemaCache.load(self.cluster_name)
+        self.is_schema_cache_saved = True
+        self.error_message: Optional[str] = None
+        self.error_listeners: List[Callable[[Optional[str]], None]] = []
+        self.failures_count = 0
+        self.is_forced = False
+        self.lock = threading.Lock()
+        self.wake_event = threading.Event()
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+
+    def run(self: 'SchemaCacheRefresher') -> None:
+        while not self.stop_event.is_set():
+            is_forced, self.is_forced = self.is_forced, False
+            try:
+                self.check_schema_version(is_forced)
+            except Exception as error_message:
+                self.failures_count += 1
+                logger.warning("Schema cache refresh of '%s' failed (attempt %d): %s",
+                               self.cluster_name, self.failures_count, error_message)
+                self.set_error_message(str(error_message) or type(error_message).__name__)
+            else:
+                self.failures_count = 0
+                self.set_error_message(None)
+            self.wake_event.wait(self.get_delay())
+            self.wake_event.clear()
+
+    def get_delay(self: 'SchemaCacheRefresher') -> float:
+        if not self.failures_count:
+            return self.poll_interval
+        return min(SCHEMA_CACHE_RETRY_BASE_DELAY * 2 ** (self.failures_count - 1), SCHEMA_CACHE_RETRY_MAX_DELAY)
+
+    def check_schema_version(self: 'SchemaCacheRefresher', is_forced: bool = False) -> None:
+        schema_version = str(self.session.execute("SELECT schema_version FROM system.local").one().schema_version)
+        if not is_forced and self.schema_cache and self.schema_cache.schema_version == schema_version:
+            if not self.is_schema_cache_saved:
+                self.save_schema_cache()
+            return None
+        schema_cache = SchemaCache.fetch(self.session, self.cluster_name, schema_version)
+        if self.stop_event.is_set():
+            return None
+        self.schema_cache, self.is_schema_cache_saved = schema_cache, False
+        self.schema_change_notifier.notify(SchemaChangeModel())
+        self.save_schema_cache()
+
+    def save_schema_cache(self: 'SchemaCacheRefresher') -> None:
+        try:
+            self.schema_cache.save()
+        except OSError as error_message:
+            raise Exception(f"The schema cache could not be saved: {error_message}")
+        self.is_schema_cache_saved = True
+
+    def set_error_message(self: 'SchemaCacheRefresher', error_message: Optional[str]) -> None:
+        with self.lock:
+            if error_message == self.error_message:
+                return None
+            self.error_message = error_message
+            listeners = list(self.error_listeners)
+        for listener in listeners:
+            try:
+                listener(error_message)
+            except Exception:
+                logger.exception("Schema cache error listener failed")
+
+    def add_error_listener(self: 'SchemaCacheRefresher', listener: Callable[[Optional[str]], None]) -> None:
+        with self.lock:
+            self.error_listeners.append(listener)
+            error_message = self.error_message
+        if error_message:
+            listener(error_message)
+
+    def remove_error_listener(self: 'SchemaCacheRefresher', listener: Callable[[Optional[str]], None]) -> None:
+        with self.lock:
+            if listener in self.error_listeners:
+                self.error_listeners.remove(listener)
+
+    def refresh(self: 'SchemaCacheRefresher', is_forced: bool = False) -> None:
+        self.is_forced = self.is_forced or is_forced
+        self.wake_event.set()
+
+    def stop(self: 'SchemaCacheRefresher') -> None:
+        self.stop_event.set()
+        self.wake_event.set()
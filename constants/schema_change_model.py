@@ -0,0 +1,13 @@
+from typing import Optional
+from constants.model_wrapper import ModelWrapper
+
+
+class SchemaChangeModel(ModelWrapper):
+    def __init__(self, target_type: Optional[str] = None, change_type: Optional[str] = None,
+                 keyspace: Optional[str] = None, table: Optional[str] = None) -> None:
+        super().__init__(
+            target_type = target_type,
+            change_type = change_type,
+            keyspace    = keyspace,
+            table       = table
+        )
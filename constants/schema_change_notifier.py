@@ -0,0 +1,42 @@
+import logging
+from typing import Any, Callable, List
+from cassandra.cluster import Cluster
+from constants.schema_change_model import SchemaChangeModel
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaChangeNotifier:
+    def __init__(self: 'SchemaChangeNotifier', cluster: Cluster) -> None:
+        self.cluster = cluster
+        self.listeners: List[Callable[[SchemaChangeModel], None]] = []
+        self.__wrap_metadata_refresh()
+
+
+    # Private
+    def __wrap_metadata_refresh(self: 'SchemaChangeNotifier') -> None:
+        # NOTE The driver has no public schema listener. Every schema refresh (pushed SCHEMA_CHANGE
+        #      events as well as responses to our own DDL) goes through Metadata.refresh, so it is wrapped.
+        metadata = self.cluster.metadata
+        refresh = metadata.refresh
+
+        def refresh_and_notify(connection: Any, timeout: float, target_type: str = None, change_type: str = None, **kwargs: Any) -> None:
+            refresh(connection, timeout, target_type=target_type, change_type=change_type, **kwargs)
+            self.notify(SchemaChangeModel(target_type, change_type, kwargs.get("keyspace"), kwargs.get("table")))
+
+        metadata.refresh = refresh_and_notify
+
+    # Public
+    def add_listener(self: 'SchemaChangeNotifier', listener: Callable[[SchemaChangeModel], None]) -> None:
+        self.listeners.append(listener)
+
+    def remove_listener(self: 'SchemaChangeNotifier', listener: Callable[[SchemaChangeModel], None]) -> None:
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def notify(self: 'SchemaChangeNotifier', schema_change: SchemaChangeModel) -> None:
+        for listener in list(self.listeners):
+            try:
+                listener(schema_change)
+            except Exception:
+                logger.exception("Schema change listener failed for %s", schema_change)
@@ -1,5 +1,6 @@
 from constants.common import ErrorTitles, RESULT_STATISTICS, SUCCESS
-from constants.highlight_text import highlight_text
+from constants.highlight_text import install_highlighter
+from constants.results_log import ResultsLog
 from PyQt6.QtWidgets import QPlainTextEdit
 
 
@@ -10,13 +11,14 @@ class ShowResultUtils:
                  result_statistics_plain_text_edit: QPlainTextEdit) -> None:
         self.results_plain_text_edit = results_plain_text_edit
         self.result_statistics_plain_text_edit = result_statistics_plain_text_edit
+        self.results_log = ResultsLog.for_widget(self.results_plain_text_edit)
+        install_highlighter(self.results_plain_text_edit, {ErrorTitles.Failed.value: "red"})
+        install_highlighter(self.result_statistics_plain_text_edit, {ErrorTitles.Failed.value: "red", SUCCESS: "green"})
 
 
     def show_result(self: 'ShowResultUtils', message: str) -> None:
-        current_text = self.results_plain_text_edit.toPlainText()
         if message:
-            self.results_plain_text_edit.setPlainText(f"{current_text}\n{message}\n")
-        highlight_text(self.results_plain_text_edit, ErrorTitles.Failed.value)
+            self.results_log.append(message)
 
     def show_result_statistics(self: 'ShowResultUtils', added_rows_count: int, error_count: int) -> None:
         result_statistics = f"{RESULT_STATISTICS} Added rows: {added_rows_count}"
@@ -24,13 +26,11 @@ class ShowResultUtils:
         if error_count > 0:
             result_statistics = f"{result_statistics} {ErrorTitles.Failed.value} {error_count}"
             self.result_statistics_plain_text_edit.setPlainText(result_statistics)
-            highlight_text(self.result_statistics_plain_text_edit, ErrorTitles.Failed.value)
 
     def show_success(self: 'ShowResultUtils') -> None:
         result_statistics = f"{RESULT_STATISTICS} {SUCCESS}"
         self.result_statistics_plain_text_edit.setPlainText(result_statistics)
-        highlight_text(self.result_statistics_plain_text_edit, SUCCESS, color="green")
 
     def clear_results(self: 'ShowResultUtils') -> None:
-        self.results_plain_text_edit.setPlainText("")
+        self.results_log.clear()
         self.result_statistics_plain_text_edit.setPlainText(RESULT_STATISTICS)
@@ -0,0 +1,28 @@
+import sys
+import time
+from typing import List, Tuple
+
+
+class StartupProfiler:
+    def __init__(self: 'StartupProfiler', is_enabled: bool = False) -> None:
+        self.is_enabled = is_enabled
+        self.start_time = time.perf_counter()
+        self.start_modules_count = len(sys.modules)
+        self.marks: List[Tuple[str, float, int]] = []
+
+
+    def mark(self: 'StartupProfiler', name: str) -> None:
+        if self.is_enabled:
+            self.marks.append((name, time.perf_counter(), len(sys.modules)))
+
+    def to_text(self: 'StartupProfiler') -> str:
+        lines = []
+        previous_time, previous_modules_count = self.start_time, self.start_modules_count
+        for name, mark_time, modules_count in self.marks:
+            lines.append(f"{name:<28} {(mark_time - self.start_time) * 1000:8.1f} ms"
+                         f"  (+{(mark_time - previous_time) * 1000:.1f} ms, +{modules_count - previous_modules_count} modules)")
+            previous_time, previous_modules_count = mark_time, modules_count
+        return "\n".join(lines)
+
+    def report(self: 'StartupProfiler') -> None:
+        print(self.to_text(), file=sys.stderr)
@@ -0,0 +1,62 @@
+import glob
+import importlib.util
+import os
+import sys
+from typing import Dict
+from PyQt6.QtWidgets import QWidget
+from constants.common import FRONTEND_PATH, UI_CACHE_PATH
+
+ui_classes: Dict[str, type] = {}
+
+
+def get_compiled_ui_path(ui_path: str) -> str:
+    name = os.path.splitext(os.path.basename(ui_path))[0]
+    return os.path.join(UI_CACHE_PATH, f"ui_{name}.py")
+
+def is_compiled_ui_current(ui_path: str, compiled_path: str) -> bool:
+    return os.path.exists(compiled_path) and os.path.getmtime(compiled_path) >= os.path.getmtime(ui_path)
+
+def compile_ui(ui_path: str) -> str:
+    from PyQt6 import uic
+    compiled_path = get_compiled_ui_path(ui_path)
+    os.makedirs(UI_CACHE_PATH, exist_ok=True)
+    temporary_path = f"{compiled_path}.{os.getpid()}.tmp"
+    with open(temporary_path, "w", encoding="utf-8") as file:
+        uic.compileUi(ui_path, file)
+    os.replace(temporary_path, compiled_path)
+    return compiled_path
+
+def compile_all_ui(is_forced: bool = False) -> None:
+    for ui_path in sorted(glob.glob(os.path.join(FRONTEND_PATH, "*.ui"))):
+        if is_forced or not is_compiled_ui_current(ui_path, get_compiled_ui_path(ui_path)):
+            print(f"{os.path.basename(ui_path)} -> {os.path.relpath(compile_ui(ui_path), FRONTEND_PATH)}")
+
+def get_ui_class(ui_path: str) -> type:
+    if ui_path in ui_classes:
+        return ui_classes[ui_path]
+    compiled_path = get_compiled_ui_path(ui_path)
+    if not is_compiled_ui_current(ui_path, compiled_path):
+        compiled_path = compile_ui(ui_path)
+    name = os.path.splitext(os.path.basename(compiled_path))[0]
+    spec = importlib.util.spec_from_file_location(name, compiled_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    ui_classes[ui_path] = next(value for key, value in vars(module).items() if key.startswith("Ui_"))
+    return ui_classes[ui_path]
+
+def load_ui(ui_path: str, base_instance: QWidget) -> None:
+    try:
+        ui_class = get_ui_class(ui_path)
+    except Exception:
+        # NOTE Read-only installations without a prebuilt cache fall back to parsing the XML.
+        from PyQt6 import uic
+        uic.loadUi(ui_path, base_instance)
+        return None
+    ui = ui_class()
+    ui.setupUi(base_instance)
+    for name, value in vars(ui).items():
+        setattr(base_instance, name, value)
+
+
+if __name__ == "__main__":
+    compile_all_ui(is_forced="--force" in sys.argv)
@@ -1,4 +1,4 @@
-from typing import Any, Callable, List
+from typing import Any, Callable
 from PyQt6.QtWidgets import QMessageBox, QDialog, QWidget
 from PyQt6.QtCore import QModelIndex
 from constants.common import ErrorTitles
@@ -12,6 +12,13 @@ def pop_up_error(error_title: ErrorTitles, message: str) -> None:
         f"{ErrorTitles.Error.value}: {message}",
     )
 
+def pop_up_warning(warning_title: ErrorTitles, message: str) -> None:
+    QMessageBox.warning(
+        None,
+        warning_title,
+        message,
+    )
+
 def pop_up_confirmation_dialog(parent: QWidget,
                                confirmation_message: str,
                                function_to_execute: Callable[..., Any],
@@ -25,10 +32,4 @@ def pop_up_confirmation_dialog(parent: QWidget,
 def get_root_parent(index: QModelIndex) -> QModelIndex:
     while index.parent() is not None:
         index = index.parent()
-    return index
-
-def remove_dashes(my_list: List[Any]) -> List[Any]:
-    return [item for item in my_list if not item.startswith('--')]
-
-def remove_empty_strings(my_list: List[Any]) -> List[Any]:
-    return [item.strip() for item in my_list if item.strip()]
\ No newline at end of file
+    return index
\ No newline at end of file
@@ -1,18 +1,41 @@
 import os
 import sys
-from PyQt6 import QtGui
-from PyQt6.QtWidgets import QApplication
-from backend.connection_profiles.authentication_window import AuthenticationWindow
+import multiprocessing
+from typing import TYPE_CHECKING
+from constants.startup_profiler import StartupProfiler
+
+if TYPE_CHECKING:
+    from PyQt6.QtWidgets import QApplication
 
 basedir = os.path.dirname(__file__)
 
 
 def main() -> None:
+    # NOTE Qt and the windows are imported here so --profile-startup can time them
+    #      and spawned import workers don't load them.
+    startup_profiler = StartupProfiler(is_enabled="--profile-startup" in sys.argv)
+    from PyQt6 import QtGui
+    from PyQt6.QtCore import QTimer
+    from PyQt6.QtWidgets import QApplication
+    startup_profiler.mark("PyQt6 imported")
+    from backend.connection_profiles.authentication_window import AuthenticationWindow
+    startup_profiler.mark("Application imported")
+
     app = QApplication(sys.argv)
     app.setWindowIcon(QtGui.QIcon(os.path.join(basedir, 'casstl.ico')))
+    startup_profiler.mark("QApplication created")
     authentication_window = AuthenticationWindow()
     authentication_window.authenticate()
+    startup_profiler.mark("First window shown")
+    if startup_profiler.is_enabled:
+        QTimer.singleShot(0, lambda: finish_startup_profiling(startup_profiler, app))
     sys.exit(app.exec())
 
+def finish_startup_profiling(startup_profiler: StartupProfiler, app: 'QApplication') -> None:
+    startup_profiler.mark("Event loop running")
+    startup_profiler.report()
+    app.quit()
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    multiprocessing.freeze_support()
+    main()